@@ -26,27 +26,11 @@ SOFTWARE.
 
 from __future__ import print_function
 
-import os
-import sys
-
-from PySide2.QtWidgets import QApplication
-
 from app_py.configs import config_obj
-from app_py.configs import test_block
-from app_py.editor import Editor as EditorObj
-from app_py.viewer import Viewer as ViewerObj
-from app_py.utilities import nodeUtils
-from app_py.main import Main
-from app_py.utilities import logUtils
-
-log_file = os.path.join(config_obj.get("PATHS", "log_path"),
-                        config_obj.get("DETAILS", "language"),
-                        "{}.log".format(logUtils.timeStamp(), config_obj.get("DETAILS", "language"))
-                        )
-
-LOG = logUtils.getLogger(log_file)
-logUtils.setLogLevel()
-LOG.info("Starting...")
+from core import Main
+from core import NodeDummy
+from core import ResultObj
+from core import setLanguage
 
 
 def setStrict(val=None):
@@ -95,217 +79,118 @@ def setPropagate(val=None):
     print("Datablock propagation set to:", val)
 
 
-def setLanguage(lang_str=None):
+def setIncremental(val=None):
     """
-    Use this to change the language to operate with beside Python.
-    Also runs ``setup()`` once again to affect changes.
+    Sets incremental runs on or off.
+    Nodes with the same inputs and module source as a previous run replay their stored results.
 
     **parameters**, **types**, **return** and **return types**
 
-    :param lang_str: the language to be used. Valid: py, jsx, lua.
-    :type lang_str: str
+    :param val: Sets incremental runs on or off.
+    :type val: str
 
-    # >>> nagare.setLanguage("jsx")
+    # >>> nagare.setIncremental("1")
 
     """
 
-    if lang_str is None:
-        lang_str = "py"
+    if val is None:
+        val = "1"
 
-    config_obj.set("DETAILS", "language", lang_str)
+    if val not in ("0", "1"):
+        raise ValueError('DETAILS incremental should be string "0" or "1".')
 
-    modules_path = os.path.join(config_obj.get("PATHS", "root"),
-                                "modules",
-                                config_obj.get("DETAILS", "language"))
-    config_obj.set("PATHS", [os.path.abspath(modules_path)])
+    config_obj.set("DETAILS", "incremental", str(val))
+    print("Incremental runs set to:", val)
 
 
-class Editor(EditorObj):
+def setExecutor(val=None, workers=None):
     """
-    Runs the editor, used for authoring graphs.
+    Sets how sibling branches are ran when datablock propagation is off.
 
     **parameters**, **types**, **return** and **return types**
 
-    :param software: the platform to be ran. Example: maya, ae, max.
-    :type software: str
+    :param val: The executor to use. Valid: serial, thread, process.
+    :type val: str
 
-    :param language: the language to be used. Valid: py, jsx, lua.
-    :type language: str
+    :param workers: Number of workers, 0 uses the CPU count.
+    :type workers: int
 
-    :param datablock: Serializable datablock (ideally).
-    :type datablock: dict
-
-    # >>> nagare.Editor("maya", "py", datablock_dict)
-    # >>> nagare.Editor("max", "py", self.data)
-    # >>> nagare.Editor("ae", "jsx", datablock)
-    # >>> nagare.Editor("fusion", "lua", datablock)
+    # >>> nagare.setExecutor("thread", 8)
 
     """
 
-    def __init__(self,
-                 software=None,
-                 language=None,
-                 graph_file=None,
-                 datablock=None):
-
-        if software is None:
-            software = "generic"
-
-        if language is None:
-            language = config_obj.get("DETAILS", "language")
-
-        if graph_file is None:
-            graph_file = config_obj.get("PATHS", "default_json")
-
-        if datablock is None:
-            datablock = test_block
-
-        if language != config_obj.get("DETAILS", "language"):
-            setLanguage(language)
+    if val is None:
+        val = "serial"
 
-        self._app = None
-        if not QApplication.instance():
-            self._app = QApplication(sys.argv)
-        else:
-            self._app = QApplication.instance()
+    if workers is None:
+        workers = 0
 
-        super(Editor, self).__init__(software,
-                                     language,
-                                     graph_file,
-                                     datablock)
-        self.ui.show()
-        print("Editor", software, language, graph_file)
+    if val not in ("serial", "thread", "process"):
+        raise ValueError('DETAILS executor should be "serial", "thread" or "process".')
 
-        self._app.exec_()
-        # del self._app
-        sys.exit(0)
+    config_obj.set("DETAILS", "executor", str(val))
+    config_obj.set("DETAILS", "workers", str(workers))
+    print("Executor set to:", val, workers)
 
 
-class Player(Main):
+class _LazyGui(object):
     """
-    Runs the player. Used for running graphs in Python env.
-    Inherits Main, calls Viewer.
-
-    **parameters**, **types**, **return** and **return types**
-
-    :param json_file: Full path of JSON file.
-    :type json_file: str
-
-    :param datablock: Serializable datablock (ideally).
-    :type datablock: dict
-
-    # >>> nagare.Player(r"C:\tests\test_graph.json", datablock)
-    # >>> nagare.Player(self.json_graph, self.datablock)
-
+    Base of Editor, Player and Viewer, Qt (gui) is imported when the first one is made.
+    Instances are of a subclass of both the class called and the gui class,
+    so subclassing and isinstance work for both.
     """
 
-    def __init__(self, json_file=None, datablock=None):
-        if json_file is None:
-            json_file = config_obj.get("PATHS", "default_json")
-
-        if datablock is None:
-            datablock = test_block
+    _gui_name = None
+    _gui_types = dict()
 
-        self._app = None
-        if not QApplication.instance():
-            self._app = QApplication(sys.argv)
-        else:
-            self._app = QApplication.instance()
+    def __new__(cls, *args, **kwargs):
+        _type = _LazyGui._gui_types.get(cls)
 
-        super(Player, self).__init__()
+        if _type is None:
+            import gui
+            _gui_class = getattr(gui, cls._gui_name)
 
-        self.strict = int(config_obj.get("DETAILS", "strict"))
-        self.propagate = int(config_obj.get("DETAILS", "propagate"))
+            if issubclass(cls, _gui_class):
+                _type = cls
+            else:
+                _type = type(cls.__name__, (cls, _gui_class), {"__module__": cls.__module__})
 
-        _copy_block = datablock.copy()
-        self.player = ViewerObj(json_file)
-        self.player.setWindowTitle(config_obj.get("DETAILS", "player_title"))
-        self.player.log_btn.clicked.connect(self._openLog)
-        self.player.scene.setMode("player")
+            _LazyGui._gui_types[cls] = _type
 
-        self.runJson(json_file, _copy_block)
-        nodeUtils.postProcessNodes(self.player.scene, self.nodes_all)
+        return super(_LazyGui, cls).__new__(_type)
 
-        self.player.refresh()
-        # self.player.scene.update()
-        self.player.feedback("Ran: {}".format(json_file))
 
-        self._app.exec_()
-        # del self._app
-        sys.exit(0)
+class Editor(_LazyGui):
+    """
+    Runs the editor, used for authoring graphs.
+    Qt is imported on the first call, see gui.Editor.
 
-    def _openLog(self):
-        """
-        Opens the log.txt file if self.log_file is a valid file in drive.
-        """
+    # >>> nagare.Editor("maya", "py", datablock_dict)
+    """
 
-        if os.path.isfile(self.log_file):
-            if sys.platform == "win32":
-                os.startfile(self.log_file)
-            else:
-                from subprocess import call as _sub_call
-                _sub_call(["open", self.log_file])
+    _gui_name = "Editor"
 
-            self.player.feedback("Opening log: {}".format(self.log_file))
-        else:
-            self.player.feedback("Log not found: {}".format(self.log_file))
 
+class Player(_LazyGui):
+    """
+    Runs a graph and shows the results.
+    Qt is imported on the first call, see gui.Player.
 
-class Viewer(Main):
+    # >>> nagare.Player(r"C:\tests\test_graph.json", datablock)
     """
-    Runs the Viewer.
-    Inherits app_py, calls Viewer.
-    Used only for displaying results from non-python apps.
 
-    **parameters**, **types**, **return** and **return types**
+    _gui_name = "Player"
 
-    :param graph_json: Full path of JSON graph that was just ran.
-    :type graph_json: str
 
-    :param score_json: Full path of JSON score extracted from graph_json.
-    :type score_json: str
+class Viewer(_LazyGui):
+    """
+    Displays results from non-python apps.
+    Qt is imported on the first call, see gui.Viewer.
 
     # >>> nagare.Viewer(r"C:\graphs\ae_build.json", r"C:\score.json")
-
     """
 
-    def __init__(self, graph_json, score_json):
-        for _json_file in (graph_json, score_json):
-            if not os.path.exists(_json_file):
-                raise IOError("Not found: {}".format(_json_file))
-
-        self._app = None
-        if not QApplication.instance():
-            self._app = QApplication(sys.argv)
-        else:
-            self._app = QApplication.instance()
-
-        super(Viewer, self).__init__()
-
-        self.player = ViewerObj(graph_json)
-        _score_data = self.getDataFromJson(score_json)
-
-        for _score in _score_data:
-            _node_obj = nodeUtils.getObject(_score, self.player.scene)
-
-            if not _node_obj:
-                raise RuntimeError("Failed to find node pointer:",
-                                   _score["name"],
-                                   _score["uuid"])
-
-            _msg = "\n".join(_score["messages"])
-            _node_obj.setErrors(_score.get("errors", list()))
-
-            if _score["error"]:
-                _node_obj.setDirty(state="error", message=_msg)
-            elif _score["skip"]:
-                _node_obj.setDirty(state="skip", message=_msg)
-            else:
-                _node_obj.setDirty()
-
-        self._app.exec_()
-        # del self._app
-        sys.exit(0)
+    _gui_name = "Viewer"
 
 
 if __name__ == "__main__":
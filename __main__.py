@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Command line entry point, Qt is only imported for --view.
+
+- Example::
+
+    python -m nagare run C:/graphs/check.json --datablock C:/tmp/block.json --score C:/tmp/score.json
+    python -m nagare batch C:/graphs/check.json C:/assets/blocks.jsonl -o C:/tmp/scores.jsonl -w 8
+    python -m nagare convert C:/graphs --backup .v1
+    python -m nagare export C:/graphs/check.ngb C:/tmp/check.json
+    python -m nagare trace C:/graphs/check.json C:/tmp/score.json -o C:/tmp/trace.json
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+
+
+def getParser():
+    _parser = argparse.ArgumentParser(prog="nagare", description="Runs nagare graphs without the editor.")
+    _commands = _parser.add_subparsers(dest="command")
+
+    _run = _commands.add_parser("run", help="Runs a graph with one datablock.")
+    _run.add_argument("graph", help="JSON graph file.")
+    _run.add_argument("-d", "--datablock", default=None, help="JSON file with the datablock, defaults to the test block.")
+    _run.add_argument("-s", "--score", default=None, help="Score file to write (.json or .ngb), readable by nagare.Viewer.")
+    _run.add_argument("-e", "--executor", default=None, choices=("serial", "thread", "process"))
+    _run.add_argument("-w", "--workers", type=int, default=None, help="Number of workers, 0 uses the CPU count.")
+    _run.add_argument("--strict", action="store_true", default=None, help="Stop on the first error.")
+    _run.add_argument("--no-strict", dest="strict", action="store_false", default=None,
+                      help="Keep going after errors, overrides the config.")
+    _run.add_argument("--propagate", action="store_true", default=None, help="Share one datablock across the graph.")
+    _run.add_argument("--no-propagate", dest="propagate", action="store_false", default=None,
+                      help="Give each node its own copy of the datablock, overrides the config.")
+    _run.add_argument("--profile", default=None, choices=("off", "time", "memory"),
+                      help="Per node metrics written to the score, defaults to the config or time.")
+    _run.add_argument("--trace", default=None, help="Chrome trace JSON to write, for chrome://tracing or Perfetto.")
+    _run.add_argument("--writes", action="store_true", default=None,
+                      help="Record the datablock keys each node writes, always on with --trace.")
+    _run.add_argument("--view", action="store_true", help="Show the results in the viewer (needs Qt).")
+
+    _commands.add_parser("batch", help="Runs a graph over many datablocks, see app_py.batchRun.", add_help=False)
+
+    _convert = _commands.add_parser("convert", help="Converts graph files between the nested (1) and flat (2) formats.")
+    _convert.add_argument("path", help="A graph file or a folder of graphs, searched recursively.")
+    _convert.add_argument("--to", type=int, default=2, choices=(1, 2), help="Format to write.")
+    _convert.add_argument("--backup", default=None, help="Keep the originals with this extension, like .v1")
+    _convert.add_argument("--dry-run", action="store_true", help="Only list the files to convert.")
+
+    _export = _commands.add_parser("export", help="Copies a graph or score file to another format, chosen by extension.")
+    _export.add_argument("source", help="File to read, JSON or binary.")
+    _export.add_argument("target", help="File to write, .json (indented) or .ngb (binary).")
+
+    _trace = _commands.add_parser("trace", help="Writes a Chrome trace of a score, for chrome://tracing or Perfetto.")
+    _trace.add_argument("graph", help="JSON graph file that ran.")
+    _trace.add_argument("score", help="Score file (.json or .ngb), or the JSONL scores of a batch.")
+    _trace.add_argument("-o", "--output", required=True, help="Trace JSON file to write.")
+    return _parser
+
+
+def run(args):
+    """
+    Runs the "run" command, returns 1 if any node failed.
+    """
+
+    from nagare import core
+    from nagare.app_py.utilities import binUtils
+    from nagare.app_py import traceExport
+
+    _block = None
+    if args.datablock:
+        with open(args.datablock) as _block_file:
+            _block = json.load(_block_file)
+
+    _recorder = traceExport.TraceRecorder() if args.trace else None
+
+    _spawn = core.run(args.graph,
+                      _block,
+                      strict=args.strict,
+                      propagate=args.propagate,
+                      executor=args.executor,
+                      workers=args.workers,
+                      profile=args.profile,
+                      subscribers=[_recorder] if _recorder else None,
+                      track_writes=True if _recorder else args.writes)
+
+    if _recorder:
+        _recorder.write(args.trace, _spawn.plan)
+        print("Trace: {}".format(args.trace))
+
+    _score = _spawn.getScore()
+    for _node in _score:
+        _state = "error" if _node["error"] else "skip" if _node["skip"] else "success"
+        print("{}: {}".format(_node["name"], _state))
+
+    _score_path = args.score
+    if _score_path is None and args.view:
+        _score_path = os.path.join(tempfile.gettempdir(), "nagare_score.json")
+
+    if _score_path:
+        binUtils.writeData(_score_path, _score)
+
+    if args.view:
+        import nagare
+        nagare.Viewer(args.graph, _score_path)
+
+    return 1 if [_node for _node in _score if _node["error"]] else 0
+
+
+def convert(args):
+    """
+    Runs the "convert" command.
+    """
+
+    from nagare.app_py.utilities import graphUtils
+
+    _converted = graphUtils.convertGraphs(args.path, args.to, args.backup, args.dry_run)
+    for _path in _converted:
+        print(_path)
+
+    print("{} graph(s) {} to version {}".format(len(_converted),
+                                                "to convert" if args.dry_run else "converted",
+                                                args.to))
+    return 0
+
+
+def export(args):
+    """
+    Runs the "export" command.
+    """
+
+    from nagare.app_py.utilities import binUtils
+
+    binUtils.writeData(args.target, binUtils.readData(args.source))
+    print("Exported: {}".format(args.target))
+    return 0
+
+
+def trace(args):
+    """
+    Runs the "trace" command.
+    """
+
+    from nagare.app_py import traceExport
+
+    _count = traceExport.exportScore(args.graph, args.score, args.output)
+    print("Trace: {} ({} events)".format(args.output, _count))
+    return 0
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # batch has its own options
+    if argv and argv[0] == "batch":
+        from nagare.app_py import batchRun
+        return batchRun.main(argv[1:])
+
+    _args = getParser().parse_args(argv)
+    if _args.command == "convert":
+        return convert(_args)
+
+    if _args.command == "export":
+        return export(_args)
+
+    if _args.command == "trace":
+        return trace(_args)
+
+    if _args.command != "run":
+        getParser().print_help()
+        return 2
+
+    return run(_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -237,7 +237,7 @@ catch(e){
         const tester_obj = io_utils.parseJson(this.graph_path);
         LOG("Strict: " + tmp_tree.STRICT);
         LOG("Propagate: " + tmp_tree.PROPAGATE);
-        Recurser(tmp_tree,tester_obj.nodes,tmp_tree.DATABLOCK);
+        Recurser(tmp_tree,io_utils.getTree(tester_obj),tmp_tree.DATABLOCK);
 
         // done
         return tmp_tree.extractScore(true);
@@ -247,14 +247,38 @@ catch(e){
     function Recurser(Spawn_obj,node_data,datablock){
         /*
         main logic
+        walks the graph depth-first with a work stack instead of recursion
         */
 
-        // early recursion stop
-        const failed_count = Spawn_obj.failedNodes().length;
+        var _stack = new Array();
+        _stack.push([node_data,datablock]);
 
-        if (Spawn_obj.STRICT && failed_count){
-            return;
+        while (_stack.length){
+            // early stop
+            if (Spawn_obj.STRICT && Spawn_obj.failedNodes().length){
+                return;
+            }
+
+            var _item = _stack.pop();
+            var _next = RunNode(Spawn_obj,_item[0],_item[1]);
+
+            if (_next === null){
+                continue;
+            }
+
+            // out nodes, reversed so the first one is ran first
+            for (var _d = _next.out_nodes.length - 1; _d >= 0; _d--){
+                _stack.push([_next.out_nodes[_d],_next.datablock]);
+            }
         }
+    }
+
+
+    function RunNode(Spawn_obj,node_data,datablock){
+        /*
+        runs a single node
+        returns the out nodes and datablock to run next, null if down-stream should not run
+        */
 
         // $.sleep(50);
         LOG("");
@@ -279,14 +303,7 @@ catch(e){
 
         // if there's no commands (starter)
         if (_dummy.command == undefined){
-            const _dummy_len= _dummy.out_nodes.length;
-
-            for (var d = 0; d < _dummy_len; d++){
-                Recurser(Spawn_obj,_dummy.out_nodes[d],_copy_block);
-            }
-
-            // this function actually ends here
-            return;
+            return {out_nodes: _dummy.out_nodes, datablock: _copy_block};
         }
 
         // recurse with commands
@@ -347,7 +364,7 @@ catch(e){
                 // strict
                 if (Spawn_obj.STRICT === true){
                     LOG("Critical: Operation stopped.");
-                    return;
+                    return null;
                 }
             }
             else if (_run_result.getStatus() === "skip"){
@@ -357,17 +374,12 @@ catch(e){
                 LOG(skip_m);
             }
 
-            return _dummy;
-        }
-
-        // run out nodes
-        for (var _d = 0; _d < _dummy.out_nodes.length; _d++){
-            var out_conn = Recurser(Spawn_obj,_dummy.out_nodes[_d],_copy_block);
+            return null;
         }
 
-        // done
+        // done, out nodes never touch this dummy's messages
         _dummy.addMessage("Success");
-        return _dummy;
+        return {out_nodes: _dummy.out_nodes, datablock: _copy_block};
     }
 
 
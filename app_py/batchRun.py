@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Runs a graph over many datablocks without the UI.
+
+- Example::
+
+    python -m app_py.batchRun C:/graphs/check.json C:/assets/blocks.jsonl -o C:/tmp/scores.jsonl -w 8
+"""
+
+from __future__ import print_function
+
+import sys
+import json
+import argparse
+
+from main import Main
+from app_py.configs import config_obj
+from utilities import execUtils
+from utilities import profileUtils
+
+
+def readBlocks(blocks_path):
+    """
+    Yields datablocks from a file, one at a time.
+    The file is either JSON lines (one datablock per line) or a JSON list.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param blocks_path: Full path of the datablocks file.
+    :type blocks_path: str
+
+    :return: Datablocks.
+    :rtype: generator
+
+    - Example::
+
+        for _block in batchRun.readBlocks("C:/assets/blocks.jsonl"):
+            print(_block)
+    """
+
+    with open(blocks_path) as _blocks_file:
+        _first = _blocks_file.read(1)
+        while _first and _first.isspace():
+            _first = _blocks_file.read(1)
+
+        _blocks_file.seek(0)
+
+        if _first == "[":
+            for _block in json.load(_blocks_file):
+                yield _block
+            return
+
+        for _line in _blocks_file:
+            _line = _line.strip()
+            if _line:
+                yield json.loads(_line)
+
+
+def getParser():
+    _parser = argparse.ArgumentParser(description="Runs a graph over many datablocks and writes a JSONL score.")
+    _parser.add_argument("graph", help="JSON graph file.")
+    _parser.add_argument("blocks", help="Datablocks, JSON lines or a JSON list.")
+    _parser.add_argument("-o", "--output", required=True, help="JSONL score file to write.")
+    _parser.add_argument("-w", "--workers", type=int, default=0, help="Number of workers, 0 uses the CPU count.")
+    _parser.add_argument("-e", "--executor", default="process", choices=execUtils.EXECUTORS)
+    _parser.add_argument("-k", "--key", default=None, help="Datablock key copied into each score line.")
+    _parser.add_argument("--strict", action="store_true", default=None,
+                         help="Stop a datablock's run on its first error.")
+    _parser.add_argument("--no-strict", dest="strict", action="store_false", default=None,
+                         help="Keep going after errors, overrides the config.")
+    _parser.add_argument("--propagate", action="store_true", default=None,
+                         help="Share one datablock across the whole graph.")
+    _parser.add_argument("--no-propagate", dest="propagate", action="store_false", default=None,
+                         help="Give each node its own copy of the datablock, overrides the config.")
+    _parser.add_argument("--incremental", action="store_true", help="Replay unchanged nodes from the result cache.")
+    _parser.add_argument("--profile", default=None, choices=profileUtils.PROFILES,
+                         help="Per node metrics written to the scores, defaults to the config or time.")
+    _parser.add_argument("--writes", action="store_true",
+                         help="Record the datablock keys each node writes, for the trace command.")
+    return _parser
+
+
+def main(argv=None):
+    """
+    Command line entry, returns 1 if any datablock had an error.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param argv: Arguments, defaults to sys.argv[1:].
+    :type argv: list
+
+    :return: Exit code.
+    :rtype: int
+    """
+
+    _args = getParser().parse_args(argv)
+
+    if _args.strict is None:
+        _args.strict = int(config_obj.get("DETAILS", "strict"))
+
+    if _args.propagate is None:
+        _args.propagate = int(config_obj.get("DETAILS", "propagate"))
+
+    _main = Main(executor="serial", workers=_args.workers)
+    _main.strict = _args.strict
+    _main.propagate = _args.propagate
+    _main.incremental = _args.incremental
+
+    if _args.profile is not None:
+        _main.profile = _args.profile
+
+    if _args.writes:
+        _main.track_writes = True
+
+    _summary = _main.runBatch(_args.graph,
+                              readBlocks(_args.blocks),
+                              _args.output,
+                              workers=_args.workers,
+                              executor=_args.executor,
+                              key=_args.key)
+
+    print(json.dumps(_summary))
+    return 1 if _summary["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
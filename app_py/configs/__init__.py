@@ -43,6 +43,37 @@ for _module_path in config_obj.get("PATHS", "mod_paths"):
     if _module_path not in sys.path:
         sys.path.append(_module_path)
 
+
+def getOption(section, option, default=None):
+    """
+    Returns a config value or default when the option is not set.
+    Used for optional settings that older config files do not have.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param section: Section name, "PATHS" or "DETAILS".
+    :type section: str
+
+    :param option: Option name.
+    :type option: str
+
+    :param default: Returned if the option is missing.
+    :type default: object
+
+    :return: The option's value or default.
+    :rtype: str
+
+    - Example::
+
+        getOption("DETAILS", "executor", "serial")
+    """
+
+    if not config_obj.has_option(section, option):
+        return default
+
+    return config_obj.get(section, option)
+
+
 test_block = {"what": "This is Hawdini",
               "where": "Made in Japan",
               # "when": "On my spare time",
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import sys
+import threading
+
+# marks a key that was not there
+_MISSING = object()
+
+# sibling branches copy the same parent from worker threads
+_COPY_LOCK = threading.Lock()
+
+_CONTAINERS = (dict, list, set)
+
+
+def _thaw(value):
+    """
+    Returns a private copy of nested builtin containers, anything else is returned as is.
+    Objects like loggers or scene handles are shared on purpose.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param value: Any datablock value.
+    :type value: object
+
+    :return: The value, or a copy of it if it's a dict, list or set.
+    :rtype: object
+    """
+
+    if isinstance(value, dict):
+        return dict((k, _thaw(v)) for k, v in value.items())
+
+    if isinstance(value, list):
+        return [_thaw(v) for v in value]
+
+    if isinstance(value, set):
+        return set(value)
+
+    return value
+
+
+class DataBlock(dict):
+    """
+    Datablock given to modules when propagate is off, a dict that copies its nested values lazily.
+    copy() is a shallow dict copy, nested dicts, lists and sets stay shared with the other copies
+    until a copy reads them through [], get(), items() or values(), which gives it a private copy.
+    Only the containers a branch reads are copied, not the whole block per node.
+
+    It is a real dict, so json.dumps and isinstance(block, dict) work as before.
+    Limit: code that reaches the values without those methods (C extensions, dict.__getitem__,
+    json.dumps) sees the shared containers, they must not be changed in place that way.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param data: Starting keys and values, nested values are not copied.
+    :type data: dict
+
+    - Example::
+
+        _block = DataBlock({"what": "This is Hawdini", "tags": ["a"]})
+        _branch = _block.copy()
+        _branch["tags"].append("b")
+        _block["tags"]
+        # ['a']
+    """
+
+    __slots__ = ("_shared", "_owned", "_origin")
+
+    def __repr__(self):
+        return "DataBlock({})".format(dict.__repr__(self))
+
+    def __init__(self, data=None, **kwargs):
+        dict.__init__(self)
+        self._shared = False
+        self._owned = set()
+        self._origin = dict()
+
+        if data is not None:
+            dict.update(self, data)
+
+        if kwargs:
+            dict.update(self, kwargs)
+
+    def _own(self, key, value):
+        """
+        Returns the value of key, copied first if it's a container shared with other blocks.
+        """
+
+        if not self._shared or key in self._owned or not isinstance(value, _CONTAINERS):
+            return value
+
+        self._owned.add(key)
+        self._origin.setdefault(key, value)
+
+        value = _thaw(value)
+        dict.__setitem__(self, key, value)
+        return value
+
+    def _ownAll(self):
+        if not self._shared:
+            return
+
+        for key, value in list(dict.items(self)):
+            self._own(key, value)
+
+    def _write(self, key):
+        """
+        Keeps the value key had before its first write, see changedKeys.
+        """
+
+        if key not in self._origin:
+            self._origin[key] = dict.get(self, key, _MISSING)
+
+        self._owned.add(key)
+
+    def __getitem__(self, key):
+        return self._own(key, dict.__getitem__(self, key))
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+
+        return self[key]
+
+    def items(self):
+        self._ownAll()
+        return dict.items(self)
+
+    def values(self):
+        self._ownAll()
+        return dict.values(self)
+
+    if sys.version_info[0] == 2:
+        def iteritems(self):
+            self._ownAll()
+            return dict.iteritems(self)
+
+        def itervalues(self):
+            self._ownAll()
+            return dict.itervalues(self)
+
+    def __setitem__(self, key, value):
+        self._write(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+
+        self._write(key)
+        dict.__delitem__(self, key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    def pop(self, key, *default):
+        if key not in self:
+            return dict.pop(self, key, *default)
+
+        _value = self[key]
+        del self[key]
+        return _value
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): datablock is empty")
+
+        _key = next(iter(self))
+        return _key, self.pop(_key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        for key in list(self):
+            self._write(key)
+
+        dict.clear(self)
+
+    def __reduce__(self):
+        # process executors and pickle get a plain snapshot
+        return self.__class__, (dict(self),)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.__class__(_thaw(dict(self)))
+
+    def copy(self):
+        """
+        Returns a new DataBlock sharing this one's values, both keep writing to their own keys.
+        Nested containers become shared again for both blocks.
+        Starts a new changedKeys() for this block too.
+
+        :return: The copy.
+        :rtype: DataBlock
+        """
+
+        _copy = self.__class__.__new__(self.__class__)
+        dict.update(_copy, self)
+        _copy._shared = True
+        _copy._owned = set()
+        _copy._origin = dict()
+
+        with _COPY_LOCK:
+            self._shared = True
+            self._owned = set()
+            self._origin = dict()
+
+        return _copy
+
+    def changedKeys(self):
+        """
+        Returns the keys set or deleted since this block was copied (or created).
+        Containers that were only read are left out, changing one in place counts.
+
+        :return: The keys.
+        :rtype: list
+        """
+
+        _changed = list()
+        for key, old in self._origin.items():
+            _value = dict.get(self, key, _MISSING)
+            if _value is old:
+                continue
+
+            if _value is _MISSING or old is _MISSING or _value != old:
+                _changed.append(key)
+
+        return _changed
+
+    def toDict(self):
+        """
+        Returns the datablock as a plain dict, nested values are not copied.
+
+        :return: Every key and value.
+        :rtype: dict
+        """
+
+        return dict(dict.items(self))
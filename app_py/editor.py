@@ -35,6 +35,7 @@ from pprint import pprint
 
 from PySide2.QtCore import Qt
 from PySide2.QtCore import Slot
+from PySide2.QtCore import QTimer
 
 from PySide2.QtWidgets import QAction
 from PySide2.QtWidgets import QApplication
@@ -43,7 +44,11 @@ from PySide2.QtWidgets import QTreeWidgetItem
 from ui.widgets import StartNode
 from ui.widgets import ItemNode
 from ui.widgets import GroupNode
+from ui.widgets import pixmapCache
+import moduleCatalog
 from main import Main as pyApp
+from graphRunner import GraphRunner
+from moduleWatcher import ModuleWatcher
 from ui.interface import Interface
 from utilities import nodeUtils
 from utilities import logUtils
@@ -122,8 +127,21 @@ class Editor(object):
         self.log_file = ""
         self.strict = False
         self.propagate = True
+        self.incremental = False
+        self.catalog = None
+        self.module_watcher = None
+        self.runner = None
+        self._branch_items = dict()
+        self._leaf_items = dict()
+        self._leaf_names = dict()
 
         self.ui = Interface(parent)
+
+        # searches once typing pauses
+        self._search_timer = QTimer()
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+
         self._initUi()
 
     def _initUi(self):
@@ -156,6 +174,8 @@ class Editor(object):
 
         self.ui.open_btn.clicked.connect(self._openTree)
         self.ui.run_btn.clicked.connect(self._playJson)
+        self.ui.cancel_btn.clicked.connect(self._cancelJson)
+        self.ui.finished.connect(self._stopJson)
         self.ui.log_btn.clicked.connect(self.openLog)
         self.ui.save_btn.clicked.connect(self.saveTree)
         self.ui.strict_btn.clicked.connect(self._setStrict)
@@ -166,7 +186,8 @@ class Editor(object):
         self.ui.reset_btn.clicked.connect(self.buildTree)
         self.ui.clear_btn.clicked.connect(self.clearTree)
         self.ui.erase_btn.clicked.connect(self._clearSearch)
-        self.ui.find_txt.textChanged[str].connect(self._searchTree)
+        self.ui.find_txt.textChanged[str].connect(self._queueSearch)
+        self._search_timer.timeout.connect(self._searchTree)
 
     def _triggerActions(self, _trigger_action):
         """
@@ -183,6 +204,8 @@ class Editor(object):
             self._setStrict()
         elif _trigger_text == "Propagate Datablock":
             self._setPropagate()
+        elif _trigger_text == "Incremental Run":
+            self._setIncremental()
         elif _trigger_text == "Align (Selected)":
             self._alignTree(False)
         elif _trigger_text == "Align (All)":
@@ -200,6 +223,8 @@ class Editor(object):
         """
         Builds Nodes Tree Repository from "modules" folder contents.
         Default folder names are "custom", "basic" and "debug".
+        Uses the module catalog, only folders changed since the last start are listed again.
+        Descriptions are read when their tooltip is first shown.
 
         Custom nodes can be made and stored under a folder that starts with the software name.
 
@@ -210,67 +235,147 @@ class Editor(object):
             custom nodes folder ("maya2018_ModelCheck")
         """
 
-        ext_map = {"py": ["py", "pyc"],
-                   "jsx": ["jsxbin", "jsxinc"]
-                   }
-
         for mod_path in self.modules_root:
             print("Searching modules in {}".format(mod_path))
             if not os.path.isdir(mod_path):
                 raise RuntimeError("No module path: ".format(mod_path))
 
-        _branch_count = 1
-        _branch_added = list()
-        _leaf_added = list()
+        self.catalog = moduleCatalog.ModuleCatalog(self.modules_root,
+                                                   moduleCatalog.EXTENSIONS[self.language],
+                                                   moduleCatalog.getIndexPath(self.language))
+        self.catalog.load()
+        self.catalog.refresh()
+        self.catalog.save()
 
-        for mod_path in self.modules_root:
-            _mod_name = os.path.basename(mod_path)
+        self._branch_items = dict()
+        self._leaf_items = dict()
+        self._leaf_names = dict()
 
-            for _branch in os.listdir(mod_path):
-                _branch_path = os.path.join(mod_path, _branch)
+        for _branch in self.catalog.getBranches():
+            _branch_obj = self._addBranchItem(_branch)
+            if _branch_obj is None:
+                continue
 
-                if _branch in _branch_added:
-                    print("WARNING! Branch is a duplicate ({}): {}".format(_branch, _branch_path))
-                    continue
+            for _module in _branch["modules"]:
+                self._addModuleItem(_branch_obj, _module)
 
-                if not os.path.isdir(_branch_path) or _branch.startswith("_"):
-                    continue
+            print("{} ({} modules)".format(_branch_obj.text(0), _branch_obj.childCount()))
 
-                print(" {} ".format(_branch).center(88, "="))
-                _branch_files = os.listdir(_branch_path)
-                if len(_branch_files) < 1:
-                    continue
+        # modules added, changed or removed on disk show up while the editor is open
+        self.module_watcher = ModuleWatcher(self.catalog)
+        self.module_watcher.changed.connect(self._updateModuleTree)
 
-                _branch_tit = "{}: {} ({})".format(str(_branch_count).zfill(2), _branch, _mod_name)
-                _branch_obj = QTreeWidgetItem(self.ui.module_tree, [_branch_tit])
-                _branch_obj.setExpanded(True)
-                _branch_added.append(_branch)
+        self.ui.module_tree.setMouseTracking(True)
+        self.ui.module_tree.itemEntered.connect(self._setModuleToolTip)
+        self.ui.module_tree.itemClicked.connect(self._clicker)
+        self.ui.module_tree.setHeaderLabels(["{} Modules".format(self.software).title()])
 
-                for _leaf_file in _branch_files:
-                    _leaf_name = _leaf_file.split(".")[0]
+    def _addBranchItem(self, branch):
+        """
+        Adds a branch of the module catalog to the module tree.
+        Skips empty branches and names already in the tree.
 
-                    if _leaf_file.startswith("_"):
-                        continue
+        :return: The new branch item, None if skipped.
+        :rtype: QTreeWidgetItem
+        """
 
-                    if _leaf_name in _leaf_added:
-                        # print("- WARNING! Leaf is a duplicate ({}) in {}".format(_leaf_name, _branch_path))
-                        continue
+        _names = [b["name"] for b in self._branch_items.values()]
+        if branch["name"] in _names:
+            print("WARNING! Branch is a duplicate ({}): {}".format(branch["name"], branch["path"]))
+            return
 
-                    if _leaf_file.split(".")[-1] not in ext_map[self.language]:
-                        continue
+        if branch["empty"]:
+            return
 
-                    _leaf_obj = QTreeWidgetItem(_branch_obj, [_leaf_name])
-                    _leaf_path = os.path.abspath(os.path.join(_branch, _leaf_file))
+        _mod_name = os.path.basename(branch["root"])
+        _branch_tit = "{}: {} ({})".format(str(len(self._branch_items) + 1).zfill(2), branch["name"], _mod_name)
+        _branch_obj = QTreeWidgetItem(self.ui.module_tree, [_branch_tit])
+        _branch_obj.setExpanded(True)
 
-                    _leaf_obj.setToolTip(0, nodeUtils.getDescription(_leaf_path))
-                    _leaf_obj.setWhatsThis(0, _leaf_path)
-                    _branch_obj.addChild(_leaf_obj)
-                    _leaf_added.append(_leaf_name)
-                    print("- Loaded", _leaf_file)
-                _branch_count += 1
+        self._branch_items[branch["path"]] = _branch_obj
+        return _branch_obj
 
-        self.ui.module_tree.itemClicked.connect(self._clicker)
-        self.ui.module_tree.setHeaderLabels(["{} Modules".format(self.software).title()])
+    def _addModuleItem(self, branch_obj, module):
+        """
+        Adds a module of the catalog under its branch item, names already in the tree are skipped.
+
+        :return: The new leaf item, None if skipped.
+        :rtype: QTreeWidgetItem
+        """
+
+        if module["name"] in self._leaf_names:
+            return
+
+        _leaf_obj = QTreeWidgetItem(branch_obj, [module["name"]])
+        _leaf_obj.setWhatsThis(0, module["path"])
+        branch_obj.addChild(_leaf_obj)
+        self._leaf_items[module["path"]] = _leaf_obj
+        self._leaf_names[module["name"]] = module["path"]
+        return _leaf_obj
+
+    @Slot(dict)
+    def _updateModuleTree(self, changes):
+        """
+        Applies the catalog changes found by the module watcher to the module tree.
+        Only the items of the changed modules are touched.
+        """
+
+        for _module in changes["removed"]:
+            _leaf_obj = self._leaf_items.pop(_module["path"], None)
+            if _leaf_obj is not None:
+                _leaf_obj.parent().removeChild(_leaf_obj)
+                self._leaf_names.pop(_module["name"], None)
+            print("- Removed", _module["path"])
+
+        # branches that are gone or have no files left
+        _branches = dict((b["path"], b) for b in self.catalog.getBranches())
+        for _branch_path in list(self._branch_items):
+            if _branch_path in _branches and not _branches[_branch_path]["empty"]:
+                continue
+
+            _branch_obj = self._branch_items.pop(_branch_path)
+            _index = self.ui.module_tree.indexOfTopLevelItem(_branch_obj)
+            self.ui.module_tree.takeTopLevelItem(_index)
+
+        for _module in changes["added"]:
+            _branch_path = os.path.dirname(_module["path"])
+            _branch_obj = self._branch_items.get(_branch_path)
+
+            if _branch_obj is None and _branch_path in _branches:
+                _branch_obj = self._addBranchItem(_branches[_branch_path])
+
+            if _branch_obj is not None and self._addModuleItem(_branch_obj, _module):
+                print("- Loaded", _module["path"])
+
+        # tooltips and icons are read again on next use
+        for _module in changes["updated"]:
+            _leaf_obj = self._leaf_items.get(_module["path"])
+            if _leaf_obj is not None:
+                _leaf_obj.setToolTip(0, "")
+
+            nodeUtils.clearIcons(os.path.dirname(_module["icon"]))
+            pixmapCache.CACHE.discard(_module["icon"])
+
+        for _branch_path in changes["descriptions"]:
+            for _module_path, _leaf_obj in self._leaf_items.items():
+                if os.path.dirname(_module_path) == _branch_path:
+                    _leaf_obj.setToolTip(0, "")
+
+        self._feedback("Module tree updated: {} added, {} removed, {} changed.".format(len(changes["added"]),
+                                                                                       len(changes["removed"]),
+                                                                                       len(changes["updated"])))
+
+    @Slot(QTreeWidgetItem, int)
+    def _setModuleToolTip(self, tree_item, column):
+        """
+        Sets the description of a module as its tooltip, the first time the mouse is over it.
+        """
+
+        _module_path = tree_item.whatsThis(0)
+        if not _module_path or tree_item.toolTip(0):
+            return
+
+        tree_item.setToolTip(0, self.catalog.getDescription(_module_path))
 
     def show(self):
         self.ui.show()
@@ -337,19 +442,29 @@ class Editor(object):
         """
 
         self.ui.find_txt.setText("")
+        self._search_timer.stop()
         sceneUtils.clearSelection(self.ui.scene)
 
+    def _queueSearch(self, text):
+        """
+        Restarts the search timer, the search runs once typing pauses.
+        """
+
+        self._search_timer.start()
+
     def _searchTree(self):
         """
-        Searches the whole scene for matching names.
+        Searches the whole scene for matching names, close names are found if nothing matches.
+        Called once typing pauses, the best match is scrolled into view.
         """
 
         _pf = self.ui.find_txt.text()
-        _all_nodes = sceneUtils.searchTree(self.ui.scene, _pf)
-        sceneUtils.clearSelection(self.ui.scene)
+        _all_nodes = sceneUtils.searchTree(self.ui.scene, _pf, fuzzy=True)
+        sceneUtils.setSelection(self.ui.scene, _all_nodes)
 
-        for _node in _all_nodes:
-            _node.setSelected(True)
+        if _all_nodes:
+            self.ui.view.ensureVisible(_all_nodes[0])
+            self._feedback("Found {} nodes, best match: {}".format(len(_all_nodes), _all_nodes[0].name))
 
     def _setStrict(self):
         """
@@ -385,6 +500,22 @@ class Editor(object):
         self.ui.propagate_btn.setIcon(self.ui.propagate_icon2)
         self._feedback("Datablock only propagated on branch-level.", 1)
 
+    def _setIncremental(self):
+        """
+        Toggles incremental runs.
+        Nodes with the same inputs and module source as a previous run are not ran again,
+        their stored results are replayed.
+        """
+
+        self.incremental = not self.incremental
+        self.ui.incremental_check.setChecked(self.incremental)
+
+        if self.incremental:
+            self._feedback("Unchanged nodes will replay their previous results.", 1)
+            return
+
+        self._feedback("All nodes will be ran.")
+
     def openLog(self):
         """
         Opens the log.txt file if self.log_file is a valid file in drive.
@@ -440,24 +571,114 @@ class Editor(object):
     def _playJson(self):
         """
         Plays self.tree_json for debug purposes.
+        The graph runs on a worker thread, nodes show their state as they finish.
         """
 
+        if self.runner is not None:
+            self._feedback("Already running: {}".format(self.tree_json), 1)
+            return
+
+        # the scene shows the graph that runs, with every node clean
+        self.buildTree()
+
         self.setupLog()
         _dummy = pyApp()
         _dummy.strict = self.strict
         _dummy.propagate = self.propagate
+        _dummy.incremental = self.incremental
         _copy_block = self.data_block.copy()
-        _dummy.runJson(self.tree_json, _copy_block)
 
+        self.runner = GraphRunner(_dummy, self.tree_json, _copy_block)
+        self.runner.nodeStarted.connect(self._nodeStarted, Qt.QueuedConnection)
+        self.runner.nodeFinished.connect(self._nodeFinished, Qt.QueuedConnection)
+        self.runner.runFinished.connect(self._runFinished, Qt.QueuedConnection)
+        self.runner.runFailed.connect(self._runFailed, Qt.QueuedConnection)
+
+        self._setRunning(True)
+        self.runner.start()
+        self._feedback("Running: {}".format(self.tree_json))
+
+    def _cancelJson(self):
+        """
+        Stops the run from starting more nodes.
+        """
+
+        if self.runner is None:
+            return
+
+        self.runner.cancel()
+        self.ui.cancel_btn.setEnabled(False)
+        self._feedback("Cancelling, waiting for running nodes...", 1)
+
+    def _stopJson(self):
+        """
+        Cancels the run and waits for it, called when the editor closes.
+        """
+
+        if self.runner is None:
+            return
+
+        self.runner.cancel()
+        self.runner.wait()
+        self.runner = None
+
+    def _setRunning(self, running):
+        """
+        Disables the buttons that change the graph while it runs.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param running: True while a run is going.
+        :type running: bool
+        """
+
+        for _btn in (self.ui.run_btn, self.ui.open_btn, self.ui.reset_btn, self.ui.clear_btn):
+            _btn.setEnabled(not running)
+
+        self.ui.cancel_btn.setEnabled(running)
+
+    def _nodeStarted(self, event):
+        _node = self.ui.scene.getNode(event.name, event.uuid)
+        if isinstance(_node, ItemNode):
+            _node.setRunning()
+            self._feedback("Running: {}".format(event.name))
+
+    def _nodeFinished(self, event):
+        if event.status == "start":
+            return
+
+        nodeUtils.postProcessNode(self.ui.scene, event.node)
+
+    def _runFinished(self, app_obj):
         print("=" * 168)
-        self.buildTree()
+        self._endRun()
 
-        nodeUtils.postProcessNodes(self.ui.scene, _dummy.nodes_all)
-        del(_dummy)
+        if app_obj.cancelled:
+            self._feedback("Cancelled: {}".format(self.tree_json), 1)
+            return
 
-        self.ui.scene.update()
         self._feedback("Ran: {}".format(self.tree_json))
 
+    def _runFailed(self, error):
+        print(error)
+        self._endRun()
+        self._feedback("Failed running: {}".format(self.tree_json), 2)
+
+    def _endRun(self):
+        """
+        Clears the finished run, nodes left running never got their results.
+        """
+
+        self.runner.wait()
+        self.runner = None
+        self._setRunning(False)
+
+        for _node in self.ui.scene.getNodes():
+            if isinstance(_node, ItemNode) and _node.state == "Running":
+                _node.setDirty(state="skip", message="Not finished")
+
+        self.ui.scene.update()
+
     def _groupSelected(self):
         """
         Groups all selected nodes.
@@ -477,7 +698,6 @@ class Editor(object):
     def _alignTree(self, is_all=False):
         """
         Arranges down-stream nodes from first selection.
-        Called 2x to prevent overlaps.
         Also aranges groups.
 
         **parameters**, **types**, **return** and **return types**
@@ -490,24 +710,17 @@ class Editor(object):
         if not _selection:
             return
 
-        _groups = [g for g in self.ui.scene.items() if isinstance(g, GroupNode)]
-
-        if not is_all:
-            for _selected in _selection:
-                sceneUtils.alignTreeRecurse(_selected)
-                sceneUtils.alignTreeRecurse(_selected)
-
-            for _group in _groups:
-                for _selected_item in _selection:
-                    if _selected_item in _group.group_widgets:
-                        _group.rebuildRect()
-            return
+        _aligned = set()
+        for _root in ([self.starter] if is_all else _selection):
+            _aligned.update(id(n) for n in sceneUtils.alignTree(_root))
 
-        sceneUtils.alignTreeRecurse(self.starter)
-        sceneUtils.alignTreeRecurse(self.starter)
+        # each group is rebuilt once
+        for _group in self.ui.scene.items():
+            if not isinstance(_group, GroupNode):
+                continue
 
-        for _group in _groups:
-            _group.rebuildRect()
+            if any(id(_widget) in _aligned for _widget in _group.group_widgets):
+                _group.rebuildRect()
 
     def _feedback(self, feed_text, level=0):
         """
@@ -581,8 +794,9 @@ class Editor(object):
             _name = _text + str(_counter).zfill(2)
 
         _whats_this = tree_item.whatsThis(0)
-        _desc = nodeUtils.getDescription(_whats_this)
-        _icon = nodeUtils.getIconPath(_whats_this)
+        _desc = self.catalog.getDescription(_whats_this)
+        _module = self.catalog.getModule(_whats_this)
+        _icon = _module["icon"] if _module else nodeUtils.getIconPath(_whats_this)
 
         new_node = ItemNode(_name,
                             self.ui.winW/2+randrange(-50, 50),
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+import hashlib
+import threading
+
+from collections import OrderedDict
+from utilities import binUtils
+from app_py.configs import getOption
+
+
+class GraphCache(object):
+    """
+    Keeps parsed graph (and score) files in memory, keyed by path, mtime and size.
+    Bounded by a least recently used eviction, shared by the editor, viewer and runs.
+
+    The returned data is shared, callers must not change it.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param max_size: Maximum number of files kept, defaults to 16.
+    :type max_size: int
+
+    - Example::
+
+        _graph_data = graphCache.CACHE.read(r"C:/graphs/publish.json")
+        print(graphCache.CACHE.getStats())
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, max_size=None):
+        if max_size is None:
+            max_size = 16
+
+        self.max_size = max(1, int(max_size))
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = dict()
+        self.resetStats()
+
+    def read(self, file_path):
+        """
+        Returns the parsed contents of a file, JSON or binary.
+        Reads and parses the file only if it's not cached or changed on disk.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param file_path: Full file path.
+        :type file_path: str
+
+        :return: Contents of the file.
+        :rtype: dict or list
+        """
+
+        with self._lock:
+            return self.parse(self.getEntry(file_path))
+
+    def parse(self, entry):
+        """
+        Returns the parsed data of an entry from getEntry(), parsing it once.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param entry: A cache entry.
+        :type entry: dict
+
+        :return: Contents of the file.
+        :rtype: dict or list
+        """
+
+        with self._lock:
+            if entry["raw"] is not None:
+                entry["data"] = binUtils.loads(entry["raw"])
+                entry["raw"] = None
+
+            return entry["data"]
+
+    def getEntry(self, file_path):
+        """
+        Returns the cache entry of a file, loading it if needed.
+        Keys: digest (sha1 of the file), extras (dict for data derived from this version,
+        like a compiled plan, dropped with the entry) and data, which is only parsed by read().
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param file_path: Full file path.
+        :type file_path: str
+
+        :return: The cache entry.
+        :rtype: dict
+        """
+
+        _path = os.path.normcase(os.path.abspath(file_path))
+        _stat = os.stat(_path)
+        _signature = (_stat.st_mtime, _stat.st_size)
+
+        with self._lock:
+            _entry = self._cache.pop(_path, None)
+
+            if _entry is not None and _entry["signature"] == _signature:
+                self._stats["hits"] += 1
+            else:
+                self._stats["misses"] += 1
+                _entry = GraphCache._newEntry(_path, _signature)
+
+            self._cache[_path] = _entry
+
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self._stats["evictions"] += 1
+
+            return _entry
+
+    def getStats(self):
+        """
+        Returns the cache statistics.
+        Keys: hits, misses, evictions, cached.
+
+        :return: A copy of the statistics.
+        :rtype: dict
+        """
+
+        _out = dict(self._stats)
+        _out["cached"] = len(self._cache)
+        return _out
+
+    def resetStats(self):
+        """
+        Sets all statistics back to 0.
+        """
+
+        for _key in ("hits", "misses", "evictions"):
+            self._stats[_key] = 0
+
+    def clear(self):
+        """
+        Forgets all cached files.
+        """
+
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _newEntry(path, signature):
+        """
+        :meta private:
+        """
+
+        with open(path, "rb") as data_buffer:
+            _raw = data_buffer.read()
+
+        # parsed on the first read(), a cached plan may make that unnecessary
+        return {"raw": _raw,
+                "data": None,
+                "digest": hashlib.sha1(_raw).hexdigest(),
+                "signature": signature,
+                "extras": dict()}
+
+
+# shared by the editor, viewer and runs of this process
+CACHE = GraphCache(getOption("DETAILS", "graph_cache_size"))
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+import json
+import hashlib
+
+import graphCache
+from utilities import graphUtils
+from utilities import logUtils
+from app_py.configs import getOption
+
+
+class GraphPlan(object):
+    """
+    A graph compiled into a flat list of nodes, in the order a serial run visits them (pre-order).
+    Each node knows its parent index, so nothing has to walk nested dicts at run time.
+    Module functions are resolved at run time by moduleRegistry.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param nodes: Node dicts (without their "out_nodes"), starter first.
+    :type nodes: list
+
+    :param parents: Parent index of each node, -1 for the starter.
+    :type parents: list
+
+    :param digest: sha1 of the graph file this was compiled from.
+    :type digest: str
+
+    - Example::
+
+        plan = GraphPlan.compile(graphUtils.toTree(graph_data)["nodes"])
+        for index, node_data in enumerate(plan.nodes):
+            print(index, node_data["name"], plan.parents[index])
+    """
+
+    VERSION = 1
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, nodes, parents, digest=None):
+        if len(nodes) != len(parents):
+            raise ValueError("Plan nodes and parents must be the same length.")
+
+        self.nodes = nodes
+        self.parents = parents
+        self.digest = digest
+        self.children = [list() for _ in nodes]
+        self.ends = list(range(1, len(nodes) + 1))
+
+        for _index, _parent in enumerate(self.parents):
+            if _parent < 0:
+                continue
+
+            if _parent >= _index:
+                raise ValueError("Plan is not in pre-order: {}".format(self.nodes[_index]["name"]))
+
+            self.children[_parent].append(_index)
+
+        # index right after each node's sub-tree, used to skip down-stream nodes
+        for _index in reversed(range(len(self.nodes))):
+            if self.children[_index]:
+                self.ends[_index] = self.ends[self.children[_index][-1]]
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @classmethod
+    def compile(cls, tree_data, digest=None):
+        """
+        Flattens a nested graph dict.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param tree_data: The starter's dict, key ["nodes"] of the graph JSON.
+        :type tree_data: dict
+
+        :param digest: sha1 of the graph file.
+        :type digest: str
+
+        :return: A new plan.
+        :rtype: GraphPlan
+        """
+
+        _nodes = list()
+        _parents = list()
+        _index_of = dict()
+
+        for _node, _parent in graphUtils.walkTree(tree_data):
+            _flat = dict(_node)
+            _flat["out_nodes"] = list()
+
+            _index_of[id(_node)] = len(_nodes)
+            _nodes.append(_flat)
+            _parents.append(-1 if _parent is None else _index_of[id(_parent)])
+
+        return cls(_nodes, _parents, digest)
+
+    def toDict(self):
+        """
+        Returns a serializable dict of this plan.
+
+        :return: Plan data.
+        :rtype: dict
+        """
+
+        return {"version": GraphPlan.VERSION,
+                "digest": self.digest,
+                "nodes": self.nodes,
+                "parents": self.parents}
+
+    @classmethod
+    def fromDict(cls, plan_data):
+        """
+        Creates a plan from toDict() data.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param plan_data: Data from toDict().
+        :type plan_data: dict
+
+        :return: A new plan.
+        :rtype: GraphPlan
+        """
+
+        if plan_data.get("version") != GraphPlan.VERSION:
+            raise ValueError("Unsupported plan version: {}".format(plan_data.get("version")))
+
+        return cls(plan_data["nodes"], plan_data["parents"], plan_data.get("digest"))
+
+
+def getPlanPath(json_path):
+    """
+    Returns where the compiled plan of a graph is cached.
+    Next to the graph (".graph.json.plan") unless PATHS "plan_path" is set in the config.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param json_path: Full file path of JSON file graph.
+    :type json_path: str
+
+    :return: Full file path of the plan.
+    :rtype: str
+    """
+
+    _json_path = os.path.abspath(json_path)
+    _plan_name = ".{}.plan".format(os.path.basename(_json_path))
+    _plan_root = getOption("PATHS", "plan_path")
+
+    if not _plan_root:
+        return os.path.join(os.path.dirname(_json_path), _plan_name)
+
+    # keep graphs with the same name apart
+    _dir_key = hashlib.sha1(os.path.dirname(_json_path).encode("utf-8")).hexdigest()[:8]
+    return os.path.join(_plan_root, "{}_{}".format(_dir_key, _plan_name.lstrip(".")))
+
+
+def readPlan(plan_path, digest):
+    """
+    Reads a cached plan, returns None if missing, invalid or compiled from another file version.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param plan_path: Full file path of the plan.
+    :type plan_path: str
+
+    :param digest: sha1 of the current graph file.
+    :type digest: str
+
+    :return: The plan or None.
+    :rtype: GraphPlan
+    """
+
+    if not os.path.isfile(plan_path):
+        return
+
+    try:
+        with open(plan_path) as plan_buffer:
+            _plan_data = json.load(plan_buffer)
+
+        if _plan_data.get("digest") != digest:
+            return
+
+        return GraphPlan.fromDict(_plan_data)
+    except Exception as err:
+        logUtils.getLogger().warning("Ignoring bad plan {}: {}".format(plan_path, err))
+
+
+def writePlan(plan_path, plan):
+    """
+    Saves a plan, failures are only logged since the plan can always be compiled again.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param plan_path: Full file path of the plan.
+    :type plan_path: str
+
+    :param plan: The plan to save.
+    :type plan: GraphPlan
+
+    :return: True if saved.
+    :rtype: bool
+    """
+
+    _tmp_path = "{}.{}.tmp".format(plan_path, os.getpid())
+
+    try:
+        if not os.path.isdir(os.path.dirname(plan_path)):
+            os.makedirs(os.path.dirname(plan_path))
+
+        with open(_tmp_path, "w") as plan_buffer:
+            json.dump(plan.toDict(), plan_buffer, separators=(",", ":"))
+
+        # other farm jobs may be reading the old one
+        if os.path.exists(plan_path):
+            os.remove(plan_path)
+        os.rename(_tmp_path, plan_path)
+    except Exception as err:
+        logUtils.getLogger().warning("Failed to cache plan {}: {}".format(plan_path, err))
+        if os.path.exists(_tmp_path):
+            os.remove(_tmp_path)
+        return False
+
+    return True
+
+
+def getPlan(json_path):
+    """
+    Returns the compiled plan of a graph file.
+    Uses the plan kept in graphCache, or the cached plan file when it was compiled
+    from the same file contents (sha1), compiles and caches a new one otherwise.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param json_path: Full file path of JSON file graph.
+    :type json_path: str
+
+    :return: The graph's plan.
+    :rtype: GraphPlan
+
+    - Example::
+
+        plan = graphPlan.getPlan(r"C:/graphs/publish.json")
+    """
+
+    if not os.path.exists(json_path):
+        raise IOError("File not found: {}".format(json_path))
+
+    # the file is read once, later runs and scene rebuilds reuse it
+    _entry = graphCache.CACHE.getEntry(json_path)
+    _plan = _entry["extras"].get("plan")
+    if _plan is not None:
+        return _plan
+
+    _plan_path = getPlanPath(json_path)
+    _plan = readPlan(_plan_path, _entry["digest"])
+
+    if _plan is None:
+        _datas = graphUtils.toTree(graphCache.CACHE.parse(_entry))
+        _plan = GraphPlan.compile(_datas.get("nodes", _datas), _entry["digest"])
+        writePlan(_plan_path, _plan)
+
+    _entry["extras"]["plan"] = _plan
+    return _plan
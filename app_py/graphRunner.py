@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+from traceback import format_exc
+
+from PySide2.QtCore import QThread
+from PySide2.QtCore import Signal
+
+
+class GraphRunner(QThread):
+    """
+    Runs a JSON graph on a worker thread so the editor stays responsive.
+    Node events of the Main instance are re-emitted as signals (runEvents.RunEvent),
+    connect them with Qt.QueuedConnection so the slots run on the GUI thread.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param app_obj: The Main instance that runs the graph, already set up.
+    :type app_obj: main.Main
+
+    :param json_path: Full file path of JSON file graph.
+    :type json_path: str
+
+    :param data_block: The datablock to be processed, owned by the run.
+    :type data_block: dict
+
+    - Example::
+
+        self.runner = GraphRunner(pyApp(), self.tree_json, self.data_block.copy())
+        self.runner.nodeFinished.connect(self._nodeFinished, Qt.QueuedConnection)
+        self.runner.start()
+    """
+
+    # runEvents.RunEvent of the node
+    nodeStarted = Signal(object)
+    nodeFinished = Signal(object)
+
+    # the Main instance once runJson returns
+    runFinished = Signal(object)
+
+    # the traceback if runJson raised
+    runFailed = Signal(str)
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, app_obj, json_path, data_block, parent=None):
+        super(GraphRunner, self).__init__(parent)
+
+        self.app = app_obj
+        self.json_path = json_path
+        self.data_block = data_block
+
+        self.app.subscribe(self._relay, ("node_started", "node_finished"))
+
+    def _relay(self, event):
+        """
+        Main subscriber, called from the event delivery thread.
+        """
+
+        if event.kind == "node_started":
+            self.nodeStarted.emit(event)
+        else:
+            self.nodeFinished.emit(event)
+
+    def cancel(self):
+        """
+        Asks the run to stop, nodes that are running are allowed to finish.
+        """
+
+        self.app.cancel()
+
+    def run(self):
+        try:
+            self.app.runJson(self.json_path, self.data_block)
+        except Exception:
+            self.runFailed.emit(format_exc())
+            return
+        finally:
+            self.app.unsubscribe(self._relay)
+
+        self.runFinished.emit(self.app)
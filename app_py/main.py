@@ -28,31 +28,187 @@ from __future__ import print_function
 
 import os
 import json
-import importlib
-
+import time
+import uuid
+import threading
+import multiprocessing
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from functools import partial
+from six.moves import queue
+from six.moves import cPickle
 from traceback import format_exc
 from pprint import pformat
 from resultObj import ResultObj
+from resultCache import ResultCache
+from dataBlock import DataBlock
 from nodeDummy import NodeDummy
+from runEvents import EventBus
+from runEvents import RunEvent
+import graphPlan
+import graphCache
+import moduleRegistry
 from utilities import logUtils
+from utilities import execUtils
+from utilities import profileUtils
 from app_py.configs import config_obj
+from app_py.configs import getOption
 from app_py.configs import test_block
 
+# per-process Main used by the "process" executor
+_WORKER = None
+
+# per-process settings and plan used by process batches
+_BATCH = None
+
 
 class Main(object):
     """
     This creates an app object for python.
     You use this for running Haw-dini with no UI.
     It could call a viewer object for you to view results.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param executor: How sibling branches are ran: "serial", "thread" or "process".
+                     Defaults to DETAILS "executor" in the config, or "serial".
+    :type executor: str
+
+    :param workers: Number of workers for "thread" or "process", defaults to CPU count.
+    :type workers: int
+
+    :notes: Branches only run in parallel when propagate is off,
+            a propagated datablock is shared and must be processed in order.
+            Run events are delivered to subscribers from their own thread, see subscribe.
+            profile sets what is measured per node (NodeDummy.metrics), see profileUtils.PROFILES.
+            Defaults to DETAILS "profile" in the config, or "time".
+            track_writes adds the datablock keys each node wrote to its metrics, for traces.
+            It copies propagated datablocks per node, defaults to DETAILS "track_writes" or off.
     """
 
-    def __init__(self):
+    def __init__(self, executor=None, workers=None):
         super(Main, self).__init__()
+
+        if executor is None:
+            executor = getOption("DETAILS", "executor", "serial")
+
+        if workers is None:
+            workers = int(getOption("DETAILS", "workers", 0))
+
+        if executor not in execUtils.EXECUTORS:
+            raise ValueError("Invalid executor: {}".format(executor))
+
         self.nodes_all = list()
         self.strict = False
         self.propagate = True
+        self.incremental = False
+        self.profile = getOption("DETAILS", "profile", "time")
+        self.track_writes = bool(int(getOption("DETAILS", "track_writes", 0)))
+        self.result_cache = None
+        self.executor = executor
+        self.workers = workers
+        self.plan = None
+        self.registry = moduleRegistry.REGISTRY
+        self._callables = dict()
+        self._cancel = threading.Event()
+        self._strict_stop = threading.Event()
+        self.events = EventBus()
+        self.run_id = None
         self.log = logUtils.getLogger()
 
+    def cancel(self):
+        """
+        Stops the run from starting any more nodes, can be called from any thread.
+        Nodes that are already running are allowed to finish.
+        A cancelled Main stays cancelled, use a new one for the next run.
+        """
+
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def subscribe(self, callback, kinds=None):
+        """
+        Adds a run event subscriber, see runEvents.
+        Subscribers are called in order from a delivery thread, never from the thread running nodes.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param callback: Any callable taking a runEvents.RunEvent.
+        :type callback: function
+
+        :param kinds: Event kinds to receive, defaults to all of runEvents.EVENTS.
+        :type kinds: tuple
+
+        :return: The callback, for unsubscribe.
+        :rtype: function
+
+        - Example::
+
+            _sink = runEvents.JsonlSink("C:/tmp/events.jsonl")
+            Spawn.subscribe(_sink)
+            Spawn.subscribe(lambda e: print(e.name, e.duration), ("node_finished",))
+        """
+
+        return self.events.subscribe(callback, kinds)
+
+    def unsubscribe(self, callback):
+        self.events.unsubscribe(callback)
+
+    def _emit(self, kind, index=None, dummy=None, status=None, duration=None, data=None):
+        """
+        Publishes a run event, does nothing if there are no subscribers.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param kind: One of runEvents.EVENTS.
+        :type kind: str
+
+        :param index: Plan index of the node, None for run events.
+        :type index: int
+
+        :param dummy: The node that finished.
+        :type dummy: NodeDummy
+
+        :param status: See runEvents.RunEvent.
+        :type status: str
+
+        :param duration: Seconds the node or run took.
+        :type duration: float
+
+        :param data: Extra details.
+        :type data: dict
+        """
+
+        if not self.events.active:
+            return
+
+        _name = None
+        _uuid = None
+        if index is not None:
+            _name = self.plan.nodes[index]["name"]
+            _uuid = self.plan.nodes[index]["uuid"]
+
+        self.events.publish(RunEvent(kind, time.time(), self.run_id, index, _name, _uuid,
+                                     status, duration, data, dummy))
+
+    def _emitSkipped(self, start, end, reason):
+        """
+        Publishes node_skipped for the plan indices start to end (not included).
+        """
+
+        if not self.events.active:
+            return
+
+        for _index in range(start, end):
+            self._emit("node_skipped", _index, status=reason)
+
     def runJson(self, json_path, data_block):
         """
         Call this to run a JSON file graph.
@@ -82,37 +238,325 @@ class Main(object):
 
         self.log.propagate = True
         self.log.info("Running JSON: {}".format(json_path))
-        self.nodes_all = list()
 
-        _datas = Main.getDataFromJson(json_path)
-        _nodes_data = _datas.get("nodes", _datas)
-        self._recurser(_nodes_data, data_block)
+        self.runPlan(graphPlan.getPlan(json_path), data_block)
+
+        if self.result_cache is not None and self.result_cache.unpruned:
+            self.result_cache.prune()
 
+        if self.profile != "off":
+            self._logProfile()
+
+        if self.cancelled:
+            self.log.warning("Cancelled after {} nodes".format(len(self.nodes_all)))
+
+        self.log.info("Modules: {}".format(self.registry.getStats()))
+        self.log.info("Graphs: {}".format(graphCache.CACHE.getStats()))
+        if self.result_cache is not None:
+            self.log.info("Cached results: {} replayed, {} ran".format(self.result_cache.hits,
+                                                                     self.result_cache.misses))
         self.log.info("Finished running JSON: {}".format(json_path))
         logUtils.kill()
         self.log = None
 
-    def _recurser(self, node_data, data_block):
+    def _logProfile(self, count=5):
         """
-        Recurses the next set of data.
+        Logs the slowest nodes of the last run and what measuring them cost.
 
         **parameters**, **types**, **return** and **return types**
 
-        :param node_data: Data of the original node.
-        :type node_data: dict
+        :param count: Number of nodes to log.
+        :type count: int
+        """
+
+        _measured = [_node for _node in self.nodes_all if _node.metrics]
+        _overhead = sum(_node.metrics["overhead"] for _node in _measured)
+        self.log.info("Profile ({}): {:.6f}s overhead over {} nodes".format(self.profile,
+                                                                           _overhead,
+                                                                           len(_measured)))
+
+        _measured.sort(key=lambda n: n.metrics["wall"], reverse=True)
+        for _node in _measured[:count]:
+            self.log.info("    {}: {}".format(_node.name, profileUtils.formatMetrics(_node.metrics)))
+
+    def runBatch(self, json_path, data_blocks, score_path, workers=None, executor=None, key=None):
+        """
+        Runs many datablocks through one graph, without the UI.
+        The graph is compiled once, each datablock is ran serially inside a worker
+        and its score is written as one JSON line as soon as it finishes.
+        Lines are written in finishing order, use "index" to match them to the input.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param json_path: Full file path of JSON file graph.
+        :type json_path: str
+
+        :param data_blocks: Datablocks to run, any iterable (a generator is fine).
+        :type data_blocks: iterable
+
+        :param score_path: Full path of the JSONL file to write, overwritten if it exists.
+        :type score_path: str
+
+        :param workers: Number of workers, defaults to self.workers (CPU count if 0).
+        :type workers: int
+
+        :param executor: "serial", "thread" or "process".
+                         Defaults to "thread" if self.executor is "thread", otherwise "process".
+        :type executor: str
+
+        :param key: A datablock key copied into each score line, for finding the asset.
+        :type key: str
+
+        :return: Number of datablocks per status (total, success, skip, error).
+        :rtype: dict
+
+        - Example::
+
+            blocks = ({"asset": _path} for _path in asset_paths)
+            Spawn.runBatch("C:/test/check.json", blocks, "C:/test/scores.jsonl", workers=8, key="asset")
+        """
+
+        if workers is None:
+            workers = self.workers
+
+        if executor is None:
+            executor = "thread" if self.executor == "thread" else "process"
+
+        if executor not in execUtils.EXECUTORS:
+            raise ValueError("Invalid executor: {}".format(executor))
+
+        self.log.info("Running batch: {} ({}, {} workers)".format(json_path,
+                                                                  executor,
+                                                                  execUtils.getWorkers(workers)))
+
+        _plan = graphPlan.getPlan(json_path)
+        _settings = (self.strict, self.propagate, self.incremental, self.profile, self.track_writes, key)
+        _tasks = enumerate(data_blocks)
+        _summary = {"total": 0, "success": 0, "skip": 0, "error": 0}
+
+        _score_dir = os.path.dirname(score_path)
+        if _score_dir and not os.path.isdir(_score_dir):
+            os.makedirs(_score_dir)
+
+        _pool = None
+        if executor == "process":
+            _pool = execUtils.getPool(executor, workers, _initBatchWorker, (_settings, _plan))
+            _scores = _pool.imap_unordered(_processBatchTask, _tasks, 8)
+        elif executor == "thread":
+            _pool = execUtils.getPool(executor, workers)
+            _scores = _pool.imap_unordered(partial(_batchTask, _settings, _plan), _tasks)
+        else:
+            _scores = (_batchTask(_settings, _plan, _task) for _task in _tasks)
+
+        try:
+            with open(score_path, "w") as _score_file:
+                for _score in _scores:
+                    _score_file.write(json.dumps(_score) + "\n")
+                    _score_file.flush()
+
+                    _summary["total"] += 1
+                    _summary[_score["status"]] += 1
+        finally:
+            if _pool is not None:
+                _pool.terminate()
+                _pool.join()
+
+        self.log.info("Finished batch: {} {}".format(score_path, _summary))
+        return _summary
+
+    def runPlan(self, plan, data_block):
+        """
+        Runs a compiled graph, see graphPlan.getPlan.
+        Unlike runJson, this does not close the log so it could be called many times.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param plan: The compiled graph.
+        :type plan: GraphPlan
+
+        :param data_block: A dict containing serializable information.
+        :type data_block: dict
+
+        :return: All the nodes that ran, in run order.
+        :rtype: list
+
+        - Example::
+
+            plan = graphPlan.getPlan("C:/test/sample.json")
+            Spawn.runPlan(plan, test_block)
+        """
+
+        self.nodes_all = list()
+        self.plan = plan
+        self._callables = dict()
+
+        if not len(plan):
+            return self.nodes_all
+
+        if self.profile not in profileUtils.PROFILES:
+            raise ValueError("Invalid profile: {}".format(self.profile))
+
+        self.run_id = uuid.uuid4().hex
+        self._emit("run_started", data={"nodes": len(plan),
+                                        "executor": self.executor,
+                                        "propagate": self.propagate,
+                                        "strict": self.strict,
+                                        "incremental": self.incremental,
+                                        "profile": self.profile})
+
+        # branches share the unchanged keys instead of copying the whole block per node
+        if not self.propagate and not isinstance(data_block, DataBlock):
+            data_block = DataBlock(data_block)
+
+        _tracing = self.profile == "memory"
+        if _tracing:
+            profileUtils.startTracing()
+
+        _start = time.time()
+        _status = "error"
+        try:
+            if self.executor != "serial" and not self.propagate:
+                self._runParallel(plan, data_block)
+            else:
+                self._runSerial(plan, data_block)
+
+            _status = self._runStatus()
+        finally:
+            if _tracing:
+                profileUtils.stopTracing()
+
+            self._emit("run_finished",
+                       status=_status,
+                       duration=time.time() - _start,
+                       data={"nodes": len(self.nodes_all)})
+
+            # delivers the last events, the delivery thread is not kept between runs
+            self.events.close()
+
+        return self.nodes_all
+
+    def _runStatus(self):
+        """
+        Returns the status of the last run: "cancelled", "error", "skip" or "success".
+        """
+
+        if self.cancelled:
+            return "cancelled"
+
+        if self._failedNodes():
+            return "error"
+
+        if [_node for _node in self.nodes_all if _node.skip]:
+            return "skip"
+
+        return "success"
+
+    def _runIndex(self, index, data_block):
+        """
+        Runs a node of the plan between its node_started and node_finished events.
+        Its metrics are measured here, so they include logging and result handling.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param index: Plan index of the node.
+        :type index: int
 
         :param data_block: The datablock to be processed.
         :type data_block: dict
 
-        :return: Returns a dict containing the node's information.
-        :rtype: dict
+        :return: The NodeDummy, the datablock for its out-nodes, its state and seconds it took.
+        :rtype: tuple
+        """
 
-        :return: If strict is set to True, recursion will stop on Error.
-        :rtype: None
+        self._emit("node_started", index)
+        # writes need a copy of a propagated block, only made for traces
+        _counters = profileUtils.snapshot(self.profile, data_block if self.track_writes else None)
+        _start = time.time()
+        _dummy, _copy_block, _state = self._runNode(self.plan.nodes[index], data_block)
+        _seconds = time.time() - _start
+        _dummy.metrics = profileUtils.measure(_counters, _copy_block if self.track_writes else None)
+        self._emit("node_finished", index, _dummy, _state, _seconds, _dummy.metrics or None)
+        return _dummy, _copy_block, _state, _seconds
+
+    def _runSerial(self, plan, data_block):
         """
+        Runs all nodes of a plan, in the same depth-first order as the graph.
+        The plan is flat, there is no recursion and no walking of nested dicts.
+        Skipped or failed nodes jump past their down-stream nodes.
 
-        if self.strict and self._failedNodes():
-            return
+        **parameters**, **types**, **return** and **return types**
+
+        :param plan: The compiled graph.
+        :type plan: GraphPlan
+
+        :param data_block: The datablock to be processed.
+        :type data_block: dict
+
+        :return: None
+        :rtype: NoneType
+
+        :notes: If strict is set to True, the run will stop on Error.
+                A cancelled run stops before its next node.
+        """
+
+        _failed = bool(self._failedNodes())
+        _blocks = dict()
+        _index = 0
+
+        while _index < len(plan):
+            if self.strict and _failed:
+                self._emitSkipped(_index, len(plan), "strict")
+                return
+
+            if self.cancelled:
+                self._emitSkipped(_index, len(plan), "cancelled")
+                return
+
+            _parent = plan.parents[_index]
+            if _parent < 0:
+                _block = data_block
+            else:
+                _block = _blocks[_parent]
+
+                # last out-node, the parent's block is not needed anymore
+                if plan.children[_parent][-1] == _index:
+                    del _blocks[_parent]
+
+            _dummy, _copy_block, _state, _seconds = self._runIndex(_index, _block)
+
+            # starter has no module to run
+            if _state != "start":
+                self.nodes_all.append(_dummy)
+
+            if _state == "error":
+                _failed = True
+
+            if _state not in ("start", "success"):
+                self._emitSkipped(_index + 1, plan.ends[_index], _state)
+                _index = plan.ends[_index]
+                continue
+
+            if plan.children[_index]:
+                _blocks[_index] = _copy_block
+
+            _index += 1
+
+    def _runNode(self, node_data, data_block):
+        """
+        Runs a single node's module, does not run its out-nodes.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param node_data: Data of the original node.
+        :type node_data: dict
+
+        :param data_block: The datablock to be processed.
+        :type data_block: dict
+
+        :return: The NodeDummy, the datablock for its out-nodes and its state.
+                 State is one of "start", "success", "error" or "skip".
+        :rtype: tuple
+        """
 
         _run_result = None
         self.log.info("")
@@ -131,16 +575,20 @@ class Main(object):
 
         # if there's no commands (starter)
         if _dummy.command is None:
-            for _dummy_dict in _dummy.out_nodes:
-                self._recurser(_dummy_dict, _copy_block)
-            return
+            return _dummy, _copy_block, "start"
+
+        # unchanged nodes are replayed on incremental runs
+        _fingerprint = None
+        _replayed = False
+        if self.incremental:
+            _fingerprint, _run_result = self._replayNode(_dummy, _copy_block)
+            _replayed = _run_result is not None
 
         # run
         _ex_msgs = ["No Exception message..."]
         try:
-            _proc_mod = importlib.import_module(_dummy.command)
-            _run_result = _proc_mod.main(_copy_block)
-            del(_proc_mod)
+            if not _replayed:
+                _run_result = self._getCallable(_dummy.command)(_copy_block)
         except Exception as err:
             self.log.info("=" * 88)
             _err_msg = "Failed module import: {}".format(_dummy.command)
@@ -152,7 +600,7 @@ class Main(object):
             self.log.error("=" * 88)
 
         # used for safety
-        if "resultObj" not in repr(_run_result) and not isinstance(_run_result, dict) and _run_result is None:
+        if "resultObj" not in repr(_run_result) and not isinstance(_run_result, Mapping) and _run_result is None:
             _result_details = "{} returned {}".format(_dummy.name, str(_run_result), str(type(_run_result)))
             _run_result = ResultObj("error")
             _run_result.addMessage(_result_details)
@@ -161,8 +609,9 @@ class Main(object):
             for err in _ex_msgs:
                 _run_result.addMessage(err)
 
-        # after running, add to nodes list
-        self.nodes_all.append(_dummy)
+        if _replayed:
+            _dummy.cached = True
+            _dummy.messages.append("Replayed cached result (incremental run)")
 
         # used for failed or skip
         if "resultObj" in repr(_run_result):
@@ -179,27 +628,237 @@ class Main(object):
 
                 if self.strict:
                     _dummy.messages.append("Operation stopped")
-                    return
-            elif _run_result.getStatus() == "skip":
-                _dummy.skip = True
-                _dummy.messages.append("Skipped")
 
-                for _warning in _dummy.messages:
-                    self.log.warning(_warning)
+                return _dummy, _copy_block, "error"
+
+            if _fingerprint and not _replayed:
+                self.getResultCache().put(_fingerprint, "skip", _copy_block, _run_result)
+
+            _dummy.skip = True
+            _dummy.messages.append("Skipped")
+
+            for _warning in _dummy.messages:
+                self.log.warning(_warning)
 
             # don't run down-stream nodes
-            return _dummy
+            return _dummy, _copy_block, "skip"
 
-        if not isinstance(_run_result, dict):
+        if not isinstance(_run_result, Mapping):
             raise TypeError("Escaped results filtering: {}".format(_dummy.name))
 
-        # run out-nodes
-        for _dummy_out in _dummy.out_nodes:
-            self._recurser(_dummy_out, _copy_block)
+        if _fingerprint and not _replayed:
+            self.getResultCache().put(_fingerprint, "success", _copy_block)
 
-        # done
+        # out-nodes never touch this dummy's messages, safe to add now
         _dummy.messages.append("Success")
-        return _dummy
+        return _dummy, _copy_block, "success"
+
+    def _runParallel(self, plan, data_block):
+        """
+        Runs sibling branches at the same time using a thread or process pool.
+        Each branch gets its own copy of the datablock (propagate is off).
+        nodes_all is sorted back to the same order a serial run gives.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param plan: The compiled graph.
+        :type plan: GraphPlan
+
+        :param data_block: The datablock to be processed.
+        :type data_block: dict
+
+        :return: None
+        :rtype: NoneType
+
+        :notes: On strict mode or once cancelled no new nodes are started and queued ones are dropped,
+                nodes that are already running are allowed to finish.
+        """
+
+        self.log.info("Executor: {} ({} workers)".format(self.executor,
+                                                        execUtils.getWorkers(self.workers)))
+
+        _done = queue.Queue()
+        _finished = dict()
+        _failed = list()
+        _pending = [0]
+
+        # set by the first failed node of a strict run, seen by the workers
+        if self.executor == "process":
+            self._strict_stop = multiprocessing.Event()
+            _pool = execUtils.getPool(self.executor,
+                                      self.workers,
+                                      _initProcessWorker,
+                                      (self.strict, self.propagate, self.incremental, self.profile,
+                                       self.track_writes, plan, self._strict_stop))
+        else:
+            self._strict_stop = threading.Event()
+            _pool = execUtils.getPool(self.executor, self.workers)
+
+        def _submit(index, block):
+            _pending[0] += 1
+            _callback = lambda res: _done.put((index, res))
+
+            if self.executor == "process":
+                # the pool drops pickling errors without a callback, the run would wait forever
+                try:
+                    _pickled = cPickle.dumps(block, cPickle.HIGHEST_PROTOCOL)
+                except Exception:
+                    _callback(("raise", format_exc()))
+                    return
+
+                # workers can't reach the subscribers, started means queued here
+                self._emit("node_started", index)
+                _pool.apply_async(_processNodeTask, (index, _pickled), callback=_callback)
+            else:
+                _pool.apply_async(_threadNodeTask, (self, index, block), callback=_callback)
+
+        try:
+            _starter, _copy_block, _state, _seconds = self._runIndex(0, data_block)
+            if _state != "start":
+                _finished[0] = _starter
+
+            if _state == "error":
+                _failed.append(_starter)
+                self._strict_stop.set()
+
+            if _state in ("start", "success"):
+                for _child in plan.children[0]:
+                    _submit(_child, _copy_block)
+            else:
+                self._emitSkipped(1, plan.ends[0], _state)
+
+            while _pending[0]:
+                _index, _res = _done.get()
+                _pending[0] -= 1
+
+                _status, _payload = _res
+                if _status == "raise":
+                    raise RuntimeError("Node failed in {} executor:\n{}".format(self.executor, _payload))
+
+                if _status == "cancel":
+                    self._emitSkipped(_index, plan.ends[_index], "cancelled")
+                    continue
+
+                if _status == "strict":
+                    self._emitSkipped(_index, plan.ends[_index], "strict")
+                    continue
+
+                if self.executor == "process":
+                    _payload = cPickle.loads(_payload)
+
+                _dummy, _copy_block, _state, _seconds = _payload
+                _finished[_index] = _dummy
+
+                if self.executor == "process":
+                    self._emit("node_finished", _index, _dummy, _state, _seconds, _dummy.metrics or None)
+
+                if _state == "error":
+                    _failed.append(_dummy)
+
+                if _state != "success":
+                    self._emitSkipped(_index + 1, plan.ends[_index], _state)
+                    continue
+
+                if self.strict and _failed:
+                    self._emitSkipped(_index + 1, plan.ends[_index], "strict")
+                    continue
+
+                if self.cancelled:
+                    self._emitSkipped(_index + 1, plan.ends[_index], "cancelled")
+                    continue
+
+                for _child in plan.children[_index]:
+                    _submit(_child, _copy_block)
+        finally:
+            _pool.close()
+            _pool.join()
+
+        # plan indices are in serial (depth-first) order
+        self.nodes_all = [_finished[i] for i in sorted(_finished)]
+
+    def _replayNode(self, dummy, data_block):
+        """
+        Looks for a stored result of a node with the same inputs.
+        If found, data_block is updated in place with the stored output.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param dummy: The node about to run.
+        :type dummy: NodeDummy
+
+        :param data_block: The datablock the node would be given.
+        :type data_block: dict
+
+        :return: The fingerprint (None if it can't be made) and the replayed result (None if not stored).
+        :rtype: tuple
+        """
+
+        try:
+            _source_hash = self.registry.getSourceHash(dummy.command)
+        except Exception:
+            # let the run report it
+            return None, None
+
+        _fingerprint = ResultCache.fingerprint(dummy.obj_data, data_block, _source_hash)
+        if _fingerprint is None:
+            return None, None
+
+        _cached = self.getResultCache().get(_fingerprint)
+        if _cached is None:
+            return _fingerprint, None
+
+        # propagated datablocks are shared by down-stream nodes
+        data_block.clear()
+        data_block.update(_cached["block"])
+
+        if _cached["status"] == "skip":
+            return _fingerprint, ResultObj.fromDict(_cached["result"])
+
+        return _fingerprint, data_block
+
+    def getResultCache(self):
+        """
+        Returns the result cache used by incremental runs, created on first use.
+
+        :return: The result cache.
+        :rtype: ResultCache
+        """
+
+        if self.result_cache is None:
+            self.result_cache = ResultCache()
+
+        return self.result_cache
+
+    def _getCallable(self, command):
+        """
+        Returns the main function of a node's command.
+        Resolved once per run through the module registry.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param command: Module path of the node, "custom.processWhat".
+        :type command: str
+
+        :return: The module's main function.
+        :rtype: function
+        """
+
+        _main = self._callables.get(command)
+        if _main is None:
+            _main = self.registry.resolve(command)
+            self._callables[command] = _main
+
+        return _main
+
+    def getScore(self):
+        """
+        Returns the score of the last run, the same format the JSX runner writes.
+
+        :return: A list of dicts, one per node ran.
+        :rtype: list
+        """
+
+        return [_node.toScore() for _node in self.nodes_all]
 
     def _failedNodes(self):
         """
@@ -221,10 +880,127 @@ class Main(object):
         if not os.path.exists(json_file):
             raise IOError("File not found: {}".format(json_file))
 
-        with open(json_file) as json_buffer:
-            out = json.load(json_buffer)
+        return graphCache.CACHE.read(json_file)
+
+
+def _threadNodeTask(main_obj, index, data_block):
+    """
+    Pool task for the "thread" executor.
+    Exceptions are returned so they could be raised on the main thread.
+    Queued nodes of a cancelled run, or of a strict run with a failed node, are dropped.
+    """
+
+    if main_obj.cancelled:
+        return "cancel", None
+
+    if main_obj.strict and main_obj._strict_stop.is_set():
+        return "strict", None
+
+    try:
+        _result = main_obj._runIndex(index, data_block)
+    except Exception:
+        return "raise", format_exc()
+
+    if _result[2] == "error":
+        main_obj._strict_stop.set()
+
+    return "ok", _result
+
+
+def _initProcessWorker(strict, propagate, incremental, profile, track_writes, plan, strict_stop):
+    """
+    Pool initializer for the "process" executor.
+    Creates the Main instance that runs nodes in this process.
+    The plan is sent once per worker, tasks only send node indices.
+    """
+
+    global _WORKER
+
+    _WORKER = Main(executor="serial")
+    _WORKER.strict = strict
+    _WORKER.propagate = propagate
+    _WORKER.incremental = incremental
+    _WORKER.profile = profile
+    _WORKER.track_writes = track_writes
+    _WORKER.plan = plan
+    _WORKER._callables = dict()
+    _WORKER._strict_stop = strict_stop
+
+
+def _processNodeTask(index, pickled_block):
+    """
+    Pool task for the "process" executor.
+    The datablock must be picklable to be sent to and from the workers.
+    It comes pickled and the result is pickled here, so a failure is returned
+    as an error instead of being lost in the pool.
+    """
+
+    try:
+        _status, _payload = _threadNodeTask(_WORKER, index, cPickle.loads(pickled_block))
+        if _status == "ok":
+            _payload = cPickle.dumps(_payload, cPickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return "raise", format_exc()
+
+    return _status, _payload
+
+
+def _batchTask(settings, plan, task):
+    """
+    Runs one datablock of a batch and returns its score line.
+    Exceptions are recorded in the score so the rest of the batch keeps going.
+    """
+
+    _strict, _propagate, _incremental, _profile, _track_writes, _key = settings
+    _index, _block = task
+
+    _main = Main(executor="serial")
+    _main.strict = _strict
+    _main.propagate = _propagate
+    _main.incremental = _incremental
+    _main.profile = _profile
+    _main.track_writes = _track_writes
+
+    _score = {"index": _index}
+    if _key is not None:
+        _score[_key] = _block.get(_key)
+
+    _start = time.time()
+    try:
+        _main.runPlan(plan, _block)
+        _nodes = _main.getScore()
+        if [_node for _node in _nodes if _node["error"]]:
+            _score["status"] = "error"
+        elif [_node for _node in _nodes if _node["skip"]]:
+            _score["status"] = "skip"
+        else:
+            _score["status"] = "success"
+    except Exception:
+        _nodes = _main.getScore()
+        _score["status"] = "error"
+        _score["exception"] = format_exc()
+
+    _score["seconds"] = round(time.time() - _start, 4)
+    _score["nodes"] = _nodes
+    return _score
+
+
+def _initBatchWorker(settings, plan):
+    """
+    Pool initializer for process batches, the plan is sent once per worker.
+    """
+
+    global _BATCH
+
+    _BATCH = (settings, plan)
+
+
+def _processBatchTask(task):
+    """
+    Pool task for process batches.
+    """
 
-        return out
+    return _batchTask(_BATCH[0], _BATCH[1], task)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import io
+import os
+import json
+
+from app_py.configs import config_obj
+from app_py.configs import getOption
+
+# module file extensions by language
+EXTENSIONS = {"py": ["py", "pyc"],
+              "jsx": ["jsxbin", "jsxinc"]
+              }
+
+# bump when the index layout changes, older indexes are rebuilt
+INDEX_VERSION = 1
+
+
+def getIndexPath(language):
+    """
+    Returns where the catalog index of a language is saved.
+    In the log folder unless PATHS "catalog_path" (a folder) is set in the config.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param language: "py" or "jsx".
+    :type language: str
+
+    :return: Full file path of the index.
+    :rtype: str
+    """
+
+    _root = getOption("PATHS", "catalog_path", config_obj.get("PATHS", "log_path"))
+    return os.path.join(_root, "modules_{}.catalog".format(language))
+
+
+def _getMtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0
+
+
+class ModuleCatalog(object):
+    """
+    Index of the modules under the "mod_paths" folders, used by the editor's module tree.
+    Saved to a file, so later starts only check the mtimes of the folders
+    and rescan the branches that changed. Descriptions are read the first time they are asked for.
+
+    A branch is a folder in a module root, a module is a file in a branch.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param roots: Module root folders, in priority order.
+    :type roots: list
+
+    :param extensions: File extensions of the modules, see EXTENSIONS.
+    :type extensions: list
+
+    :param index_path: Full file path of the index, None keeps it in memory only.
+    :type index_path: str
+
+    - Example::
+
+        _catalog = ModuleCatalog(config_obj.get("PATHS", "mod_paths"), EXTENSIONS["py"], getIndexPath("py"))
+        _catalog.load()
+        _catalog.refresh()
+        _catalog.save()
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, roots, extensions, index_path=None):
+        self.roots = [os.path.abspath(r) for r in roots]
+        self.extensions = sorted(extensions)
+        self.index_path = index_path
+        self._roots = dict()
+        self._branches = dict()
+        self._modules = dict()
+        self._changed = False
+
+    def load(self):
+        """
+        Reads the saved index, an index made for other extensions is ignored.
+
+        :return: True if the index was loaded.
+        :rtype: bool
+        """
+
+        if not self.index_path or not os.path.isfile(self.index_path):
+            return False
+
+        try:
+            with io.open(self.index_path, encoding="utf-8") as _index_file:
+                _index = json.load(_index_file)
+        except (IOError, OSError, ValueError):
+            return False
+
+        if _index.get("version") != INDEX_VERSION or _index.get("extensions") != self.extensions:
+            return False
+
+        self._roots = _index["roots"]
+        self._branches = _index["branches"]
+        self._modules = dict()
+
+        for _branch in self._branches.values():
+            for _module in _branch["modules"]:
+                self._modules[_module["path"]] = _module
+
+        self._changed = False
+        return True
+
+    def save(self):
+        """
+        Writes the index if anything changed since it was loaded or saved.
+
+        :return: True if written.
+        :rtype: bool
+        """
+
+        if not self.index_path or not self._changed:
+            return False
+
+        _index = {"version": INDEX_VERSION,
+                  "extensions": self.extensions,
+                  "roots": self._roots,
+                  "branches": self._branches}
+
+        _tmp_path = "{}.{}.tmp".format(self.index_path, os.getpid())
+
+        try:
+            if not os.path.isdir(os.path.dirname(self.index_path)):
+                os.makedirs(os.path.dirname(self.index_path))
+
+            with open(_tmp_path, "w") as _index_file:
+                json.dump(_index, _index_file, separators=(",", ":"))
+
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)
+            os.rename(_tmp_path, self.index_path)
+        except (IOError, OSError) as err:
+            print("Failed to save module catalog {}: {}".format(self.index_path, err))
+            if os.path.exists(_tmp_path):
+                os.remove(_tmp_path)
+            return False
+
+        self._changed = False
+        return True
+
+    def refresh(self, paths=None):
+        """
+        Brings the index up to date, only folders with a new mtime are listed again.
+        Modules edited in place don't change their folder's mtime, the modules of
+        branches given in paths (reported by ModuleWatcher) are checked one by one.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param paths: Only check these roots or branches, None checks every folder.
+        :type paths: list
+
+        :return: Module dicts under the keys "added", "removed" and "updated".
+        :rtype: dict
+        """
+
+        _changes = {"added": list(), "removed": list(), "updated": list()}
+        _paths = None if paths is None else set(os.path.abspath(p) for p in paths)
+
+        for _root in self.roots:
+            _root_info = self._roots.get(_root)
+
+            if _paths is None or _root in _paths or _root_info is None:
+                _mtime = _getMtime(_root)
+
+                if _root_info is None or _root_info["mtime"] != _mtime:
+                    _root_info = {"mtime": _mtime, "branches": self._listBranches(_root)}
+                    _old_info = self._roots.get(_root)
+                    self._roots[_root] = _root_info
+                    self._changed = True
+
+                    # branches that are gone
+                    for _branch_path in (_old_info or dict()).get("branches", list()):
+                        if _branch_path not in _root_info["branches"]:
+                            self._dropBranch(_branch_path, _changes)
+
+            for _branch_path in _root_info["branches"]:
+                if _paths is None or _root in _paths or _branch_path in _paths:
+                    self._refreshBranch(_root, _branch_path, _changes, _paths is not None and _branch_path in _paths)
+
+        return _changes
+
+    def getBranches(self):
+        """
+        Returns the branches of every root, in root order then by name.
+        Keys: name, root, path, empty (no files at all) and modules (module dicts).
+
+        :return: Branch dicts.
+        :rtype: list
+        """
+
+        _branches = list()
+
+        for _root in self.roots:
+            for _branch_path in self._roots.get(_root, dict()).get("branches", list()):
+                if _branch_path in self._branches:
+                    _branches.append(self._branches[_branch_path])
+
+        return _branches
+
+    def getModule(self, module_path):
+        """
+        Returns a module dict, keys: name, file, path, branch, icon and mtime.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param module_path: Full file path of the module.
+        :type module_path: str
+
+        :return: The module dict, None if it's not in the catalog.
+        :rtype: dict
+        """
+
+        return self._modules.get(os.path.abspath(module_path))
+
+    def getDescription(self, module_path):
+        """
+        Returns the text of a module's description file, "descriptions/<module>.txt".
+        Read on first use and again only when the file changed, the module path is returned if there is none.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param module_path: Full file path of the module.
+        :type module_path: str
+
+        :return: The description.
+        :rtype: str
+        """
+
+        _module = self.getModule(module_path) or dict()
+        _name = os.path.basename(module_path).split(".")[0]
+        _desc_path = os.path.join(os.path.dirname(module_path), "descriptions", "{}.txt".format(_name))
+        _mtime = _getMtime(_desc_path)
+
+        if not _mtime:
+            return module_path
+
+        if _module.get("desc_mtime") == _mtime:
+            return _module["description"]
+
+        with io.open(_desc_path, encoding="utf-8", errors="replace") as _desc_file:
+            _desc = "\n".join(_desc_file.readlines()).strip("\n")
+
+        if _module:
+            _module["description"] = _desc
+            _module["desc_mtime"] = _mtime
+            self._changed = True
+
+        return _desc
+
+    def _listBranches(self, root):
+        try:
+            _names = sorted(os.listdir(root))
+        except OSError:
+            return list()
+
+        _branches = list()
+        for _name in _names:
+            _path = os.path.join(root, _name)
+            if _name.startswith("_") or not os.path.isdir(_path):
+                continue
+
+            _branches.append(_path)
+
+        return _branches
+
+    def _getIcon(self, branch_path, module_name, icon_names):
+        for _icon_name in ("{}.png".format(module_name), "_default.png"):
+            if os.path.normcase(_icon_name) in icon_names:
+                return os.path.join(branch_path, "icons", _icon_name)
+
+        return config_obj.get("PATHS", "default_icon")
+
+    def _refreshBranch(self, root, branch_path, changes, check_modules=False):
+        _mtime = _getMtime(branch_path)
+        _icons_mtime = _getMtime(os.path.join(branch_path, "icons"))
+        _old = self._branches.get(branch_path)
+
+        if _old is not None and _old["mtime"] == _mtime and _old["icons_mtime"] == _icons_mtime:
+            # a stat per module, only for branches the watcher saw a file change in
+            if not check_modules or all(_getMtime(m["path"]) == m["mtime"] for m in _old["modules"]):
+                return
+
+        try:
+            _files = sorted(os.listdir(branch_path))
+        except OSError:
+            _files = list()
+
+        try:
+            _icon_names = set(os.path.normcase(n) for n in os.listdir(os.path.join(branch_path, "icons")))
+        except OSError:
+            _icon_names = set()
+
+        _old_modules = dict((m["path"], m) for m in (_old or dict()).get("modules", list()))
+        _modules = list()
+        _names = set()
+
+        for _file in _files:
+            _name = _file.split(".")[0]
+
+            if _file.startswith("_") or _name in _names:
+                continue
+
+            if _file.split(".")[-1] not in self.extensions:
+                continue
+
+            _path = os.path.join(branch_path, _file)
+            _module = {"name": _name,
+                       "file": _file,
+                       "path": _path,
+                       "branch": os.path.basename(branch_path),
+                       "icon": self._getIcon(branch_path, _name, _icon_names),
+                       "mtime": _getMtime(_path)}
+
+            _old_module = _old_modules.pop(_path, None)
+            if _old_module is None:
+                changes["added"].append(_module)
+            elif _old_module["icon"] != _module["icon"] or _old_module["mtime"] != _module["mtime"]:
+                changes["updated"].append(_module)
+            else:
+                _module = _old_module
+
+            _names.add(_name)
+            _modules.append(_module)
+            self._modules[_path] = _module
+
+        for _path, _module in _old_modules.items():
+            self._modules.pop(_path, None)
+            changes["removed"].append(_module)
+
+        self._branches[branch_path] = {"name": os.path.basename(branch_path),
+                                       "root": root,
+                                       "path": branch_path,
+                                       "mtime": _mtime,
+                                       "icons_mtime": _icons_mtime,
+                                       "empty": not _files,
+                                       "modules": _modules}
+        self._changed = True
+
+    def _dropBranch(self, branch_path, changes):
+        _old = self._branches.pop(branch_path, None)
+        if _old is None:
+            return
+
+        for _module in _old["modules"]:
+            self._modules.pop(_module["path"], None)
+            changes["removed"].append(_module)
+
+        self._changed = True
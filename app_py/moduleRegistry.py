@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+import hashlib
+import importlib
+import threading
+
+from timeit import default_timer
+from collections import OrderedDict
+from six.moves import reload_module
+from app_py.configs import getOption
+
+
+class ModuleRegistry(object):
+    """
+    Resolves node commands to their module's main function.
+    Keeps the functions in a bounded (least recently used) cache,
+    modules are only reloaded when their source file changed on disk.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param max_size: Maximum number of commands kept, defaults to 256.
+    :type max_size: int
+
+    - Example::
+
+        _main = moduleRegistry.REGISTRY.resolve("custom.processWhat")
+        _main(data_block)
+        print(moduleRegistry.REGISTRY.getStats())
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, max_size=None):
+        if max_size is None:
+            max_size = 256
+
+        self.max_size = max(1, int(max_size))
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = dict()
+        self.resetStats()
+
+    def resolve(self, command):
+        """
+        Returns the main function of a command's module.
+        Imports the module on first use, reloads it if its source's mtime or size changed
+        and the contents (sha1) are different.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param command: Module path of the node, "custom.processWhat".
+        :type command: str
+
+        :return: The module's main function.
+        :rtype: function
+        """
+
+        _start = default_timer()
+
+        with self._lock:
+            try:
+                return self._resolve(command)
+            finally:
+                self._stats["resolves"] += 1
+                self._stats["resolve_time"] += default_timer() - _start
+
+    def _resolve(self, command):
+        """
+        :meta private:
+        """
+
+        _entry = self._cache.pop(command, None)
+
+        if _entry is None:
+            self._stats["misses"] += 1
+            _module = importlib.import_module(command)
+            _entry = self._newEntry(_module)
+        else:
+            _module = _entry["module"]
+            _signature = ModuleRegistry._getSignature(_entry["path"])
+
+            if _signature == _entry["signature"]:
+                self._stats["hits"] += 1
+            elif _entry["path"] and ModuleRegistry._getHash(_entry["path"]) == _entry["hash"]:
+                # touched but not edited
+                self._stats["hits"] += 1
+                _entry["signature"] = _signature
+            else:
+                self._stats["reloads"] += 1
+                _module = reload_module(_module)
+                _entry = self._newEntry(_module)
+
+        self._cache[command] = _entry
+
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+            self._stats["evictions"] += 1
+
+        return _entry["main"]
+
+    def getSourceHash(self, command):
+        """
+        Returns the sha1 of a command's source file, resolving it if needed.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param command: Module path of the node, "custom.processWhat".
+        :type command: str
+
+        :return: sha1 hex digest, None if the module has no source file.
+        :rtype: str
+        """
+
+        with self._lock:
+            if command not in self._cache:
+                self.resolve(command)
+
+            return self._cache[command]["hash"]
+
+    def getStats(self):
+        """
+        Returns the resolve statistics.
+        Keys: resolves, hits, misses, reloads, evictions, cached, resolve_time (seconds).
+
+        :return: A copy of the statistics.
+        :rtype: dict
+        """
+
+        _out = dict(self._stats)
+        _out["cached"] = len(self._cache)
+        return _out
+
+    def resetStats(self):
+        """
+        Sets all statistics back to 0.
+        """
+
+        for _key in ("resolves", "hits", "misses", "reloads", "evictions"):
+            self._stats[_key] = 0
+        self._stats["resolve_time"] = 0.0
+
+    def clear(self):
+        """
+        Forgets all cached functions, modules are not removed from sys.modules.
+        """
+
+        self._cache.clear()
+
+    def _newEntry(self, module):
+        """
+        :meta private:
+        """
+
+        _path = ModuleRegistry._getSourcePath(module)
+
+        return {"module": module,
+                "main": module.main,
+                "path": _path,
+                "signature": ModuleRegistry._getSignature(_path),
+                "hash": ModuleRegistry._getHash(_path)}
+
+    @staticmethod
+    def _getSourcePath(module):
+        """
+        :meta private:
+        """
+
+        _path = getattr(module, "__file__", None)
+        if not _path:
+            return
+
+        _root, _ext = os.path.splitext(_path)
+        if _ext in (".pyc", ".pyo") and os.path.exists(_root + ".py"):
+            return _root + ".py"
+
+        return _path
+
+    @staticmethod
+    def _getSignature(path):
+        """
+        :meta private:
+        """
+
+        if not path:
+            return
+
+        try:
+            _stat = os.stat(path)
+        except OSError:
+            return
+
+        return _stat.st_mtime, _stat.st_size
+
+    @staticmethod
+    def _getHash(path):
+        """
+        :meta private:
+        """
+
+        if not path:
+            return
+
+        try:
+            with open(path, "rb") as source_buffer:
+                return hashlib.sha1(source_buffer.read()).hexdigest()
+        except (IOError, OSError):
+            return
+
+
+# shared by every run in this process, so edits are picked up in long editor sessions
+REGISTRY = ModuleRegistry(getOption("DETAILS", "module_cache_size"))
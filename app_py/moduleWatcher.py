@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+
+from PySide2.QtCore import QObject
+from PySide2.QtCore import QTimer
+from PySide2.QtCore import Signal
+from PySide2.QtCore import QFileSystemWatcher
+
+# sub folders of a branch that change its modules' icons and descriptions
+_BRANCH_FOLDERS = ("icons", "descriptions")
+
+
+class ModuleWatcher(QObject):
+    """
+    Watches the folders, modules and descriptions of a module catalog while the editor is open.
+    Files are watched too, editing one in place doesn't change its folder's mtime on Linux or macOS.
+    Changes are collected for "delay" milliseconds, then only the changed folders
+    are refreshed in the catalog and "changed" is emitted with the result.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param catalog: The catalog to keep up to date.
+    :type catalog: moduleCatalog.ModuleCatalog
+
+    :param delay: Milliseconds to wait for more changes, defaults to 300.
+    :type delay: int
+
+    - Example::
+
+        self.module_watcher = ModuleWatcher(self.catalog)
+        self.module_watcher.changed.connect(self._updateModuleTree)
+    """
+
+    # catalog.refresh() changes, plus "descriptions" (branch paths)
+    changed = Signal(dict)
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, catalog, delay=None, parent=None):
+        if delay is None:
+            delay = 300
+
+        super(ModuleWatcher, self).__init__(parent)
+
+        self.catalog = catalog
+        self._pending = set()
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._queue)
+        self._watcher.fileChanged.connect(self._queueFile)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.apply)
+
+        self.watchAll()
+
+    def watchAll(self):
+        """
+        Watches the roots, branches and their icons and descriptions folders,
+        plus the module and description files.
+        Paths already watched are skipped, removed ones are dropped by Qt.
+        Files saved by replacing them are dropped too, so this is called again after each apply.
+        """
+
+        _folders = list(self.catalog.roots)
+        _files = list()
+
+        for _branch in self.catalog.getBranches():
+            _folders.append(_branch["path"])
+            _folders.extend(os.path.join(_branch["path"], f) for f in _BRANCH_FOLDERS)
+            _files.extend(m["path"] for m in _branch["modules"])
+            _files.extend(self._listDescriptions(_branch["path"]))
+
+        _watched = set(self._watcher.directories())
+        _new = [f for f in _folders if f not in _watched and os.path.isdir(f)]
+
+        _watched = set(self._watcher.files())
+        _new.extend(f for f in _files if f not in _watched and os.path.isfile(f))
+
+        if _new:
+            self._watcher.addPaths(_new)
+
+    def apply(self):
+        """
+        Refreshes the catalog for the folders that changed, emits "changed" if any module did.
+        Called by the timer, can be called to apply pending changes right away.
+
+        :return: The changes.
+        :rtype: dict
+        """
+
+        self._timer.stop()
+        _pending = self._pending
+        self._pending = set()
+
+        _paths = set()
+        _descriptions = set()
+
+        for _folder in _pending:
+            _parent, _name = os.path.split(_folder)
+
+            if _name in _BRANCH_FOLDERS:
+                _paths.add(_parent)
+                if _name == "descriptions":
+                    _descriptions.add(_parent)
+            else:
+                _paths.add(_folder)
+
+        _changes = self.catalog.refresh(_paths)
+        _changes["descriptions"] = sorted(_descriptions)
+
+        self.watchAll()
+        self.catalog.save()
+
+        if any(_changes.values()):
+            self.changed.emit(_changes)
+
+        return _changes
+
+    def _queue(self, folder):
+        self._pending.add(os.path.abspath(folder))
+        self._timer.start()
+
+    def _queueFile(self, file_path):
+        # refreshes the branch or descriptions folder of the file
+        self._queue(os.path.dirname(file_path))
+
+    def _listDescriptions(self, branch_path):
+        _folder = os.path.join(branch_path, "descriptions")
+
+        try:
+            _names = os.listdir(_folder)
+        except OSError:
+            return list()
+
+        return [os.path.join(_folder, n) for n in _names if n.endswith(".txt")]
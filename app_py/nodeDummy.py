@@ -55,13 +55,33 @@ class NodeDummy(object):
         self.error = False
         self.skip = False
         self.dirty = False
+        self.cached = False
         self.state_label = None
 
         self._errors_list = list()
         self.messages = list()
+        self.metrics = dict()
 
     def setErrors(self, errors):
         self._errors_list = errors
 
     def getErrors(self):
         return self._errors_list
+
+    def toScore(self):
+        """
+        Returns the node's result in the score format read by nagare.Viewer.
+
+        :return: Dict with name, uuid, error, skip, dirty, messages, errors
+                 and metrics (see profileUtils.measure, empty if profiling was off).
+        :rtype: dict
+        """
+
+        return {"name": self.name,
+                "uuid": self.uuid,
+                "error": self.error,
+                "skip": self.skip,
+                "dirty": self.dirty,
+                "messages": self.messages,
+                "errors": self.getErrors(),
+                "metrics": self.metrics}
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+from app_py.configs import config_obj
+from app_py.configs import getOption
+from dataBlock import DataBlock
+
+# node keys that don't change what a node computes
+_LAYOUT_KEYS = ("name", "uuid", "x", "y", "icon", "description", "out_nodes", "in_node")
+
+# put() prunes after this many stored results
+_PRUNE_EVERY = 1000
+
+
+def _toJson(data, sort_keys=False):
+    """
+    Returns data as JSON, None if it doesn't load back the same.
+    Tuples would come back as lists and int keys as strings,
+    a replayed node must give the next one the same datablock as a real run.
+    """
+
+    try:
+        _raw = json.dumps(data, sort_keys=sort_keys)
+    except (TypeError, ValueError):
+        return
+
+    if json.loads(_raw) != data:
+        return
+
+    return _raw
+
+
+class ResultCache(object):
+    """
+    Stores node results (output datablock and status) keyed by a fingerprint of their inputs.
+    Used by Main for incremental runs, unchanged nodes are replayed instead of ran.
+    Backed by an sqlite file, safe to share between threads and processes.
+    Only datablocks that JSON keeps as they are (no tuples, sets or non-string keys) are cached.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param db_path: Full path of the sqlite file.
+                    Defaults to PATHS "cache_path" in the config, or "results.db" in the log folder.
+    :type db_path: str
+
+    :param max_entries: Oldest results past this count are removed, defaults to 20000.
+    :type max_entries: int
+
+    - Example::
+
+        _cache = ResultCache()
+        _key = ResultCache.fingerprint(node_data, data_block, source_hash)
+        _cached = _cache.get(_key)
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, db_path=None, max_entries=None):
+        if db_path is None:
+            db_path = getOption("PATHS",
+                                "cache_path",
+                                os.path.join(config_obj.get("PATHS", "log_path"), "results.db"))
+
+        if max_entries is None:
+            max_entries = int(getOption("DETAILS", "cache_entries", 20000))
+
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.unpruned = 0
+        self._local = threading.local()
+
+        if not os.path.isdir(os.path.dirname(self.db_path)):
+            os.makedirs(os.path.dirname(self.db_path))
+
+        _conn = self._connect()
+        _conn.execute("CREATE TABLE IF NOT EXISTS results ("
+                      "fingerprint TEXT PRIMARY KEY, "
+                      "status TEXT, "
+                      "block TEXT, "
+                      "result TEXT, "
+                      "used REAL)")
+        _conn.commit()
+
+    def _connect(self):
+        """
+        :meta private:
+        """
+
+        # sqlite connections can't be shared by threads
+        _conn = getattr(self._local, "conn", None)
+        if _conn is None:
+            _conn = sqlite3.connect(self.db_path, timeout=30)
+            self._local.conn = _conn
+
+        return _conn
+
+    @staticmethod
+    def fingerprint(node_data, data_block, source_hash):
+        """
+        Returns the key of a node run.
+        Made from the input datablock, the module's source and the node's parameters
+        (its data without name, uuid, position and connections).
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param node_data: Data of the node.
+        :type node_data: dict
+
+        :param data_block: The datablock given to the node.
+        :type data_block: dict
+
+        :param source_hash: sha1 of the module's source.
+        :type source_hash: str
+
+        :return: sha1 hex digest, None if the datablock can't be cached.
+        :rtype: str
+        """
+
+        _params = dict((k, v) for k, v in node_data.items() if k not in _LAYOUT_KEYS)
+        if isinstance(data_block, DataBlock):
+            data_block = data_block.toDict()
+
+        _raw = _toJson({"block": data_block,
+                        "params": _params,
+                        "source": source_hash},
+                       sort_keys=True)
+        if _raw is None:
+            return
+
+        return hashlib.sha1(_raw.encode("utf-8")).hexdigest()
+
+    def get(self, fingerprint):
+        """
+        Returns a stored result or None.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param fingerprint: Key from fingerprint().
+        :type fingerprint: str
+
+        :return: Dict with keys "status" ("success" or "skip"), "block" and "result" (ResultObj.toDict or None).
+        :rtype: dict
+        """
+
+        _conn = self._connect()
+        _row = _conn.execute("SELECT status, block, result FROM results WHERE fingerprint = ?",
+                             (fingerprint,)).fetchone()
+
+        if _row is None:
+            self.misses += 1
+            return
+
+        self.hits += 1
+        _conn.execute("UPDATE results SET used = ? WHERE fingerprint = ?", (time.time(), fingerprint))
+        _conn.commit()
+
+        return {"status": _row[0],
+                "block": json.loads(_row[1]),
+                "result": json.loads(_row[2]) if _row[2] else None}
+
+    def put(self, fingerprint, status, data_block, result=None):
+        """
+        Stores a result, datablocks that JSON would change are not stored.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param fingerprint: Key from fingerprint().
+        :type fingerprint: str
+
+        :param status: "success" or "skip".
+        :type status: str
+
+        :param data_block: The datablock after the node ran.
+        :type data_block: dict
+
+        :param result: The ResultObj returned by the node, if any.
+        :type result: ResultObj
+
+        :return: True if stored.
+        :rtype: bool
+        """
+
+        if isinstance(data_block, DataBlock):
+            data_block = data_block.toDict()
+
+        _block = _toJson(data_block)
+        if _block is None:
+            return False
+
+        _result = None
+        if result is not None:
+            _result = _toJson(result.toDict())
+            if _result is None:
+                return False
+
+        _conn = self._connect()
+        _conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                      (fingerprint, status, _block, _result, time.time()))
+        _conn.commit()
+
+        # not locked, an extra or late prune is harmless
+        self.unpruned += 1
+        if self.unpruned >= _PRUNE_EVERY:
+            self.prune()
+
+        return True
+
+    def prune(self):
+        """
+        Removes the least recently used results past max_entries.
+        Called by put() every 1000 results and by Main at the end of a run.
+        """
+
+        self.unpruned = 0
+        _conn = self._connect()
+        _conn.execute("DELETE FROM results WHERE fingerprint NOT IN "
+                      "(SELECT fingerprint FROM results ORDER BY used DESC LIMIT ?)",
+                      (self.max_entries,))
+        _conn.commit()
+
+    def clear(self):
+        """
+        Removes all stored results.
+        """
+
+        _conn = self._connect()
+        _conn.execute("DELETE FROM results")
+        _conn.commit()
@@ -75,6 +75,26 @@ class ResultObj(object):
     def getMessages(self):
         return self._messages
 
+    def toDict(self):
+        """
+        Returns a serializable dict of this result, see fromDict.
+        """
+
+        return {"status": self._status,
+                "messages": list(self._messages),
+                "errors": list(self.getErrors())}
+
+    @classmethod
+    def fromDict(cls, result_data):
+        """
+        Creates a result from toDict() data, messages are not prefixed again.
+        """
+
+        _out = cls(result_data["status"])
+        _out._messages = list(result_data.get("messages", list()))
+        _out.appendErrors(result_data.get("errors", list()))
+        return _out
+
     def _getErrorTuple(self, error_dict):
         _a = error_dict.get("item", None)
         _b = error_dict.get("type", "")
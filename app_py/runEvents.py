@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+import json
+import time
+import threading
+
+from collections import deque
+from collections import namedtuple
+from traceback import format_exc
+
+# event kinds, in the order a node sees them
+EVENTS = ("run_started", "node_started", "node_finished", "node_skipped", "run_finished")
+
+_FIELDS = ("kind", "time", "run", "index", "name", "uuid", "status", "duration", "data", "node")
+
+
+class RunEvent(namedtuple("RunEvent", _FIELDS)):
+    """
+    One event of a run, published by Main.
+
+    kind: One of EVENTS.
+    time: time.time() of the event.
+    run: Id of the run, shared by all its events.
+    index, name, uuid: The node's plan index, name and uuid, None for run events.
+    status: "start", "success", "error" or "skip" for finished nodes.
+            Why a node was not ran for skipped nodes: "skip", "error", "strict" or "cancelled".
+            "success", "skip", "error" or "cancelled" for the finished run.
+    duration: Seconds the node or run took, finished events only.
+    data: Extra details, a dict or None.
+    node: The NodeDummy of a finished node, only in the process that ran it.
+    """
+
+    __slots__ = ()
+
+    def toDict(self):
+        """
+        Returns the event as a JSON serializable dict, without its node.
+
+        :return: The event.
+        :rtype: dict
+        """
+
+        _out = self._asdict()
+        _out["event"] = _out.pop("kind")
+        del _out["node"]
+        return dict(_out)
+
+
+class EventBus(object):
+    """
+    Delivers run events to subscribers from its own thread.
+    Events are appended to a deque (atomic, no lock is taken) and handed to the
+    subscribers in order, a slow subscriber delays the other subscribers but never the run.
+    Nothing is queued while there are no subscribers.
+
+    - Example::
+
+        _bus = EventBus()
+        _bus.subscribe(print, ("node_finished",))
+        _bus.publish(_event)
+        _bus.flush()
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self):
+        self._subscribers = tuple()
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._busy = False
+        self._closed = False
+
+    @property
+    def active(self):
+        return bool(self._subscribers)
+
+    def subscribe(self, callback, kinds=None):
+        """
+        Adds a subscriber, called with each RunEvent on the delivery thread.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param callback: Any callable taking a RunEvent.
+        :type callback: function
+
+        :param kinds: Event kinds to receive, defaults to all.
+        :type kinds: tuple
+
+        :return: The callback, for unsubscribe.
+        :rtype: function
+        """
+
+        if kinds is not None:
+            kinds = frozenset(kinds)
+            _unknown = kinds.difference(EVENTS)
+            if _unknown:
+                raise ValueError("Invalid events: {}".format(sorted(_unknown)))
+
+        with self._lock:
+            # replaced, not changed, so delivery never sees a half updated list
+            self._subscribers = self._subscribers + ((callback, kinds),)
+
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = tuple(s for s in self._subscribers if s[0] is not callback)
+
+    def publish(self, event):
+        """
+        Queues an event, returns right away.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param event: The event.
+        :type event: RunEvent
+        """
+
+        if not self._subscribers:
+            return
+
+        self._queue.append(event)
+
+        if self._thread is None:
+            self._start()
+
+        self._wake.set()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._closed = False
+            self._thread = threading.Thread(target=self._deliver, name="nagare-events")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _deliver(self):
+        """
+        Delivery thread, hands queued events to the subscribers.
+        """
+
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+
+            while True:
+                self._busy = True
+                try:
+                    _event = self._queue.popleft()
+                except IndexError:
+                    self._busy = False
+                    break
+
+                for _callback, _kinds in self._subscribers:
+                    if _kinds is not None and _event.kind not in _kinds:
+                        continue
+
+                    try:
+                        _callback(_event)
+                    except Exception:
+                        print("Event subscriber failed: {}".format(_callback))
+                        print(format_exc())
+
+            # cleared here so a new thread is only started once this one delivered everything
+            with self._lock:
+                if self._closed and not self._queue:
+                    self._thread = None
+                    return
+
+    def flush(self, timeout=None):
+        """
+        Waits for every event published so far to be delivered.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param timeout: Seconds to wait at most, defaults to no limit.
+        :type timeout: float
+
+        :return: False if it timed out.
+        :rtype: bool
+        """
+
+        _end = None if timeout is None else time.time() + timeout
+        while self._queue or self._busy:
+            if _end is not None and time.time() > _end:
+                return False
+
+            time.sleep(0.001)
+
+        return True
+
+    def close(self, timeout=None):
+        """
+        Delivers the queued events and stops the delivery thread.
+        Publishing again starts a new one, once the old one is done.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param timeout: Seconds to wait at most, defaults to no limit.
+        :type timeout: float
+
+        :return: False if the thread is still delivering.
+        :rtype: bool
+        """
+
+        _thread = self._thread
+        if _thread is None:
+            return True
+
+        self.flush(timeout)
+        self._closed = True
+        self._wake.set()
+        _thread.join(timeout)
+        return not _thread.is_alive()
+
+
+class JsonlSink(object):
+    """
+    Subscriber writing each event as one JSON line, flushed so the file could be tailed.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param jsonl_path: Full path of the file, appended to if it exists.
+    :type jsonl_path: str
+
+    - Example::
+
+        _sink = JsonlSink("C:/tmp/events.jsonl")
+        Spawn.subscribe(_sink)
+        Spawn.runJson("C:/test/sample.json", test_block)
+        _sink.close()
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, jsonl_path):
+        _folder = os.path.dirname(jsonl_path)
+        if _folder and not os.path.isdir(_folder):
+            os.makedirs(_folder)
+
+        self.jsonl_path = jsonl_path
+        self._file = open(jsonl_path, "a")
+
+    def __call__(self, event):
+        self._file.write(json.dumps(event.toDict(), default=str) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+import json
+
+import graphPlan
+from utilities import binUtils
+
+# trace timestamps are in microseconds
+_US = 1000000.0
+
+# track of the run itself, branches start at 1
+_RUN_TRACK = 0
+
+# metrics that are already shown by the slice itself
+_SLICE_KEYS = ("start", "wall", "writes")
+
+
+def getTracks(plan):
+    """
+    Returns the track of each node of a plan.
+    Every out-node of the starter starts a branch, so does every out-node after the first,
+    the first out-node stays on its parent's track. Nodes of a track never run at the same time.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param plan: The compiled graph.
+    :type plan: GraphPlan
+
+    :return: Track number per plan index, the starter is on the run track (0).
+    :rtype: list
+    """
+
+    _tracks = [_RUN_TRACK] * len(plan)
+    _count = _RUN_TRACK
+
+    for _index in range(1, len(plan)):
+        _parent = plan.parents[_index]
+        if _parent > 0 and plan.children[_parent][0] == _index:
+            _tracks[_index] = _tracks[_parent]
+        else:
+            _count += 1
+            _tracks[_index] = _count
+
+    return _tracks
+
+
+def makeTrace(records, plan, pid=1, process_name="nagare", origin=None):
+    """
+    Returns Chrome Trace Event Format events for the nodes of one run.
+    Each branch is a track (thread), each node a slice and each datablock key
+    a node wrote an instant event at the end of that node.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param records: Dicts with index, name, status and metrics (start and wall are needed, see profileUtils.measure).
+                    Records with a "skipped" reason and a "time" are drawn as instant events.
+    :type records: list
+
+    :param plan: The plan that ran.
+    :type plan: GraphPlan
+
+    :param pid: Process id of the trace, one per run.
+    :type pid: int
+
+    :param process_name: Shown as the process name.
+    :type process_name: str
+
+    :param origin: time.time() shown as 0, defaults to the earliest record.
+    :type origin: float
+
+    :return: The trace events.
+    :rtype: list
+    """
+
+    _tracks = getTracks(plan)
+
+    if origin is None:
+        _starts = [r["metrics"]["start"] for r in records if "start" in r.get("metrics", dict())]
+        _starts.extend(r["time"] for r in records if "time" in r)
+        origin = min(_starts) if _starts else 0.0
+
+    _events = [{"ph": "M", "name": "process_name", "pid": pid, "args": {"name": process_name}},
+               {"ph": "M", "name": "thread_name", "pid": pid, "tid": _RUN_TRACK, "args": {"name": "run"}}]
+
+    _named = set([_RUN_TRACK])
+    for _record in records:
+        _track = _tracks[_record["index"]]
+        if _track not in _named:
+            _named.add(_track)
+            _events.append({"ph": "M",
+                            "name": "thread_name",
+                            "pid": pid,
+                            "tid": _track,
+                            "args": {"name": "branch {}: {}".format(_track, _record["name"])}})
+
+        if "skipped" in _record:
+            _events.append({"ph": "i",
+                            "s": "t",
+                            "name": "{} ({})".format(_record["name"], _record["skipped"]),
+                            "cat": "skipped",
+                            "pid": pid,
+                            "tid": _track,
+                            "ts": (_record["time"] - origin) * _US})
+            continue
+
+        _metrics = _record.get("metrics") or dict()
+        if "start" not in _metrics:
+            continue
+
+        _start = (_metrics["start"] - origin) * _US
+        _end = _start + _metrics["wall"] * _US
+
+        _args = {"status": _record["status"], "uuid": _record.get("uuid")}
+        _args.update((k, v) for k, v in _metrics.items() if k not in _SLICE_KEYS)
+
+        _events.append({"ph": "X",
+                        "name": _record["name"],
+                        "cat": _record["status"],
+                        "pid": pid,
+                        "tid": _track,
+                        "ts": _start,
+                        "dur": _end - _start,
+                        "args": _args})
+
+        for _key in _metrics.get("writes", list()):
+            _events.append({"ph": "i",
+                            "s": "t",
+                            "name": "write {}".format(_key),
+                            "cat": "datablock",
+                            "pid": pid,
+                            "tid": _track,
+                            "ts": _end,
+                            "args": {"node": _record["name"]}})
+
+    return _events
+
+
+def fromScore(score, plan, pid=1, process_name="nagare"):
+    """
+    Returns trace events of a score, as written by Main.getScore and read by nagare.Viewer.
+    Only nodes ran with profiling on have the metrics needed, others are left out.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param score: The score, a list of node dicts.
+    :type score: list
+
+    :param plan: The plan of the graph that ran.
+    :type plan: GraphPlan
+
+    :return: The trace events.
+    :rtype: list
+    """
+
+    _indices = dict((str(n["uuid"]), i) for i, n in enumerate(plan.nodes))
+
+    _records = list()
+    for _node in score:
+        _index = _indices.get(str(_node["uuid"]))
+        if _index is None:
+            continue
+
+        _status = "error" if _node["error"] else "skip" if _node["skip"] else "success"
+        _records.append({"index": _index,
+                         "name": _node["name"],
+                         "uuid": _node["uuid"],
+                         "status": _status,
+                         "metrics": _node.get("metrics")})
+
+    return makeTrace(_records, plan, pid, process_name)
+
+
+def exportScore(graph_path, score_path, trace_path):
+    """
+    Writes the trace of a score file (.json or .ngb) or of a batch's JSONL scores.
+    Each datablock of a batch is its own process in the trace.
+    Writes only show if the run tracked them (run --writes, batch --writes).
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param graph_path: Full path of the graph that ran.
+    :type graph_path: str
+
+    :param score_path: Full path of the score, or the JSONL of Main.runBatch.
+    :type score_path: str
+
+    :param trace_path: Full path of the trace JSON to write.
+    :type trace_path: str
+
+    :return: Number of trace events written.
+    :rtype: int
+
+    - Example::
+
+        traceExport.exportScore("C:/graphs/check.json", "C:/tmp/score.json", "C:/tmp/trace.json")
+    """
+
+    _plan = graphPlan.getPlan(graph_path)
+
+    if not score_path.endswith(".jsonl"):
+        _events = fromScore(binUtils.readData(score_path), _plan)
+        return writeTrace(trace_path, _events)
+
+    _events = list()
+    with open(score_path) as _score_file:
+        for _line in _score_file:
+            _line = _line.strip()
+            if not _line:
+                continue
+
+            _batch = json.loads(_line)
+            _name = "datablock {}".format(_batch["index"])
+            _events.extend(fromScore(_batch["nodes"], _plan, _batch["index"] + 1, _name))
+
+    return writeTrace(trace_path, _events)
+
+
+def writeTrace(trace_path, events):
+    """
+    Writes trace events as a Chrome Trace Event Format JSON file.
+
+    :return: Number of trace events written.
+    :rtype: int
+    """
+
+    _trace_dir = os.path.dirname(trace_path)
+    if _trace_dir and not os.path.isdir(_trace_dir):
+        os.makedirs(_trace_dir)
+
+    with open(trace_path, "w") as _trace_file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, _trace_file, default=str)
+
+    return len(events)
+
+
+class TraceRecorder(object):
+    """
+    Main subscriber that keeps the node events of a run for a trace.
+    Nodes ran with profiling off are drawn from their event times.
+
+    - Example::
+
+        _recorder = TraceRecorder()
+        Spawn.track_writes = True
+        Spawn.subscribe(_recorder)
+        Spawn.runJson("C:/test/sample.json", test_block)
+        _recorder.write("C:/tmp/trace.json", Spawn.plan)
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self):
+        self.records = list()
+        self.runs = list()
+        self._started = None
+
+    def __call__(self, event):
+        if event.kind == "run_started":
+            self._started = event.time
+        elif event.kind == "run_finished":
+            self.runs.append((self._started, event.time, event.status))
+        elif event.kind == "node_skipped":
+            self.records.append({"index": event.index,
+                                 "name": event.name,
+                                 "skipped": event.status,
+                                 "time": event.time})
+        elif event.kind == "node_finished" and event.status != "start":
+            _metrics = event.data
+            if not _metrics:
+                _metrics = {"start": event.time - event.duration, "wall": event.duration}
+
+            self.records.append({"index": event.index,
+                                 "name": event.name,
+                                 "uuid": event.uuid,
+                                 "status": event.status,
+                                 "metrics": _metrics})
+
+    def getTrace(self, plan):
+        """
+        Returns the trace events of the recorded runs.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param plan: The plan that ran, Main.plan.
+        :type plan: GraphPlan
+
+        :return: The trace events.
+        :rtype: list
+        """
+
+        _origin = self.runs[0][0] if self.runs else None
+        _events = makeTrace(self.records, plan, origin=_origin)
+
+        for _started, _finished, _status in self.runs:
+            _events.append({"ph": "X",
+                            "name": "run",
+                            "cat": _status,
+                            "pid": 1,
+                            "tid": _RUN_TRACK,
+                            "ts": (_started - _origin) * _US,
+                            "dur": (_finished - _started) * _US})
+
+        return _events
+
+    def write(self, trace_path, plan):
+        """
+        Writes the trace of the recorded runs, see writeTrace.
+        """
+
+        return writeTrace(trace_path, self.getTrace(plan))
@@ -92,10 +92,15 @@ class Interface(QDialog):
         self.propagate_check.setCheckable(True)
         self.propagate_check.setChecked(True)
 
+        self.incremental_check = QAction(self)
+        self.incremental_check.setText("Incremental Run")
+        self.incremental_check.setCheckable(True)
+
         self.file_menu.addAction("Open")
         self.file_menu.addAction("Save")
         self.file_menu.addAction(self.strict_check)
         self.file_menu.addAction(self.propagate_check)
+        self.file_menu.addAction(self.incremental_check)
         self.graph_menu.addAction("Run")
         self.graph_menu.addAction("Align (Selected)")
         self.graph_menu.addAction("Align (All)")
@@ -157,6 +162,8 @@ class Interface(QDialog):
 
         # run buttons
         self.run_btn = ButtonTool(self._getIcon("run.png"), "Run graph", _bottom_layout)
+        self.cancel_btn = ButtonTool(self._getIcon("stop.png"), "Cancel run", _bottom_layout)
+        self.cancel_btn.setEnabled(False)
 
         # feedback
         self.info_txt = QLineEdit("Ready...")
@@ -30,12 +30,19 @@ from __future__ import print_function
 import uuid
 
 from PySide2.QtCore import Qt
+from PySide2.QtCore import QRectF
+from PySide2.QtCore import QTimer
 from PySide2.QtGui import (QColor, QBrush)
 from PySide2.QtWidgets import QGraphicsScene
 
 from itemNode import ItemNode
 from startNode import StartNode
 from groupNode import GroupNode
+from app_py.utilities.spatialUtils import SpatialGrid
+from app_py.utilities.searchUtils import NameIndex
+
+# a bit larger than a node, most nodes sit in 1 to 4 cells
+GRID_CELL_SIZE = 256
 
 
 class GraphicsScene(QGraphicsScene):
@@ -59,6 +66,28 @@ class GraphicsScene(QGraphicsScene):
 
         super(GraphicsScene, self).__init__()
 
+        # node index, nodes register themselves on add, rename and uuid change
+        self._nodes_uuid = dict()
+        self._nodes_name = dict()
+        self._search = NameIndex()
+
+        # spatial index of node rects, moved nodes are re-bucketed on the next query
+        self._grid = SpatialGrid(GRID_CELL_SIZE)
+        self._grid_dirty = dict()
+
+        # groups are few and resize with their nodes, they are checked one by one
+        self._groups = dict()
+
+        # wires of moved nodes, redrawn together once control returns to the event loop
+        self._wires_dirty = dict()
+        self._wires_timer = QTimer()
+        self._wires_timer.setSingleShot(True)
+        self._wires_timer.setInterval(0)
+        self._wires_timer.timeout.connect(self.updateWires)
+
+        # False when the view is zoomed out, nodes hide their text and sockets
+        self.detailed = True
+
         _grid_color = QColor(25, 25, 25, 150)
         self.setBackgroundBrush(QBrush(_grid_color, Qt.CrossPattern))
         self.setMode(mode)
@@ -72,6 +101,306 @@ class GraphicsScene(QGraphicsScene):
         self.editable = mode == "editor"
         self.mode = mode
 
+    def addItem(self, item):
+        """
+        :meta private:
+        """
+
+        super(GraphicsScene, self).addItem(item)
+
+        if isinstance(item, (ItemNode, StartNode)):
+            self._indexNode(item, item.name, item.uuid)
+            self._grid_dirty[id(item)] = item
+
+            if not self.detailed:
+                item.setDetailed(False)
+
+        elif isinstance(item, GroupNode):
+            self._groups[id(item)] = item
+
+    def removeItem(self, item):
+        """
+        :meta private:
+        """
+
+        if isinstance(item, (ItemNode, StartNode)):
+            self._unindexNode(item, item.name, item.uuid)
+            self._grid.remove(item)
+            self._grid_dirty.pop(id(item), None)
+
+        self._groups.pop(id(item), None)
+
+        if id(item) in self._wires_dirty:
+            del self._wires_dirty[id(item)]
+
+        super(GraphicsScene, self).removeItem(item)
+
+    def clear(self):
+        """
+        :meta private:
+        """
+
+        self._nodes_uuid = dict()
+        self._nodes_name = dict()
+        self._search.clear()
+        self._grid.clear()
+        self._grid_dirty = dict()
+        self._groups = dict()
+        self._wires_dirty = dict()
+        super(GraphicsScene, self).clear()
+
+    def reindexNode(self, node_obj, old_name, old_uuid):
+        """
+        Called by nodes when their name or uuid changes.
+        Nodes that are not in this scene are ignored.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param node_obj: The renamed node.
+        :type node_obj: object
+
+        :param old_name: Name before the change.
+        :type old_name: str
+
+        :param old_uuid: uuid before the change.
+        :type old_uuid: uuid.UUID
+        """
+
+        if self._nodes_uuid.get(str(old_uuid)) is not node_obj:
+            return
+
+        self._unindexNode(node_obj, old_name, old_uuid)
+        self._indexNode(node_obj, node_obj.name, node_obj.uuid)
+
+    def getNode(self, name, node_uuid):
+        """
+        Returns a node using its name and uuid, without scanning the scene.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param name: Name of the node.
+        :type name: str
+
+        :param node_uuid: uuid of the node.
+        :type node_uuid: str, unicode or uuid.UUID
+
+        :return: The node's pointer, None if not found.
+        :rtype: object
+        """
+
+        _node = self._nodes_uuid.get(str(node_uuid))
+
+        # not the canonical form, like upper case or braces
+        if _node is None and not isinstance(node_uuid, uuid.UUID):
+            _node = self._nodes_uuid.get(str(uuid.UUID(node_uuid)))
+
+        if _node is None or _node.name != name:
+            return
+
+        return _node
+
+    def getNodesByName(self, name):
+        """
+        Returns every node (items and starters) with this name.
+
+        :return: List of node pointers.
+        :rtype: list
+        """
+
+        return list(self._nodes_name.get(name, list()))
+
+    def getNodes(self):
+        """
+        Returns every node (items and starters) in the scene.
+
+        :return: List of node pointers.
+        :rtype: list
+        """
+
+        return list(self._nodes_uuid.values())
+
+    def setDetailed(self, detailed):
+        """
+        Shows or hides the text, icons and sockets of every node.
+        Called by the view when its zoom crosses paintCache.LOD_DETAIL.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param detailed: False hides them.
+        :type detailed: bool
+        """
+
+        if detailed == self.detailed:
+            return
+
+        self.detailed = detailed
+        for _node in self.getNodes():
+            _node.setDetailed(detailed)
+
+    def moveNode(self, node_obj):
+        """
+        Called by nodes when they move, the grid is updated on the next query.
+        Its wires are marked dirty, see updateWires.
+        Nodes that are not in this scene are ignored.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param node_obj: The moved node.
+        :type node_obj: object
+        """
+
+        if self._nodes_uuid.get(str(node_obj.uuid)) is not node_obj:
+            return
+
+        self._grid_dirty[id(node_obj)] = node_obj
+
+        if node_obj.plug_out:
+            for _wire in node_obj.plug_out.out_wires:
+                self._wires_dirty[id(_wire)] = _wire
+
+        if node_obj.plug_in and node_obj.plug_in.in_wire:
+            _wire = node_obj.plug_in.in_wire
+            self._wires_dirty[id(_wire)] = _wire
+
+        if not self._wires_timer.isActive():
+            self._wires_timer.start()
+
+    def updateWires(self):
+        """
+        Rebuilds the paths of the wires marked dirty by moveNode, each one once.
+        Runs on its own after the nodes move, call it to update them right away.
+
+        :return: The number of wires updated.
+        :rtype: int
+        """
+
+        self._wires_timer.stop()
+        _wires = self._wires_dirty
+        self._wires_dirty = dict()
+
+        for _wire in _wires.values():
+            if _wire.source and _wire.target:
+                _wire.setPoints(_wire.source.getCenter(), _wire.target.getCenter())
+
+        return len(_wires)
+
+    def getNodesIn(self, rect):
+        """
+        Returns the nodes touching a rect, only nearby grid cells are searched.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param rect: Area in scene coordinates.
+        :type rect: QRectF
+
+        :return: List of node pointers.
+        :rtype: list
+        """
+
+        self._flushGrid()
+        return self._grid.query((rect.x(), rect.y(), rect.width(), rect.height()))
+
+    def getGroupsIn(self, rect):
+        """
+        Returns the groups touching a rect.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param rect: Area in scene coordinates.
+        :type rect: QRectF
+
+        :return: List of group pointers.
+        :rtype: list
+        """
+
+        return [g for g in self._groups.values() if g.sceneBoundingRect().intersects(rect)]
+
+    def getNodesAt(self, point):
+        """
+        Returns the nodes under a point.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param point: Position in scene coordinates.
+        :type point: QPointF
+
+        :return: List of node pointers.
+        :rtype: list
+        """
+
+        self._flushGrid()
+        return self._grid.queryPoint(point.x(), point.y())
+
+    def getSocketAt(self, point, margin=20):
+        """
+        Returns the socket under a point, used as a drop target for wires.
+        Sockets stick out of their node, so nodes within margin are checked.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param point: Position in scene coordinates.
+        :type point: QPointF
+
+        :param margin: Distance from the node rects to look at.
+        :type margin: float
+
+        :return: The socket's pointer, None if not found.
+        :rtype: object
+        """
+
+        _area = QRectF(point.x() - margin, point.y() - margin, margin * 2, margin * 2)
+
+        for _node in self.getNodesIn(_area):
+            for _socket in (_node.plug_in, _node.plug_out):
+                if _socket is not None and _socket.sceneBoundingRect().contains(point):
+                    return _socket
+
+    def _flushGrid(self):
+        for _node in self._grid_dirty.values():
+            _rect = _node.sceneBoundingRect()
+            self._grid.insert(_node, (_rect.x(), _rect.y(), _rect.width(), _rect.height()))
+
+        self._grid_dirty = dict()
+
+    def searchNodes(self, keyword, fuzzy=True, limit=None):
+        """
+        Returns the nodes whose names match a keyword, best match first.
+        Uses the scene's trigram name index, see searchUtils.NameIndex.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param keyword: Text to look for, not case-sensitive.
+        :type keyword: str
+
+        :param fuzzy: Return close names (typos) when none contain the keyword.
+        :type fuzzy: bool
+
+        :param limit: Maximum number of nodes, None for all.
+        :type limit: int
+
+        :return: List of node pointers.
+        :rtype: list
+        """
+
+        return [self._nodes_uuid[k] for k in self._search.search(keyword, fuzzy, limit)]
+
+    def _indexNode(self, node_obj, name, node_uuid):
+        self._nodes_uuid[str(node_uuid)] = node_obj
+        self._nodes_name.setdefault(name, list()).append(node_obj)
+        self._search.add(str(node_uuid), name)
+
+    def _unindexNode(self, node_obj, name, node_uuid):
+        if self._nodes_uuid.get(str(node_uuid)) is node_obj:
+            del self._nodes_uuid[str(node_uuid)]
+            self._search.remove(str(node_uuid))
+
+        _named = self._nodes_name.get(name, list())
+        if node_obj in _named:
+            _named.remove(node_obj)
+
+        if not _named:
+            self._nodes_name.pop(name, None)
+
     def keyPressEvent(self, event):
         """
         :meta private:
@@ -27,9 +27,11 @@ SOFTWARE.
 from __future__ import division
 from __future__ import print_function
 
-from PySide2.QtCore import (Qt, QPoint)
-from itemNode import ItemNode
+from PySide2.QtCore import (Qt, QPoint, QRect, QSize)
 from PySide2.QtWidgets import QGraphicsView
+from PySide2.QtWidgets import QRubberBand
+from PySide2.QtWidgets import QStyleOptionGraphicsItem
+from paintCache import LOD_DETAIL
 
 
 class GraphicsView(QGraphicsView):
@@ -54,8 +56,11 @@ class GraphicsView(QGraphicsView):
         self.scene_obj = scene_obj
 
         self.__drag = False
-        self.__pressed = False
         self.__zoom = 1.0
+        self.__band = None
+        self.__band_origin = None
+        self.__band_items = dict()
+        self.__band_kept = dict()
 
         self.setObjectName("graphicsView")
         frame_css = "QGraphicsView#graphicsView {background-color: rgb(42,42,42);}"
@@ -71,6 +76,7 @@ class GraphicsView(QGraphicsView):
         """
 
         self.fitInView(self.scene_obj.itemsBoundingRect(), Qt.KeepAspectRatio)
+        self._updateDetail()
 
     def wheelEvent(self, event):
         """
@@ -91,6 +97,18 @@ class GraphicsView(QGraphicsView):
         _delta = newPos-oldPos
         self.__zoom = zoom_value
         self.translate(_delta.x(), _delta.y())
+        self._updateDetail()
+
+    def _updateDetail(self):
+        """
+        Tells the scene to hide node details when zoomed out.
+
+        :meta private:
+        """
+
+        _lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(self.transform())
+        if hasattr(self.scene_obj, "setDetailed"):
+            self.scene_obj.setDetailed(_lod >= LOD_DETAIL)
 
     def mouseMoveEvent(self, event):
         """
@@ -108,13 +126,10 @@ class GraphicsView(QGraphicsView):
             self.__prevPos = event.pos()
             return
 
-        if self.__pressed:
-            for _nd in self.scene_obj.items():
-                if not type(_nd) is ItemNode:
-                    continue
+        if self.__band_origin is not None:
+            self._updateBand(event.pos())
+            return
 
-                if _nd.isSelected:
-                    _nd.drawMe()
         try:
             super(GraphicsView, self).mouseMoveEvent(event)
         except:
@@ -125,27 +140,83 @@ class GraphicsView(QGraphicsView):
         :meta private:
         """
 
-        self.__pressed = True
-
         if event.button() == Qt.RightButton:
             self.setDragMode(QGraphicsView.NoDrag)
             self.__drag = True
             self.__prevPos = event.pos()
             self.setCursor(Qt.OpenHandCursor)
         elif event.button() == Qt.LeftButton:
-            self.setDragMode(QGraphicsView.RubberBandDrag)
+            self.setDragMode(QGraphicsView.NoDrag)
+
+            # empty space, selects with the scene's node grid instead of Qt's rubber band
+            if self.itemAt(event.pos()) is None and hasattr(self.scene_obj, "getNodesIn"):
+                self._startBand(event.pos(), event.modifiers())
 
         super(GraphicsView, self).mousePressEvent(event)
 
+        # the scene clears the selection on empty space
+        for _item in self.__band_kept.values():
+            _item.setSelected(True)
+
     def mouseReleaseEvent(self, event):
         """
         :meta private:
         """
 
-        self.__pressed = False
-
         if self.__drag:
             self.__drag = False
             self.setCursor(Qt.ArrowCursor)
 
+        if self.__band_origin is not None:
+            self.__band.hide()
+            self.__band_origin = None
+            self.__band_items = dict()
+            self.__band_kept = dict()
+
         super(GraphicsView, self).mouseReleaseEvent(event)
+
+    def _startBand(self, view_pos, modifiers):
+        """
+        Ctrl or Shift adds to the selection, like Qt's rubber band.
+
+        :meta private:
+        """
+
+        if self.__band is None:
+            self.__band = QRubberBand(QRubberBand.Rectangle, self.viewport())
+
+        self.__band_origin = view_pos
+        self.__band_items = dict()
+        self.__band_kept = dict()
+
+        if modifiers & (Qt.ControlModifier | Qt.ShiftModifier):
+            self.__band_kept = dict((id(i), i) for i in self.scene_obj.selectedItems())
+        self.__band.setGeometry(QRect(view_pos, QSize()))
+        self.__band.show()
+
+    def _updateBand(self, view_pos):
+        """
+        Selects the nodes and groups touching the band, only items entering or leaving it are changed.
+        Items selected before an adding (Ctrl or Shift) band stay selected.
+
+        :meta private:
+        """
+
+        _rect = QRect(self.__band_origin, view_pos).normalized()
+        self.__band.setGeometry(_rect)
+
+        _area = self.mapToScene(_rect).boundingRect()
+        _inside = dict((id(n), n) for n in self.scene_obj.getNodesIn(_area))
+
+        if hasattr(self.scene_obj, "getGroupsIn"):
+            _inside.update((id(g), g) for g in self.scene_obj.getGroupsIn(_area))
+
+        for _key, _item in self.__band_items.items():
+            if _key not in _inside and _key not in self.__band_kept:
+                _item.setSelected(False)
+
+        for _key, _item in _inside.items():
+            if _key not in self.__band_items:
+                _item.setSelected(True)
+
+        self.__band_items = _inside
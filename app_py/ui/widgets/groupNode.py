@@ -73,6 +73,7 @@ class GroupNode(QGraphicsRectItem):
 
         self.setFlag(self.ItemIsMovable)
         self.setFlag(self.ItemIsSelectable)
+        self.setFlag(self.ItemSendsGeometryChanges)
         self.parentWidgetsList(self.group_widgets)
         self._setup()
 
@@ -98,6 +99,18 @@ class GroupNode(QGraphicsRectItem):
 
         super(GroupNode, self).mouseMoveEvent(event)
 
+    def itemChange(self, change, value):
+        """
+        :meta private:
+        """
+
+        # grouped nodes move with the group
+        if change == self.ItemPositionHasChanged and hasattr(self.scene, "moveNode"):
+            for _widget in self.group_widgets:
+                self.scene.moveNode(_widget)
+
+        return super(GroupNode, self).itemChange(change, value)
+
     def parentWidgetsList(self, widgets_list):
         """
         Parents the node_items in widgets_list to this widget.
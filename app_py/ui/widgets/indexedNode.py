@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Scene index bookkeeping shared by the graph nodes.
+"""
+
+from __future__ import print_function
+
+
+class IndexedNode(object):
+    """
+    Mixin for the nodes of a GraphicsScene, put it before the Qt item class.
+    Keeps the scene's node index in sync when the name or uuid changes,
+    and tells the scene when the node moved so its wires are rebuilt.
+
+    - Example::
+
+        class ItemNode(IndexedNode, QGraphicsRectItem):
+            ...
+    """
+
+    def itemChange(self, change, value):
+        """
+        :meta private:
+        """
+
+        if change == self.ItemPositionHasChanged:
+            _scene = getattr(self, "scene", None)
+            if hasattr(_scene, "moveNode"):
+                _scene.moveNode(self)
+
+        return super(IndexedNode, self).itemChange(change, value)
+
+    @property
+    def name(self):
+        """
+        :meta private:
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """
+        :meta private:
+        """
+
+        _old_name = getattr(self, "_name", None)
+        self._name = name
+        self._updateIndex(_old_name, getattr(self, "_uuid", None))
+
+    @property
+    def uuid(self):
+        """
+        :meta private:
+        """
+
+        return self._uuid
+
+    @uuid.setter
+    def uuid(self, node_uuid):
+        """
+        :meta private:
+        """
+
+        _old_uuid = getattr(self, "_uuid", None)
+        self._uuid = node_uuid
+        self._updateIndex(getattr(self, "_name", None), _old_uuid)
+
+    def _updateIndex(self, old_name, old_uuid):
+        """
+        Keeps the scene's node index in sync after a rename or a new uuid.
+        """
+
+        _scene = getattr(self, "scene", None)
+        if hasattr(_scene, "reindexNode"):
+            _scene.reindexNode(self, old_name, old_uuid)
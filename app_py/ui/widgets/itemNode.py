@@ -29,12 +29,12 @@ from __future__ import print_function
 
 import uuid
 from PySide2.QtCore import Qt
+from PySide2.QtCore import QPointF
 
 from PySide2.QtGui import QPen
 from PySide2.QtGui import QColor
 from PySide2.QtGui import QBrush
 from PySide2.QtGui import QPainter
-from PySide2.QtGui import QPainterPath
 
 from PySide2.QtWidgets import QGraphicsRectItem
 from PySide2.QtWidgets import QGraphicsTextItem
@@ -43,9 +43,12 @@ from PySide2.QtWidgets import QGraphicsPixmapItem
 from resultsDialog import ResultsDialog
 from clickLabel import ClickLabel
 from socketNode import SocketNode
+from indexedNode import IndexedNode
+import paintCache
+import pixmapCache
 
 
-class ItemNode(QGraphicsRectItem):
+class ItemNode(IndexedNode, QGraphicsRectItem):
     """
     Inherits QGraphicsRectItem, used to create nodes.
     Nodes contain information as data_bloc using dict.
@@ -164,6 +167,7 @@ class ItemNode(QGraphicsRectItem):
         self.setRect(0, 0, self.width, self.height)
         self.setFlag(self.ItemIsMovable)
         self.setFlag(self.ItemIsSelectable)
+        self.setFlag(self.ItemSendsGeometryChanges)
 
         self.plug_out = SocketNode(self, "out")
         self.plug_in = SocketNode(self, "in")
@@ -190,31 +194,15 @@ class ItemNode(QGraphicsRectItem):
         self.setX(self.position_x - self.width / 2)
         self.setY(self.position_y - self.height / 2)
 
-    def paint(self, painter, QStyleOptionGraphicsItem, widget=None):
+    def paint(self, painter, option, widget=None):
         """
         :meta private:
         """
 
-        painter.setRenderHints(QPainter.Antialiasing |
-                               QPainter.TextAntialiasing |
-                               QPainter.SmoothPixmapTransform |
-                               QPainter.HighQualityAntialiasing,
-                               True)
-
         _hover_brush = self.sel_brush
         _normal_brush = self.bg_brush
         _corn = 5
 
-        _path_outline = QPainterPath()
-        _path_outline.addRoundedRect(-1,
-                                     -1,
-                                     self.width + 2,
-                                     self.height + 2,
-                                     _corn,
-                                     _corn)
-
-        painter.setBrush(Qt.NoBrush)
-
         if self.error:
             _hover_brush = self.err_brush
             _normal_brush = self.err_brush
@@ -225,18 +213,43 @@ class ItemNode(QGraphicsRectItem):
             _hover_brush = self.skip_brush
             _normal_brush = self.skip_brush
 
+        # zoomed out, a plain box
+        if not paintCache.isDetailed(option, painter):
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.setBrush(_normal_brush)
+            painter.setPen(self.pen_selected if self.isSelected() else Qt.NoPen)
+            painter.drawRect(self.rect())
+            return
+
+        painter.setRenderHints(paintCache.RENDER_HINTS, True)
+
         if self.hovered:
             painter.setBrush(_hover_brush)
             painter.setPen(self.pen_hovered)
-            painter.drawPath(_path_outline.simplified())
         else:
             painter.setBrush(_normal_brush)
             painter.setPen(self.pen_default if not self.isSelected() else self.pen_selected)
-            painter.drawPath(_path_outline.simplified())
+
+        painter.drawPath(paintCache.getRoundedRect(self.width, self.height, _corn))
+
+    def setDetailed(self, detailed):
+        """
+        Shows or hides the text, icon and sockets, used by the scene when zooming.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param detailed: False hides them.
+        :type detailed: bool
+        """
+
+        for _child in (self.label, self.state_label, self.icon, self.plug_in, self.plug_out):
+            if _child is not None:
+                _child.setVisible(detailed)
 
     def changeIcon(self, icon_path):
         """
         Changes the icon and moves it according to bitmap size.
+        Icons are shared with the other nodes, see pixmapCache.
 
         **parameters**, **types**, **return** and **return types**
 
@@ -244,8 +257,10 @@ class ItemNode(QGraphicsRectItem):
         :type icon_path: str
         """
 
-        _qpm = self.icon.pixmap()
-        _qpm.load(icon_path)
+        _qpm = pixmapCache.CACHE.get(icon_path)
+        if _qpm is None:
+            _qpm = self.icon.pixmap()
+
         _hgt = _qpm.size().height()
         self.icon.setPos(8, self.height - _hgt - 5)
         self.icon.setPixmap(_qpm)
@@ -313,6 +328,16 @@ class ItemNode(QGraphicsRectItem):
                                             "=" * 36,
                                             "\n".join(self.messages)))
 
+    def setRunning(self):
+        """
+        Shows that the node is being ran, called before its results arrive.
+        """
+
+        self.setClean()
+        self.state = "Running"
+        self.state_label.setPlainText(self.state)
+        self.update()
+
     def drawMe(self):
         """
         Call this to update this object.
@@ -360,13 +385,9 @@ class ItemNode(QGraphicsRectItem):
         if not self.scene.editable:
             return
 
+        # wires follow through itemChange, see GraphicsScene.moveNode
         super(ItemNode, self).mouseMoveEvent(event)
 
-        for _v in self.scene.views():
-            _v.update()
-
-        self.drawMe()
-
     def mouseReleaseEvent(self, event):
         """
         :meta private:
@@ -403,11 +424,12 @@ class ItemNode(QGraphicsRectItem):
         :rtype: bool
         """
 
-        for _ni in self.scene.items():
-            if _ni == self:
+        # only the nodes under this one's center can share its coordinates
+        for _ni in self.scene.getNodesAt(QPointF(self.position_x, self.position_y)):
+            if _ni is self:
                 continue
 
-            if "widgets.itemNode" not in _ni.__str__():
+            if not isinstance(_ni, ItemNode):
                 continue
 
             if int(_ni.position_x) == int(self.position_x) and int(_ni.position_y) == int(self.position_y):
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Shared painter paths and level-of-detail helpers for the scene widgets.
+"""
+
+from __future__ import division
+from __future__ import print_function
+
+from PySide2.QtGui import QPainter
+from PySide2.QtGui import QPainterPath
+
+# below this zoom, nodes are plain boxes and wires are straight lines
+LOD_DETAIL = 0.4
+
+# HighQualityAntialiasing is left out, it's only used by OpenGL viewports
+RENDER_HINTS = QPainter.Antialiasing | QPainter.TextAntialiasing | QPainter.SmoothPixmapTransform
+
+_PATHS = dict()
+
+
+def isDetailed(option, painter):
+    """
+    Returns True if an item should be drawn with all of its details.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param option: The option given to paint().
+    :type option: QStyleOptionGraphicsItem
+
+    :param painter: The painter given to paint().
+    :type painter: QPainter
+
+    :return: False when zoomed out past LOD_DETAIL.
+    :rtype: bool
+    """
+
+    return option.levelOfDetailFromTransform(painter.worldTransform()) >= LOD_DETAIL
+
+
+def getRoundedRect(width, height, corner):
+    """
+    Returns the simplified outline of a node, built once per size.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param width: Width of the node.
+    :type width: float
+
+    :param height: Height of the node.
+    :type height: float
+
+    :param corner: Corner radius.
+    :type corner: float
+
+    :return: Shared path, don't modify it.
+    :rtype: QPainterPath
+    """
+
+    _key = ("rect", width, height, corner)
+    if _key not in _PATHS:
+        _path = QPainterPath()
+        _path.addRoundedRect(-1, -1, width + 2, height + 2, corner, corner)
+        _PATHS[_key] = _path.simplified()
+
+    return _PATHS[_key]
+
+
+def getEllipse(width, height):
+    """
+    Returns the simplified outline of a round node, built once per size.
+
+    :return: Shared path, don't modify it.
+    :rtype: QPainterPath
+    """
+
+    _key = ("ellipse", width, height)
+    if _key not in _PATHS:
+        _path = QPainterPath()
+        _path.addEllipse(-1, -1, width, height)
+        _PATHS[_key] = _path.simplified()
+
+    return _PATHS[_key]
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Pixmaps shared by the nodes, each icon file is decoded once.
+"""
+
+from __future__ import print_function
+
+import os
+
+from collections import OrderedDict
+from PySide2.QtGui import QPixmap
+from app_py.configs import getOption
+
+
+class PixmapCache(object):
+    """
+    Keeps decoded icons in memory, keyed by resolved path.
+    Bounded by a least recently used eviction, paths that failed to load are remembered too.
+    QPixmap is implicitly shared, so every node using an icon points to the same image.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param max_size: Maximum number of pixmaps kept, defaults to 64.
+    :type max_size: int
+
+    - Example::
+
+        _qpm = pixmapCache.CACHE.get(r"C:/nagare/modules/maya/icons/saveFile.png")
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, max_size=None):
+        if max_size is None:
+            max_size = 64
+
+        self.max_size = max(1, int(max_size))
+        self._pixmaps = OrderedDict()
+        self._missing = OrderedDict()
+        self.loads = 0
+
+    def get(self, icon_path):
+        """
+        Returns the pixmap of an icon file, decoding it only the first time.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param icon_path: Full file path of the icon.
+        :type icon_path: str
+
+        :return: The pixmap, None if the file can't be loaded.
+        :rtype: QPixmap
+        """
+
+        if not icon_path:
+            return
+
+        _key = os.path.normcase(os.path.abspath(icon_path))
+
+        if _key in self._pixmaps:
+            _qpm = self._pixmaps.pop(_key)
+            self._pixmaps[_key] = _qpm
+            return _qpm
+
+        if _key in self._missing:
+            return
+
+        _qpm = QPixmap(icon_path)
+        self.loads += 1
+
+        if _qpm.isNull():
+            self._missing[_key] = True
+            while len(self._missing) > self.max_size:
+                self._missing.popitem(last=False)
+            return
+
+        self._pixmaps[_key] = _qpm
+        while len(self._pixmaps) > self.max_size:
+            self._pixmaps.popitem(last=False)
+
+        return _qpm
+
+    def discard(self, icon_path):
+        """
+        Forgets an icon, use it when the file changed on disk.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param icon_path: Full file path of the icon.
+        :type icon_path: str
+        """
+
+        _key = os.path.normcase(os.path.abspath(icon_path))
+        self._pixmaps.pop(_key, None)
+        self._missing.pop(_key, None)
+
+    def clear(self):
+        self._pixmaps = OrderedDict()
+        self._missing = OrderedDict()
+
+
+CACHE = PixmapCache(getOption("DETAILS", "icon_cache_size"))
@@ -35,12 +35,11 @@ from PySide2.QtCore import QPointF
 from PySide2.QtGui import QPen
 from PySide2.QtGui import QBrush
 from PySide2.QtGui import QColor
-from PySide2.QtGui import QPainter
-from PySide2.QtGui import QTransform
 from PySide2.QtGui import QPainterPath
 
 from PySide2.QtWidgets import QGraphicsEllipseItem
 from .wireNode import WireNode
+from . import paintCache
 
 
 class SocketNode(QGraphicsEllipseItem):
@@ -146,11 +145,7 @@ class SocketNode(QGraphicsEllipseItem):
         :meta private:
         """
 
-        painter.setRenderHints(QPainter.Antialiasing |
-                               QPainter.TextAntialiasing |
-                               QPainter.SmoothPixmapTransform |
-                               QPainter.HighQualityAntialiasing,
-                               True)
+        painter.setRenderHints(paintCache.RENDER_HINTS, True)
 
         if self.isSelected():
             painter.setPen(self.selPen)
@@ -215,8 +210,7 @@ class SocketNode(QGraphicsEllipseItem):
         if not self.scene().editable:
             return
 
-        self._item_under = self.scene().itemAt(event.scenePos().toPoint(),
-                                               QTransform())
+        self._item_under = self.scene().getSocketAt(event.scenePos())
 
         if self.socketType == "out":
             pointB = self.mapToScene(event.pos())
@@ -230,12 +224,14 @@ class SocketNode(QGraphicsEllipseItem):
         :meta private:
         """
 
-        _under_type = self._item_under.socketType
         if not type(self._item_under) is SocketNode:
-            self.killWire(self.new_line)
+            if self.new_line:
+                self.killWire(self.new_line)
             print(datetime.now(), "Dropped under a non-socket.")
             return
 
+        _under_type = self._item_under.socketType
+
         if _under_type == "out":
             self.killWire(self.new_line)
             print(datetime.now(), "Dropped under an out-socket.")
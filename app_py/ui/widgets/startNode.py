@@ -37,16 +37,17 @@ from PySide2.QtGui import QFont
 from PySide2.QtGui import QColor
 from PySide2.QtGui import QBrush
 from PySide2.QtGui import QPainter
-from PySide2.QtGui import QPainterPath
 
 from PySide2.QtWidgets import QGraphicsEllipseItem
 
 from socketNode import SocketNode
+from indexedNode import IndexedNode
 from clickLabel import ClickLabel
 from modalTextEdit import ModalTextEdit
+import paintCache
 
 
-class StartNode(QGraphicsEllipseItem):
+class StartNode(IndexedNode, QGraphicsEllipseItem):
     """
     Starter node, can only have 1 in the graph.
     Contains data_block in the form of a dict.
@@ -140,6 +141,7 @@ class StartNode(QGraphicsEllipseItem):
         self.setRect(0, 0, self.width, self.width)
         self.setFlag(self.ItemIsMovable)
         self.setFlag(self.ItemIsSelectable)
+        self.setFlag(self.ItemSendsGeometryChanges)
         self.setToolTip(self.description)
 
         self.plug_out = SocketNode(self, "out")
@@ -157,29 +159,43 @@ class StartNode(QGraphicsEllipseItem):
         self.setX(self.position_x-self.width * 0.5)
         self.setY(self.position_y-self.width * 0.5)
 
-    def paint(self, painter, QStyleOptionGraphicsItem, widget=None):
+    def paint(self, painter, option, widget=None):
         """
         :meta private:
         """
 
-        painter.setRenderHints(QPainter.Antialiasing |
-                               QPainter.TextAntialiasing |
-                               QPainter.SmoothPixmapTransform |
-                               QPainter.HighQualityAntialiasing,
-                               True)
+        # zoomed out, a plain box
+        if not paintCache.isDetailed(option, painter):
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.setBrush(self.bg_brush)
+            painter.setPen(self.pen_selected if self.isSelected() else Qt.NoPen)
+            painter.drawRect(self.rect())
+            return
 
-        path_outline = QPainterPath()
-        path_outline.addEllipse(-1, -1, self.width, self.width)
-        painter.setBrush(Qt.NoBrush)
+        painter.setRenderHints(paintCache.RENDER_HINTS, True)
 
         if self.hovered:
             painter.setBrush(self.sel_brush)
             painter.setPen(self.pen_hovered)
-            painter.drawPath(path_outline.simplified())
         else:
             painter.setBrush(self.bg_brush)
             painter.setPen(self.pen_default if not self.isSelected() else self.pen_selected)
-            painter.drawPath(path_outline.simplified())
+
+        painter.drawPath(paintCache.getEllipse(self.width, self.width))
+
+    def setDetailed(self, detailed):
+        """
+        Shows or hides the label and socket, used by the scene when zooming.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param detailed: False hides them.
+        :type detailed: bool
+        """
+
+        for _child in (self.label, self.plug_out):
+            if _child is not None:
+                _child.setVisible(detailed)
 
     def drawMe(self):
         """
@@ -219,15 +235,9 @@ class StartNode(QGraphicsEllipseItem):
         if not self.scene.editable:
             return
 
+        # wires follow through itemChange, see GraphicsScene.moveNode
         super(StartNode, self).mouseMoveEvent(event)
 
-        for _view in self.scene.views():
-            # if _view.zoom > 1.0:
-                # _view.update()
-            _view.update()
-
-        self.drawMe()
-
     def mouseReleaseEvent(self, event):
         """
         :meta private:
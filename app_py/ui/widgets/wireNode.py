@@ -30,13 +30,13 @@ from __future__ import print_function
 from PySide2.QtGui import QPen
 from PySide2.QtGui import QColor
 from PySide2.QtGui import QPainter
-from PySide2.QtGui import QTransform
 from PySide2.QtGui import QPainterPath
 
 from PySide2.QtCore import Qt
 from PySide2.QtCore import QPointF
 
 from PySide2.QtWidgets import QGraphicsPathItem
+import paintCache
 
 
 class WireNode(QGraphicsPathItem):
@@ -127,7 +127,7 @@ class WireNode(QGraphicsPathItem):
         if not self.scene().editable:
             return
 
-        _to_socket = self.scene().itemAt(event.scenePos().toPoint(), QTransform())
+        _to_socket = self.scene().getSocketAt(event.scenePos())
 
         if "socketNode" not in str(type(_to_socket)):
             self.pointB = self.target.getCenter()
@@ -208,18 +208,37 @@ class WireNode(QGraphicsPathItem):
         path.cubicTo(ctrl1, ctrl2, self.pointB)
         self.setPath(path)
 
+    def setPoints(self, point_a, point_b):
+        """
+        Moves both ends of the wire, the path is only rebuilt once.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param point_a: Scene position of the source end.
+        :type point_a: QPointF
+
+        :param point_b: Scene position of the target end.
+        :type point_b: QPointF
+        """
+
+        self._pointA = point_a
+        self._pointB = point_b
+        self._updatePath()
+
     def paint(self, painter, option, widget):
         """
         :meta private:
         """
 
-        painter.setRenderHints(QPainter.Antialiasing|
-                               QPainter.TextAntialiasing|
-                               QPainter.SmoothPixmapTransform|
-                               QPainter.HighQualityAntialiasing,
-                               True)
-
         painter.setPen(self.pen)
+
+        # zoomed out, a straight line
+        if not paintCache.isDetailed(option, painter):
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.drawLine(self._pointA, self._pointB)
+            return
+
+        painter.setRenderHints(paintCache.RENDER_HINTS, True)
         painter.drawPath(self.path())
 
     @property
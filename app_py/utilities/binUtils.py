@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+import json
+import zlib
+import struct
+
+# files with this extension are written in the binary format
+BINARY_EXT = ".ngb"
+
+# magic, format version, flags (reserved) and uncompressed body length
+_MAGIC = b"NGB"
+_HEADER = struct.Struct(">3sBBI")
+_FORMAT_VERSION = 1
+
+
+def isBinary(file_path):
+    """
+    Returns True if the path should be read and written in the binary format.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param file_path: Full file path.
+    :type file_path: str
+
+    :return: True for BINARY_EXT files.
+    :rtype: bool
+    """
+
+    return os.path.splitext(file_path)[1].lower() == BINARY_EXT
+
+
+def dumps(data):
+    """
+    Encodes serializable data to bytes.
+    The body is compact JSON compressed with zlib, after a fixed size header.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param data: Serializable data, a graph or a score.
+    :type data: dict or list
+
+    :return: Encoded data.
+    :rtype: bytes
+
+    - Example::
+
+        binUtils.dumps({"version": 2, "nodes": []})
+    """
+
+    _body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(_MAGIC, _FORMAT_VERSION, 0, len(_body)) + zlib.compress(_body, 6)
+
+
+def loads(raw):
+    """
+    Decodes bytes made by dumps(), plain JSON bytes are decoded too.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param raw: Encoded data.
+    :type raw: bytes
+
+    :return: The decoded data.
+    :rtype: dict or list
+    """
+
+    if raw[:len(_MAGIC)] != _MAGIC:
+        return json.loads(raw.decode("utf-8"))
+
+    if len(raw) < _HEADER.size:
+        raise ValueError("Truncated header.")
+
+    _magic, _version, _flags, _length = _HEADER.unpack(raw[:_HEADER.size])
+    if _version > _FORMAT_VERSION:
+        raise ValueError("Unsupported binary version: {}".format(_version))
+
+    _body = zlib.decompress(raw[_HEADER.size:])
+    if len(_body) != _length:
+        raise ValueError("Corrupted body, expected {} bytes, got {}.".format(_length, len(_body)))
+
+    return json.loads(_body.decode("utf-8"))
+
+
+def readData(file_path):
+    """
+    Reads a graph or score file, binary or JSON.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param file_path: Full file path.
+    :type file_path: str
+
+    :return: Contents of the file.
+    :rtype: dict or list
+    """
+
+    with open(file_path, "rb") as data_buffer:
+        return loads(data_buffer.read())
+
+
+def writeData(file_path, data, indent=4, binary=None):
+    """
+    Writes a graph or score file, the format is chosen by the file extension.
+    JSON is kept readable (indented, sorted keys) for diffs.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param file_path: Full file path, BINARY_EXT for the binary format.
+    :type file_path: str
+
+    :param data: Serializable data.
+    :type data: dict or list
+
+    :param indent: JSON indentation, None for compact JSON.
+    :type indent: int
+
+    :param binary: Force the format, defaults to isBinary(file_path).
+    :type binary: bool
+
+    :return: None
+    :rtype: NoneType
+    """
+
+    if binary is None:
+        binary = isBinary(file_path)
+
+    if binary:
+        with open(file_path, "wb") as data_buffer:
+            data_buffer.write(dumps(data))
+        return
+
+    with open(file_path, "w") as data_buffer:
+        json.dump(data, data_buffer, indent=indent, sort_keys=True)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+EXECUTORS = ("serial", "thread", "process")
+
+
+def getWorkers(workers=None):
+    """
+    Returns the number of workers to use for a pool.
+    Defaults to the number of CPUs when workers is not set or 0.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param workers: Requested number of workers.
+    :type workers: int
+
+    :return: Number of workers, at least 1.
+    :rtype: int
+    """
+
+    if not workers:
+        try:
+            workers = multiprocessing.cpu_count()
+        except NotImplementedError:
+            workers = 1
+
+    return max(1, int(workers))
+
+
+def getPool(executor, workers=None, initializer=None, initargs=()):
+    """
+    Creates a worker pool for the given executor backend.
+    Both backends share the multiprocessing.pool API (apply_async, imap).
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param executor: Backend name, "thread" or "process".
+    :type executor: str
+
+    :param workers: Number of workers, defaults to CPU count.
+    :type workers: int
+
+    :param initializer: Called once in each worker when it starts.
+    :type initializer: function
+
+    :param initargs: Arguments passed to initializer.
+    :type initargs: tuple
+
+    :return: A pool object, close() and join() it when done.
+    :rtype: object
+
+    - Example::
+
+        _pool = execUtils.getPool("thread", 8)
+    """
+
+    if executor not in EXECUTORS:
+        raise ValueError("Invalid executor: {} (valid: {})".format(executor, ", ".join(EXECUTORS)))
+
+    if executor == "serial":
+        raise ValueError("Serial executor does not use a pool.")
+
+    _workers = getWorkers(workers)
+
+    if executor == "thread":
+        return ThreadPool(_workers, initializer, initargs)
+
+    return multiprocessing.Pool(_workers, initializer, initargs)
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+
+import binUtils
+
+# version written by writeGraph, v1 is the nested "out_nodes" format
+GRAPH_VERSION = 2
+
+# v1 keys that v2 keeps in "edges" instead
+_WIRE_KEYS = ("out_nodes", "in_node")
+
+
+def walkTree(tree_data):
+    """
+    Walks a graph dict depth-first (pre-order) without recursion.
+    Uses an explicit stack, so deep graphs won't hit the recursion limit.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param tree_data: Node dict with key ["out_nodes"], usually the starter.
+    :type tree_data: dict
+
+    :return: Yields (node_dict, parent_dict) tuples, parent_dict is None for tree_data.
+    :rtype: generator
+
+    - Example::
+
+        for node_dict, parent_dict in walkTree(graph_data["nodes"]):
+            print(node_dict["name"])
+    """
+
+    _stack = [(tree_data, None)]
+
+    while _stack:
+        _node, _parent = _stack.pop()
+        yield _node, _parent
+
+        for _out in reversed(_node.get("out_nodes") or list()):
+            _stack.append((_out, _node))
+
+
+def walkEdges(tree_data):
+    """
+    Walks the wires of a graph dict in the same order a recursive walk would create them.
+    A wire is yielded before any of the wires of its target node.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param tree_data: Node dict with key ["out_nodes"], usually the starter.
+    :type tree_data: dict
+
+    :return: Yields (source_dict, target_dict) tuples.
+    :rtype: generator
+
+    - Example::
+
+        for source_dict, target_dict in walkEdges(graph_data["nodes"]):
+            print(source_dict["name"], target_dict["name"])
+    """
+
+    _stack = [(tree_data, _out) for _out in reversed(tree_data.get("out_nodes") or list())]
+
+    while _stack:
+        _source, _target = _stack.pop()
+        yield _source, _target
+
+        for _out in reversed(_target.get("out_nodes") or list()):
+            _stack.append((_target, _out))
+
+
+def getVersion(graph_data):
+    """
+    Returns the schema version of graph data read from a JSON file.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param graph_data: Contents of a graph file.
+    :type graph_data: dict
+
+    :return: 1 for nested graphs, 2 for flat graphs.
+    :rtype: int
+    """
+
+    if isinstance(graph_data.get("nodes"), list):
+        _version = int(graph_data.get("version", GRAPH_VERSION))
+        if _version > GRAPH_VERSION:
+            raise ValueError("Unsupported graph version: {}".format(_version))
+
+        return _version
+
+    return 1
+
+
+def toFlat(graph_data):
+    """
+    Returns graph data in the v2 (flat) format, v2 data is returned as is.
+
+    v2 keeps one entry per node in "nodes" (pre-order, starter first)
+    and the wires in "edges" as [source uuid, target uuid], in out-node order.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param graph_data: Contents of a graph file, v1 or v2.
+    :type graph_data: dict
+
+    :return: v2 graph data.
+    :rtype: dict
+
+    - Example::
+
+        toFlat({"nodes": nodeUtils.printTree(starter), "groups": list()})
+        # {"version": 2, "start": "4d1c...", "nodes": [...], "edges": [...], "groups": []}
+    """
+
+    if getVersion(graph_data) != 1:
+        return graph_data
+
+    _tree = graph_data.get("nodes", graph_data)
+    _nodes = list()
+    _edges = list()
+
+    for _node, _parent in walkTree(_tree):
+        _nodes.append(dict((k, v) for k, v in _node.items() if k not in _WIRE_KEYS))
+
+        if _parent is not None:
+            _edges.append([str(_parent["uuid"]), str(_node["uuid"])])
+
+    return {"version": GRAPH_VERSION,
+            "start": str(_tree["uuid"]),
+            "nodes": _nodes,
+            "edges": _edges,
+            "groups": graph_data.get("groups", list())}
+
+
+def toTree(graph_data):
+    """
+    Returns graph data in the v1 (nested) format, v1 data is returned as is.
+    Nodes are linked in memory, nothing is walked recursively.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param graph_data: Contents of a graph file, v1 or v2.
+    :type graph_data: dict
+
+    :return: v1 graph data, key ["nodes"] is the starter's dict.
+    :rtype: dict
+    """
+
+    if getVersion(graph_data) == 1:
+        return graph_data
+
+    _by_uuid = dict()
+    for _flat in graph_data["nodes"]:
+        _node = dict(_flat)
+        _node["out_nodes"] = list()
+        _node["in_node"] = None
+        _by_uuid[_node["uuid"]] = _node
+
+    for _source_id, _target_id in graph_data["edges"]:
+        if _source_id not in _by_uuid or _target_id not in _by_uuid:
+            raise ValueError("Edge to a missing node: {} -> {}".format(_source_id, _target_id))
+
+        _source = _by_uuid[_source_id]
+        _target = _by_uuid[_target_id]
+
+        if _target["in_node"] is not None:
+            raise ValueError("Node has more than one in-node: {}".format(_target["name"]))
+
+        _source["out_nodes"].append(_target)
+        _target["in_node"] = {"name": _source["name"], "uuid": _source["uuid"]}
+
+    if graph_data.get("start") not in _by_uuid:
+        raise ValueError("Starter not found: {}".format(graph_data.get("start")))
+
+    return {"nodes": _by_uuid[graph_data["start"]],
+            "groups": graph_data.get("groups", list())}
+
+
+def readGraph(file_path):
+    """
+    Reads a graph file, v1 or v2, JSON or binary (see binUtils).
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param file_path: Full file path of the json file.
+    :type file_path: str
+
+    :return: Contents of the file.
+    :rtype: dict
+    """
+
+    return binUtils.readData(file_path)
+
+
+def writeGraph(file_path, graph_data, version=None):
+    """
+    Writes a graph file in the given schema version.
+    Binary if the file uses binUtils.BINARY_EXT, indented JSON otherwise.
+    The file is replaced only once the new one is complete.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param file_path: Full file path of the json file.
+    :type file_path: str
+
+    :param graph_data: Graph data, v1 or v2.
+    :type graph_data: dict
+
+    :param version: 1 or 2, defaults to GRAPH_VERSION.
+    :type version: int
+
+    :return: None
+    :rtype: NoneType
+    """
+
+    if version is None:
+        version = GRAPH_VERSION
+
+    _data = toTree(graph_data) if version == 1 else toFlat(graph_data)
+    _tmp_path = "{}.{}.tmp".format(file_path, os.getpid())
+
+    try:
+        binUtils.writeData(_tmp_path, _data, binary=binUtils.isBinary(file_path))
+
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        os.rename(_tmp_path, file_path)
+    finally:
+        if os.path.exists(_tmp_path):
+            os.remove(_tmp_path)
+
+
+def convertGraphs(root_path, version=None, backup_ext=None, dry_run=False):
+    """
+    Converts graph files to another schema version, in place.
+    Walks folders recursively, JSON files that are not graphs (scores, settings) are left alone.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param root_path: A graph file or a folder of graphs.
+    :type root_path: str
+
+    :param version: 1 or 2, defaults to GRAPH_VERSION.
+    :type version: int
+
+    :param backup_ext: Keep the original next to the new file with this extension, like ".v1".
+    :type backup_ext: str
+
+    :param dry_run: Only report what would be converted.
+    :type dry_run: bool
+
+    :return: Full paths of the converted files.
+    :rtype: list
+
+    - Example::
+
+        graphUtils.convertGraphs(r"C:/repo/graphs", backup_ext=".v1")
+    """
+
+    if version is None:
+        version = GRAPH_VERSION
+
+    _paths = [root_path]
+    if os.path.isdir(root_path):
+        _paths = list()
+        for _root, _dirs, _files in os.walk(root_path):
+            _dirs.sort()
+            for _file in sorted(_files):
+                if _file.endswith((".json", binUtils.BINARY_EXT)):
+                    _paths.append(os.path.join(_root, _file))
+
+    _converted = list()
+    for _path in _paths:
+        try:
+            _data = readGraph(_path)
+        except ValueError:
+            continue
+
+        if not isinstance(_data, dict) or "nodes" not in _data:
+            continue
+
+        if getVersion(_data) == version:
+            continue
+
+        _converted.append(_path)
+        if dry_run:
+            continue
+
+        if backup_ext:
+            with open(_path, "rb") as _src, open(_path + backup_ext, "wb") as _dst:
+                _dst.write(_src.read())
+
+        writeGraph(_path, _data, version)
+
+    return _converted
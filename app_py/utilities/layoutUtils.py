@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Tidy tree layout (Reingold-Tilford, with Walker's linear time improvements).
+"""
+
+from __future__ import print_function
+
+
+def tidyTree(root, get_children, distance=120):
+    """
+    Lays out a tree in one O(n) pass, without recursion.
+    Siblings keep their order, parents are centred on their children
+    and subtrees are packed as close as "distance" allows, without overlaps.
+
+    Only the breadth axis is computed (the axis siblings are spread on),
+    the root is at 0.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param root: Root of the tree, any hashable object.
+    :type root: object
+
+    :param get_children: Called with a node, returns its children in order.
+    :type get_children: function
+
+    :param distance: Minimum distance between neighbouring nodes of the same level.
+    :type distance: float
+
+    :return: (node, parent, offset) tuples in pre-order, parent is None for the root.
+    :rtype: list
+
+    - Example::
+
+        for node, parent, offset in tidyTree(starter, getOutNodes):
+            node.position_y = starter.position_y + offset
+    """
+
+    # pre-order, nodes are ints from here on
+    _nodes = list()
+    _parents = list()
+    _kids = list()
+    _numbers = list()
+
+    _stack = [(root, -1, 1)]
+    while _stack:
+        _node, _parent, _number = _stack.pop()
+        _index = len(_nodes)
+
+        _nodes.append(_node)
+        _parents.append(_parent)
+        _numbers.append(_number)
+        _kids.append(list())
+
+        if _parent != -1:
+            _kids[_parent].append(_index)
+
+        _children = list(get_children(_node) or list())
+        for _n in range(len(_children) - 1, -1, -1):
+            _stack.append((_children[_n], _index, _n + 1))
+
+    _count = len(_nodes)
+    _prelim = [0.0] * _count
+    _mod = [0.0] * _count
+    _shift = [0.0] * _count
+    _change = [0.0] * _count
+    _middle = [0.0] * _count
+    _thread = [-1] * _count
+    _ancestor = list(range(_count))
+
+    def nextLeft(v):
+        return _kids[v][0] if _kids[v] else _thread[v]
+
+    def nextRight(v):
+        return _kids[v][-1] if _kids[v] else _thread[v]
+
+    def moveSubtree(wm, wp, shift):
+        _subtrees = float(_numbers[wp] - _numbers[wm])
+        _change[wp] -= shift / _subtrees
+        _shift[wp] += shift
+        _change[wm] += shift / _subtrees
+        _prelim[wp] += shift
+        _mod[wp] += shift
+
+    def apportion(v, default_ancestor):
+        _left = _kids[_parents[v]][_numbers[v] - 2]
+
+        vip = vop = v
+        vim = _left
+        vom = _kids[_parents[v]][0]
+
+        sip = _mod[vip]
+        sop = _mod[vop]
+        sim = _mod[vim]
+        som = _mod[vom]
+
+        while nextRight(vim) != -1 and nextLeft(vip) != -1:
+            vim = nextRight(vim)
+            vip = nextLeft(vip)
+            vom = nextLeft(vom)
+            vop = nextRight(vop)
+            _ancestor[vop] = v
+
+            shift = (_prelim[vim] + sim) - (_prelim[vip] + sip) + distance
+            if shift > 0:
+                _moved = _ancestor[vim]
+                if _parents[_moved] != _parents[v]:
+                    _moved = default_ancestor
+
+                moveSubtree(_moved, v, shift)
+                sip += shift
+                sop += shift
+
+            sim += _mod[vim]
+            sip += _mod[vip]
+            som += _mod[vom]
+            sop += _mod[vop]
+
+        if nextRight(vim) != -1 and nextRight(vop) == -1:
+            _thread[vop] = nextRight(vim)
+            _mod[vop] += sim - sop
+
+        if nextLeft(vip) != -1 and nextLeft(vom) == -1:
+            _thread[vom] = nextLeft(vip)
+            _mod[vom] += sip - som
+            default_ancestor = v
+
+        return default_ancestor
+
+    # first walk, post-order, a node places its children left to right
+    for v in range(_count - 1, -1, -1):
+        _children = _kids[v]
+        if not _children:
+            continue
+
+        _default = _children[0]
+        for w in _children:
+            if _numbers[w] > 1:
+                _prelim[w] = _prelim[_children[_numbers[w] - 2]] + distance
+                _mod[w] = _prelim[w] - _middle[w] if _kids[w] else 0.0
+                _default = apportion(w, _default)
+            else:
+                _prelim[w] = _middle[w]
+
+        # execute the shifts collected by apportion
+        _total = 0.0
+        _changes = 0.0
+        for w in reversed(_children):
+            _prelim[w] += _total
+            _mod[w] += _total
+            _changes += _change[w]
+            _total += _shift[w] + _changes
+
+        _middle[v] = (_prelim[_children[0]] + _prelim[_children[-1]]) * 0.5
+
+    # second walk, pre-order, sums the modifiers down from the root
+    _prelim[0] = _middle[0]
+    _sums = [0.0] * _count
+    _offsets = [0.0] * _count
+
+    for v in range(_count):
+        _offsets[v] = _prelim[v] + _sums[v]
+        for w in _kids[v]:
+            _sums[w] = _sums[v] + _mod[v]
+
+    _root_offset = _offsets[0]
+    return [(_nodes[v],
+             _nodes[_parents[v]] if _parents[v] != -1 else None,
+             _offsets[v] - _root_offset) for v in range(_count)]
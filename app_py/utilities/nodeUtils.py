@@ -36,10 +36,14 @@ import logging
 from PySide2.QtWidgets import QApplication
 from app_py.ui import widgets
 from app_py.configs import config_obj
+from app_py.utilities import profileUtils
 
 LOGGER = logging.getLogger(config_obj.get("DETAILS", "log_name"))
 LOGGER.propagate = True
 
+# file names found in each icons directory, see getIconPath
+_ICON_DIRS = dict()
+
 
 def getDescription(mod_path):
     """
@@ -114,17 +118,61 @@ def getIconPath(mod_path):
     _icon_path = os.path.join(mod_parent, "icons", "{}.png".format(module_name))
     _branch_path = os.path.join(mod_parent, "icons", "_default.png")
 
+    # each directory is listed once, instead of a stat per candidate
     for _icn in (_icon_path, _branch_path, config_obj.get("PATHS", "default_icon")):
-        if os.path.exists(_icn):
+        _icons_dir, _icon_name = os.path.split(_icn)
+        if os.path.normcase(_icon_name) in listIcons(_icons_dir):
             return _icn
 
     LOGGER.info("No icons found.")
 
 
+def listIcons(icons_dir):
+    """
+    Returns the file names in an icons directory, listed once and then cached.
+    Names are normalized with os.path.normcase.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param icons_dir: Full path of an "icons" folder.
+    :type icons_dir: str
+
+    :return: File names, empty if the folder doesn't exist.
+    :rtype: set
+    """
+
+    _names = _ICON_DIRS.get(icons_dir)
+    if _names is None:
+        try:
+            _names = set(os.path.normcase(n) for n in os.listdir(icons_dir))
+        except OSError:
+            _names = set()
+
+        _ICON_DIRS[icons_dir] = _names
+
+    return _names
+
+
+def clearIcons(icons_dir=None):
+    """
+    Forgets the cached listing of an icons directory, or of all of them.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param icons_dir: Full path of an "icons" folder, None for all.
+    :type icons_dir: str
+    """
+
+    if icons_dir is None:
+        _ICON_DIRS.clear()
+    else:
+        _ICON_DIRS.pop(icons_dir, None)
+
+
 def getObject(node_data, scene_obj):
     """
     Used to get a object using its name and uuid.
-    Will search a scene's items (ALL).
+    Uses the scene's node index, scenes without one have all their items searched.
 
     **parameters**, **types**, **return** and **return types**
 
@@ -141,27 +189,29 @@ def getObject(node_data, scene_obj):
     :rtype: NoneType
     """
 
-    all_nodes = [i for i in scene_obj.items() if type(i) in [widgets.ItemNode, widgets.StartNode]]
-    for nd in all_nodes:
-        if nd.name != node_data["name"]:
-            continue
+    nd_uuid = node_data["uuid"]
 
-        # TO-DO UUID is a bit buggy for now
-        nd_uuid = node_data["uuid"]
+    if sys.version_info[0] > 2:
+        bad_t = not isinstance(nd_uuid, str)\
+                and not isinstance(nd_uuid, uuid.UUID)
+    else:
+        bad_t = not isinstance(nd_uuid, str)\
+                and not isinstance(nd_uuid, unicode)\
+                and not isinstance(nd_uuid, uuid.UUID)
 
-        if sys.version_info[0] > 2:
-            bad_t = not isinstance(nd_uuid, str)\
-                    and not isinstance(nd_uuid, uuid.UUID)
-        else:
-            bad_t = not isinstance(nd_uuid, str)\
-                    and not isinstance(nd_uuid, unicode)\
-                    and not isinstance(nd_uuid, uuid.UUID)
+    if bad_t:
+        raise TypeError("Not a str, unicode or uuid.UUID", nd_uuid, type(nd_uuid))
 
-        if bad_t:
-            raise TypeError("Not a str, unicode or uuid.UUID", nd_uuid, type(nd_uuid))
+    if isinstance(scene_obj, widgets.GraphicsScene):
+        return scene_obj.getNode(node_data["name"], nd_uuid)
 
-        if not isinstance(nd_uuid, uuid.UUID):
-            nd_uuid = uuid.UUID(nd_uuid)
+    if not isinstance(nd_uuid, uuid.UUID):
+        nd_uuid = uuid.UUID(nd_uuid)
+
+    all_nodes = [i for i in scene_obj.items() if type(i) in [widgets.ItemNode, widgets.StartNode]]
+    for nd in all_nodes:
+        if nd.name != node_data["name"]:
+            continue
 
         if str(nd.uuid) == str(nd_uuid):
             return nd
@@ -214,46 +264,60 @@ def printTree(node_obj):
 
     Set the node object to Starter node to parse all.
     This WILL NOT parse nodes that are not connected by wire.
+    Walks the graph with an explicit stack, deep graphs won't hit the recursion limit.
     """
 
-    LOGGER.info("printTree:", node_obj.name)
-
-    out_dict = dict()
-    out_dict["name"] = node_obj.name
-    out_dict["class"] = ".".join(node_obj.__str__().split(".")[-2:])
-    out_dict["icon"] = node_obj.icon_path
-    out_dict["description"] = node_obj.description
-    out_dict["command"] = node_obj.command
-    out_dict["x"] = node_obj.position_x
-    out_dict["y"] = node_obj.position_y
-    out_dict["uuid"] = str(node_obj.uuid)
-    out_dict["out_nodes"] = list()
-    out_dict["in_node"] = node_obj.node_in
-
-    # get in-nodes if itemNode
-    if isinstance(node_obj, widgets.ItemNode):
-        if node_obj.node_in:
-            out_dict["in_node"] = node_obj.node_in
-
-    # to uuid
-    if out_dict["in_node"]:
-        tmp_id = out_dict["in_node"].get("uuid")
-        if isinstance(tmp_id, uuid.UUID):
-            out_dict["in_node"]["uuid"] = str(tmp_id)
-
-    # run out-nodes
-    for nd_out in node_obj.nodes_out:
-        next_node = getObject(nd_out, node_obj.scene)
-        if not next_node:
-            e = " - Out-node not found", nd_out.get("name", "")
-            LOGGER.info(nd_out)
-            LOGGER.info(e)
-            raise AttributeError(e)
-
-        out_dict["out_nodes"].append(printTree(next_node))
-
-    LOGGER.info("Processed: {}".format(node_obj.name))
-    return out_dict
+    _root = None
+    _stack = [(node_obj, None)]
+
+    while _stack:
+        _node, _parent_list = _stack.pop()
+        LOGGER.info("printTree: {}".format(_node.name))
+
+        out_dict = dict()
+        out_dict["name"] = _node.name
+        out_dict["class"] = ".".join(_node.__str__().split(".")[-2:])
+        out_dict["icon"] = _node.icon_path
+        out_dict["description"] = _node.description
+        out_dict["command"] = _node.command
+        out_dict["x"] = _node.position_x
+        out_dict["y"] = _node.position_y
+        out_dict["uuid"] = str(_node.uuid)
+        out_dict["out_nodes"] = list()
+        out_dict["in_node"] = _node.node_in
+
+        # get in-nodes if itemNode
+        if isinstance(_node, widgets.ItemNode):
+            if _node.node_in:
+                out_dict["in_node"] = _node.node_in
+
+        # to uuid
+        if out_dict["in_node"]:
+            tmp_id = out_dict["in_node"].get("uuid")
+            if isinstance(tmp_id, uuid.UUID):
+                out_dict["in_node"]["uuid"] = str(tmp_id)
+
+        if _parent_list is None:
+            _root = out_dict
+        else:
+            _parent_list.append(out_dict)
+
+        # out-nodes, reversed so the first one is processed first
+        _next_nodes = list()
+        for nd_out in _node.nodes_out:
+            next_node = getObject(nd_out, _node.scene)
+            if not next_node:
+                e = " - Out-node not found", nd_out.get("name", "")
+                LOGGER.info(nd_out)
+                LOGGER.info(e)
+                raise AttributeError(e)
+
+            _next_nodes.append((next_node, out_dict["out_nodes"]))
+
+        _stack.extend(reversed(_next_nodes))
+        LOGGER.info("Processed: {}".format(_node.name))
+
+    return _root
 
 
 def uniqueName(scene_obj, node_name):
@@ -276,6 +340,10 @@ def uniqueName(scene_obj, node_name):
         uniqueName(self.scene,nodename):
     """
 
+    if isinstance(scene_obj, widgets.GraphicsScene):
+        _named = scene_obj.getNodesByName(node_name)
+        return not [_nd for _nd in _named if isinstance(_nd, widgets.ItemNode)]
+
     for _nd in scene_obj.items():
         if "itemNode" not in _nd.__str__():
             continue
@@ -286,17 +354,40 @@ def uniqueName(scene_obj, node_name):
     return True
 
 
+def postProcessNode(scene_obj, node):
+    """
+    Copies the state of a node that ran to its node in the scene.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param scene_obj: Pointer of a QGraphicsScene object.
+    :type scene_obj: object
+
+    :param node: A node that ran.
+    :type node: NodeDummy
+
+    :return: The scene's node, None if it's not in the scene.
+    :rtype: object
+    """
+
+    _dummy_obj = getObject({"name": node.name, "uuid": node.uuid}, scene_obj)
+    if _dummy_obj is None:
+        return None
+
+    _msg = "\n".join(node.messages + [profileUtils.formatMetrics(node.metrics)]).strip()
+    _dummy_obj.description = node.description
+    _dummy_obj.setErrors(node.getErrors())
+
+    if node.error:
+        _dummy_obj.setDirty(state="error", message=_msg)
+    elif node.skip:
+        _dummy_obj.setDirty(state="skip", message=_msg)
+    else:
+        _dummy_obj.setDirty(message=_msg or None)
+
+    return _dummy_obj
+
+
 def postProcessNodes(scene_obj, nodes_list):
     for _node in nodes_list:
-        _dummy_dict = {"name": _node.name, "uuid": _node.uuid}
-        _dummy_obj = getObject(_dummy_dict, scene_obj)
-        _msg = "\n".join(_node.messages)
-        _dummy_obj.description = _node.description
-        _dummy_obj.setErrors(_node.getErrors())
-
-        if _node.error:
-            _dummy_obj.setDirty(state="error", message=_msg)
-        elif _node.skip:
-            _dummy_obj.setDirty(state="skip", message=_msg)
-        else:
-            _dummy_obj.setDirty()
+        postProcessNode(scene_obj, _node)
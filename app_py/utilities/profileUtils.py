@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+import threading
+
+try:
+    import resource
+except ImportError:
+    # windows
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    # python 2
+    tracemalloc = None
+
+# "off" records nothing, "time" records wall time, cpu time and peak rss,
+# "memory" also traces python allocations (python 3 only, slows modules down)
+PROFILES = ("off", "time", "memory")
+
+# ru_maxrss is in bytes on mac and in kilobytes elsewhere
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+if hasattr(time, "thread_time"):
+    _CPU_SCOPE = "thread"
+    _cpuClock = time.thread_time
+elif resource is not None and hasattr(resource, "RUSAGE_THREAD"):
+    _CPU_SCOPE = "thread"
+
+    def _cpuClock():
+        _usage = resource.getrusage(resource.RUSAGE_THREAD)
+        return _usage.ru_utime + _usage.ru_stime
+else:
+    # includes every thread of the process
+    _CPU_SCOPE = "process"
+
+    def _cpuClock():
+        _times = os.times()
+        return _times[0] + _times[1]
+
+_TRACE_LOCK = threading.Lock()
+
+# runs using tracemalloc, and whether this module turned it on
+_TRACE_RUNS = 0
+_TRACE_STARTED = False
+
+
+def _peakRss():
+    if resource is None:
+        return None
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+
+
+def getWrites(data_block, before=None):
+    """
+    Returns the keys a node set or deleted.
+    DataBlocks know their own changes since they were copied,
+    plain dicts are compared to the shallow copy taken before the node (by identity,
+    changes made inside a value that stays the same object are not seen).
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param data_block: The datablock after the node ran.
+    :type data_block: dict
+
+    :param before: Shallow copy of a plain dict before the node ran.
+    :type before: dict
+
+    :return: The keys, sorted.
+    :rtype: list
+    """
+
+    if hasattr(data_block, "changedKeys"):
+        return sorted(data_block.changedKeys(), key=str)
+
+    if before is None:
+        return list()
+
+    _writes = [k for k, v in data_block.items() if k not in before or before[k] is not v]
+    _writes.extend(k for k in before if k not in data_block)
+    return sorted(_writes, key=str)
+
+
+def startTracing():
+    """
+    Turns on tracemalloc for a "memory" run, pair it with stopTracing() when the run ends.
+    Tracing that was already on is left alone.
+    """
+
+    global _TRACE_RUNS, _TRACE_STARTED
+
+    if tracemalloc is None:
+        return
+
+    with _TRACE_LOCK:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _TRACE_STARTED = True
+
+        _TRACE_RUNS += 1
+
+
+def stopTracing():
+    """
+    Turns tracemalloc off once the last run using it ends, if startTracing() turned it on.
+    """
+
+    global _TRACE_RUNS, _TRACE_STARTED
+
+    if tracemalloc is None:
+        return
+
+    with _TRACE_LOCK:
+        _TRACE_RUNS = max(0, _TRACE_RUNS - 1)
+
+        if not _TRACE_RUNS and _TRACE_STARTED:
+            tracemalloc.stop()
+            _TRACE_STARTED = False
+
+
+def snapshot(profile, data_block=None):
+    """
+    Returns the counters at the start of a node, give it to measure() when it ends.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param profile: One of PROFILES.
+    :type profile: str
+
+    :param data_block: The datablock given to the node, to find which keys it writes.
+                       Plain dicts are copied for that, only give it when writes are needed.
+    :type data_block: dict
+
+    :return: The counters, None if profile is "off".
+    :rtype: tuple
+
+    - Example::
+
+        _start = profileUtils.snapshot("time", _copy_block)
+        _run_result = _main(_copy_block)
+        _dummy.metrics = profileUtils.measure(_start, _copy_block)
+    """
+
+    if profile == "off":
+        return None
+
+    if profile not in PROFILES:
+        raise ValueError("Invalid profile: {}".format(profile))
+
+    _begin = time.time()
+
+    _traced = None
+    if profile == "memory" and tracemalloc is not None:
+        # process workers have no run to start it, it ends with the worker
+        if not tracemalloc.is_tracing():
+            startTracing()
+
+        _traced = tracemalloc.get_traced_memory()[0]
+
+        # peaks are per node, not since tracing started
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    _before = None
+    if data_block is not None and not hasattr(data_block, "changedKeys"):
+        _before = dict(data_block)
+
+    _counters = (_before, _peakRss(), _traced, _cpuClock(), time.time())
+    return _counters + (_counters[4] - _begin,)
+
+
+def measure(start, data_block=None):
+    """
+    Returns what a node used since snapshot() was called.
+    Peak RSS and allocations are process wide, on the "thread" executor
+    they include whatever other nodes did at the same time.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param start: What snapshot() returned.
+    :type start: tuple
+
+    :param data_block: The datablock the node wrote to (a copy of the given one when not propagating).
+    :type data_block: dict
+
+    :return: start (time.time()), wall and cpu (seconds), rss_peak_delta (bytes, None on windows),
+             writes (keys set or deleted, only if data_block is given),
+             cpu_scope ("thread" or "process"), overhead (seconds spent measuring)
+             and with the "memory" profile alloc_delta and alloc_peak (bytes, python 3.9+).
+             Empty if profiling is off.
+    :rtype: dict
+    """
+
+    if start is None:
+        return dict()
+
+    _end = time.time()
+    _cpu = _cpuClock()
+    _rss = _peakRss()
+    _before, _rss_start, _traced_start, _cpu_start, _wall_start, _overhead = start
+
+    _metrics = {"start": _wall_start,
+                "wall": _end - _wall_start,
+                "cpu": _cpu - _cpu_start,
+                "cpu_scope": _CPU_SCOPE,
+                "rss_peak_delta": None if _rss is None else _rss - _rss_start}
+
+    if _traced_start is not None:
+        _current, _peak = tracemalloc.get_traced_memory()
+        _metrics["alloc_delta"] = _current - _traced_start
+
+        if hasattr(tracemalloc, "reset_peak"):
+            _metrics["alloc_peak"] = max(0, _peak - _traced_start)
+
+    if data_block is not None:
+        _metrics["writes"] = getWrites(data_block, _before)
+
+    _metrics["overhead"] = _overhead + time.time() - _end
+    return _metrics
+
+
+def formatMetrics(metrics):
+    """
+    Returns metrics as one line for node tooltips.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param metrics: What measure() returned.
+    :type metrics: dict
+
+    :return: Like "Took 1.204s (cpu 0.950s, rss +12.0 MB)", empty if there are no metrics.
+    :rtype: str
+    """
+
+    if not metrics:
+        return ""
+
+    _details = ["cpu {:.3f}s".format(metrics["cpu"])]
+
+    if metrics.get("rss_peak_delta"):
+        _details.append("rss +{:.1f} MB".format(metrics["rss_peak_delta"] / 1048576.0))
+
+    if "alloc_delta" in metrics:
+        _details.append("alloc {:+.1f} MB".format(metrics["alloc_delta"] / 1048576.0))
+
+    return "Took {:.3f}s ({})".format(metrics["wall"], ", ".join(_details))
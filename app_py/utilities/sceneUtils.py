@@ -29,12 +29,18 @@ from __future__ import print_function
 
 import os
 import uuid
-import json
+
+from contextlib import contextmanager
 
 import nodeUtils
+import binUtils
+import graphUtils
+import layoutUtils
 from ..ui import widgets
+from .. import graphCache
 from app_py.configs import config_obj
 from PySide2.QtWidgets import QFileDialog
+from PySide2.QtWidgets import QGraphicsScene
 
 
 def getGraph(folder_start, save=False):
@@ -66,12 +72,12 @@ def getGraph(folder_start, save=False):
     j_file, _ = _diag(QFileDialog(),
                       "Save/Open Flow Graph:",
                       folder_start,
-                      "JSON (*.json)")
+                      "Graphs (*.json *{0});;JSON (*.json);;Binary (*{0})".format(binUtils.BINARY_EXT))
 
     if not save and not os.path.exists(j_file):
         return
 
-    if not j_file.endswith(".json"):
+    if not j_file.endswith((".json", binUtils.BINARY_EXT)):
         return
 
     return j_file
@@ -101,43 +107,26 @@ def buildGraph(scene_obj, json_file, data_block={}):
     """
 
     scene_obj.clear()
-    _nodes_data = None
     _json_data = readGraphJson(json_file)
 
     if not _json_data:
         return "Failed to read: {}".format(json_file)
 
-    # nodes
+    # nodes, nested (v1) graphs are flattened
     try:
-        _nodes_data = _json_data.get("nodes", _json_data)
+        _json_data = graphUtils.toFlat(_json_data)
     except:
         return "No nodes data: {}".format(json_file)
 
-    # create starter
-    _starter = widgets.StartNode(_nodes_data["name"],
-                                 _nodes_data["x"],
-                                 _nodes_data["y"],
-                                 scene_obj)
-    _starter.setUUID(_nodes_data["uuid"])
-
-    # rebuild starter out nodes
-    _tmp_nodes = list()
-    for _node in _nodes_data["out_nodes"]:
-        _tmp_nfo = {"name": _node["name"],
-                    "uuid": uuid.UUID(_node["uuid"])
-                    }
-
-        _tmp_nodes.append(_tmp_nfo)
-    _starter.nodes_out = _tmp_nodes
+    # nodes and wires in one pass over the flat graph
+    with bulkBuild(scene_obj):
+        _starter, _nodes = buildNodes(_json_data, scene_obj)
+        linkNodes(_json_data, _nodes, scene_obj)
 
     # creates a copy of the datablock for the starter
     if isinstance(data_block, dict) and data_block:
         _starter.data_block = data_block.copy()
 
-    # build and link
-    buildTreeRecurse(_nodes_data["out_nodes"], scene_obj)
-    linkTreeRecurse(_nodes_data, scene_obj)
-
     # groups, if any
     _gp_data = _json_data.get("groups", list())
     for _gp in _gp_data:
@@ -172,6 +161,157 @@ def buildGraph(scene_obj, json_file, data_block={}):
     return _starter
 
 
+@contextmanager
+def bulkBuild(scene_obj):
+    """
+    Use this around code adding many items to a scene.
+    Stops the scene's BSP indexing, its signals and the updates of its views,
+    the index is rebuilt once and the views are redrawn once at the end.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param scene_obj: Pointer of a QGraphicsScene object.
+    :type scene_obj: object
+
+    - Example::
+
+        with bulkBuild(self.scene):
+            buildNodes(graph_data, self.scene)
+    """
+
+    _index_method = scene_obj.itemIndexMethod()
+    _views = scene_obj.views()
+
+    scene_obj.setItemIndexMethod(QGraphicsScene.NoIndex)
+    _signals_blocked = scene_obj.blockSignals(True)
+    for _view in _views:
+        _view.setUpdatesEnabled(False)
+
+    try:
+        yield scene_obj
+    finally:
+        scene_obj.blockSignals(_signals_blocked)
+        scene_obj.setItemIndexMethod(_index_method)
+
+        for _view in _views:
+            _view.setUpdatesEnabled(True)
+
+        scene_obj.update()
+
+
+def buildNodes(graph_data, scene_obj):
+    """
+    Creates the starter and all nodes of a graph, with their in and out info.
+    Links are resolved through a uuid dict, the scene is never searched.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param graph_data: Graph data, v1 or v2.
+    :type graph_data: dict
+
+    :param scene_obj: Pointer of a QGraphicsScene object.
+    :type scene_obj: object
+
+    :return: The starter node and a dict of every node by uuid (str).
+    :rtype: tuple
+
+    - Example::
+
+        with bulkBuild(self.scene):
+            _starter, _nodes = buildNodes(graph_data, self.scene)
+            linkNodes(graph_data, _nodes, self.scene)
+    """
+
+    _flat = graphUtils.toFlat(graph_data)
+    _names = dict()
+    _nodes_out = dict()
+    _node_in = dict()
+
+    for _data in _flat["nodes"]:
+        _names[_data["uuid"]] = _data["name"]
+
+    for _source, _target in _flat["edges"]:
+        _nodes_out.setdefault(_source, list()).append({"name": _names[_target],
+                                                       "uuid": uuid.UUID(_target)})
+        _node_in[_target] = {"name": _names[_source],
+                             "uuid": uuid.UUID(_source)}
+
+    _starter = None
+    _nodes = dict()
+    _icons = dict()
+    _default_icon = config_obj.get("PATHS", "default_icon")
+
+    for _data in _flat["nodes"]:
+        _uuid = _data["uuid"]
+
+        if _uuid == _flat["start"]:
+            _starter = widgets.StartNode(_data["name"],
+                                         _data["x"],
+                                         _data["y"],
+                                         scene_obj)
+            _starter.setUUID(_uuid)
+            _node = _starter
+        else:
+            _node = widgets.ItemNode(_data["name"],
+                                     _data["x"],
+                                     _data["y"],
+                                     scene_obj,
+                                     _data["description"],
+                                     _uuid)
+            _node.command = _data.get("command", "")
+            _node.node_in = _node_in.get(_uuid)
+
+            # icon, checked once per path
+            _icon = _data.get("icon", None)
+            if _icon not in _icons:
+                _icons[_icon] = _icon if _icon and os.path.exists(_icon) else _default_icon
+            _node.changeIcon(_icons[_icon])
+
+        _node.nodes_out = _nodes_out.get(_uuid, list())
+        _nodes[_uuid] = _node
+
+    return _starter, _nodes
+
+
+def linkNodes(graph_data, nodes, scene_obj):
+    """
+    Creates the wires of a graph, nodes are looked up in the dict from buildNodes.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param graph_data: Graph data, v1 or v2.
+    :type graph_data: dict
+
+    :param nodes: Every node by uuid (str).
+    :type nodes: dict
+
+    :param scene_obj: Pointer of a QGraphicsScene object.
+    :type scene_obj: object
+
+    :return: The new wires.
+    :rtype: list
+    """
+
+    _wires = list()
+
+    for _source, _target in graphUtils.toFlat(graph_data)["edges"]:
+        nodeA = nodes[_source]
+        nodeB = nodes[_target]
+
+        new_wire = widgets.WireNode()
+        new_wire.source = nodeA.plug_out
+        new_wire.target = nodeB.plug_in
+        new_wire.pointA = nodeA.plug_out.getCenter()
+        new_wire.pointB = nodeB.plug_in.getCenter()
+
+        nodeA.plug_out.out_wires.append(new_wire)
+        nodeB.plug_in.in_wire = new_wire
+        scene_obj.addItem(new_wire)
+        _wires.append(new_wire)
+
+    return _wires
+
+
 def getSelected(scene_obj):
     """
     Method returning selected nodes from the scene object.
@@ -211,7 +351,11 @@ def getStarter(scene_obj):
 
     start_node = None
 
-    for _nd in scene_obj.items():
+    _nodes = scene_obj.items()
+    if isinstance(scene_obj, widgets.GraphicsScene):
+        _nodes = scene_obj.getNodes()
+
+    for _nd in _nodes:
         if not type(_nd) == widgets.StartNode:
             continue
 
@@ -221,10 +365,11 @@ def getStarter(scene_obj):
     return start_node
 
 
-def searchTree(scene_obj, node_keyword):
+def searchTree(scene_obj, node_keyword, fuzzy=False):
     """
     Searches the scene and returns nodes that match.
     The keyword is not case-sensitive.
+    Uses the scene's name index when it has one, best matches first.
 
     **parameters**, **types**, **return** and **return types**
 
@@ -234,7 +379,10 @@ def searchTree(scene_obj, node_keyword):
     :param node_keyword: Prefix to be searched.
     :type node_keyword: str
 
-    :return: A list of nodes that starts with node_keyword.
+    :param fuzzy: Return close names (typos) when none contain node_keyword.
+    :type fuzzy: bool
+
+    :return: A list of nodes that contain node_keyword.
     :rtype: list
 
     - Example::
@@ -246,6 +394,9 @@ def searchTree(scene_obj, node_keyword):
     if not node_keyword:
         return _out
 
+    if hasattr(scene_obj, "searchNodes"):
+        return scene_obj.searchNodes(node_keyword, fuzzy)
+
     for _nd in getNodes(scene_obj):
         if node_keyword.lower() in _nd.name.lower():
             _out.append(_nd)
@@ -275,6 +426,41 @@ def setClean(scene_obj):
     scene_obj.update()
 
 
+def setSelection(scene_obj, nodes_list):
+    """
+    Selects exactly these nodes in one batch.
+    Only items whose state changes are touched and selectionChanged is emitted once.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param scene_obj: Pointer of a QGraphicsScene object.
+    :type scene_obj: object
+
+    :param nodes_list: Nodes to select, everything else is unselected.
+    :type nodes_list: list
+
+    - Example::
+
+        setSelection(self.scene, searchTree(self.scene, "publish"))
+    """
+
+    _wanted = set(id(n) for n in nodes_list)
+    _signals_blocked = scene_obj.blockSignals(True)
+
+    try:
+        for _item in scene_obj.selectedItems():
+            if id(_item) not in _wanted:
+                _item.setSelected(False)
+
+        for _node in nodes_list:
+            if not _node.isSelected():
+                _node.setSelected(True)
+    finally:
+        scene_obj.blockSignals(_signals_blocked)
+
+    scene_obj.selectionChanged.emit()
+
+
 def clearSelection(scene_obj):
     """
     Unselect all nodes in the scene.
@@ -310,6 +496,9 @@ def getNodes(scene_obj):
         getNodes(self.scene)
     """
 
+    if isinstance(scene_obj, widgets.GraphicsScene):
+        return [n for n in scene_obj.getNodes() if isinstance(n, widgets.ItemNode)]
+
     return [n for n in scene_obj.items() if isinstance(n, widgets.ItemNode)]
 
 
@@ -388,126 +577,74 @@ def getBadNodes(scene_obj):
     return _bads
 
 
-def buildTreeRecurse(tree_list, scene_item):
+def getOutNodes(node_obj):
     """
-    Builds a tree from a starting list and the information stored there.
+    Returns the nodes wired to the out plug of a node.
 
     **parameters**, **types**, **return** and **return types**
 
-    :param tree_list: Data from tree dict with key ["out_nodes"]
-    :type tree_list: list
-
-    :param scene_item: Pointer of a QGraphicsScene object.
-    :type scene_item: object
-
-    :return: None
-    :rtype: NoneType
-
-    - Example::
-
-        buildTreeRecurse(tree_data["out_nodes"],self.ui.scene)
+    :param node_obj: Object pointer of a node.
+    :type node_obj: object
 
-    :notes: The data is generated from recurse of nodeUtils on graph saving.
+    :return: Down-stream nodes, in wire order.
+    :rtype: list
     """
 
-    if not tree_list:
-        return
-
-    for tnd in tree_list:
-        if tnd["class"] != "widgets.ItemNode":
-            continue
-
-        _new_node = nodeUtils.getObject(tnd, scene_item)
-
-        # create a new node if not in the scene and is unique
-        if _new_node is None:
-            _new_node = widgets.ItemNode(tnd["name"],
-                                         tnd["x"],
-                                         tnd["y"],
-                                         scene_item,
-                                         tnd["description"],
-                                         tnd["uuid"])
-            _new_node.command = tnd.get("command", "")
+    if not getattr(node_obj, "plug_out", None):
+        return list()
 
-            # rebuild a node's in and out info
-            if tnd["in_node"]:
-                _nfo_in = getInfoDict(tnd["in_node"])
-                _new_node.node_in = _nfo_in
-            else:
-                _new_node.node_in = None
+    return [w.target.parentItem() for w in node_obj.plug_out.out_wires if w.target]
 
-            _tmp_out = list()
-            for _on in tnd["out_nodes"]:
-                _nfo_out = getInfoDict(_on)
-                if _nfo_out:
-                    _tmp_out.append(_nfo_out)
 
-            _new_node.nodes_out = _tmp_out
-
-            # icon
-            _icon = tnd.get("icon", None)
-            if not _icon or not os.path.exists(_icon):
-                _new_node.changeIcon(config_obj.get("PATHS", "default_icon"))
-            else:
-                _new_node.changeIcon(_icon)
-
-        # recurse
-        buildTreeRecurse(tnd["out_nodes"], scene_item)
-
-
-def linkTreeRecurse(tree_data, scene_item):
+def alignTree(node_obj, spacing_x=50, spacing_y=120):
     """
-    Reconnects all nodes in the dictionary.
-    This is recursive
+    Aligns all down-stream nodes of the specified node object, which stays in place.
+    Uses a tidy tree layout (see layoutUtils.tidyTree), nodes never overlap
+    and the positions are all computed before anything is moved.
+    Each wire is redrawn once, after all the nodes moved.
 
     **parameters**, **types**, **return** and **return types**
 
-    :param tree_data: dictionary data parsed from JSON.
-    :type tree_data: dict
+    :param node_obj: Object pointer of a node or the starter.
+    :type node_obj: object
 
-    :param scene_item: Pointer of a QGraphicsScene object.
-    :type scene_item: object
+    :param spacing_x: Gap between a node and its down-stream nodes.
+    :type spacing_x: int
 
-    :return: None
-    :rtype: NoneType
+    :param spacing_y: Distance between the centers of neighbouring nodes.
+    :type spacing_y: int
+
+    :return: Every node that was aligned.
+    :rtype: list
 
     - Example::
-        linkTreeRecurse(tree_data,self.ui.scene)
 
-    :notes: The data is generated from the graph JSON file.
+        alignTree(self.starter)
     """
 
-    to_nodes = tree_data["out_nodes"]
+    if not isinstance(node_obj, (widgets.ItemNode, widgets.StartNode)):
+        return list()
 
-    if not to_nodes:
-        return
+    _layout = layoutUtils.tidyTree(node_obj, getOutNodes, spacing_y)
+    _nodes = list()
 
-    nodeA = nodeUtils.getObject(tree_data, scene_item)
-    if not nodeA:
-        "Failed to find node - linkTreeRecurse"
+    with bulkBuild(node_obj.scene):
+        for _node, _parent, _offset in _layout:
+            if _parent is not None:
+                _node.position_x = _parent.position_x + _node.width + spacing_x
+                _node.position_y = node_obj.position_y + _offset
+                _node.translate()
 
-    for tnd in to_nodes:
-        nodeB = nodeUtils.getObject(tnd, scene_item)
-        if not nodeB:
-            "Destination node not found: {}".format(tnd.get("name", "Failed to get name"))
+            _nodes.append(_node)
 
-        new_wire = widgets.WireNode()
-        new_wire.source = nodeA.plug_out
-        new_wire.target = nodeB.plug_in
-        new_wire.pointA = nodeA.plug_out.getCenter()
-        new_wire.pointB = nodeB.plug_in.getCenter()
-
-        nodeA.plug_out.out_wires.append(new_wire)
-        nodeB.plug_in.in_wire = new_wire
-        scene_item.addItem(new_wire)
+        node_obj.scene.updateWires()
 
-        linkTreeRecurse(tnd, scene_item)
+    return _nodes
 
 
 def alignTreeRecurse(node_obj):
     """
-    Aligns all down-stream nodes of the specified node object.
-    Will prevent covering other nodes but should be called 2x just in case.
+    Kept for older scripts, same as alignTree.
 
     **parameters**, **types**, **return** and **return types**
 
@@ -516,57 +653,16 @@ def alignTreeRecurse(node_obj):
 
     :return: None
     :rtype: NoneType
-
-    - Example::
-
-        alignTreeRecurse(self.starter)
-
-    :notes: This is usually called 2x to prevent overlaps.
     """
 
-    def update():
-        node_obj.translate()
-        node_obj.drawMe()
-
-    if not isinstance(node_obj, widgets.ItemNode):
-        return
-
-    if not node_obj.plug_in:
-        update()
-        for _out_wire in node_obj.plug_out.out_wires:
-            if not _out_wire.target:
-                continue
-
-            _target_parent = _out_wire.target.parentItem()
-            alignTreeRecurse(_target_parent)
-    else:
-        if not node_obj.plug_in.in_wire:
-            return
-
-        in_p = node_obj.plug_in.in_wire.source.parentItem()
-        in_p_targets = [w.target.parentItem() for w in in_p.plug_out.out_wires if w.target]
-        p_index = in_p_targets.index(node_obj)
-
-        node_obj.position_x = in_p.position_x + node_obj.width + 50
-        node_obj.position_y = in_p.position_y + (120 * p_index)
-
-        if node_obj.coveredBy():
-            node_obj.position_y += 120
-
-        update()
-
-        for _wire in node_obj.plug_out.out_wires:
-            if not _wire.target:
-                continue
-
-            out_p = _wire.target.parentItem()
-            alignTreeRecurse(out_p)
+    alignTree(node_obj)
 
 
 def write(file_path, data):
     """
     Saves a json file from the scene graph.
     Contents of json file must be generated from nodeUtils.recurse.
+    Written in the flat (v2) format, see graphUtils.toFlat.
     Will create parent directories when not found.
 
     **parameters**, **types**, **return** and **return types**
@@ -600,8 +696,7 @@ def write(file_path, data):
             return
 
     try:
-        with open(file_path, "w") as file_path:
-            json.dump(data, file_path, indent=4)
+        graphUtils.writeGraph(file_path, data)
     except Exception as err:
         print(str(err))
         return
@@ -613,7 +708,7 @@ def readGraphJson(file_path):
     """
     Reads a json file and returns its contents as a dict.
     Contents of json file must be generated from nodeUtils.recurse.
-    Used for recreating a graph.
+    Used for recreating a graph. The data comes from graphCache and must not be changed.
 
     **parameters**, **types**, **return** and **return types**
 
@@ -636,8 +731,7 @@ def readGraphJson(file_path):
         return
 
     try:
-        with open(file_path) as json_buffer:
-            datas = json.load(json_buffer)
+        datas = graphCache.CACHE.read(file_path)
     except Exception as err:
         print(str(err))
         print("Failed to read: {}".format(file_path))
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Name index for searching nodes, trigrams plus fuzzy ranking.
+"""
+
+from __future__ import division
+from __future__ import print_function
+
+# fuzzy matches need at least this share of the keyword's trigrams
+FUZZY_RATIO = 0.5
+
+
+def getGrams(text, size=3):
+    """
+    Returns the set of n-grams of a text, padded so short words have some too.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param text: Lower case text.
+    :type text: str
+
+    :param size: Length of the grams.
+    :type size: int
+
+    :return: The grams.
+    :rtype: set
+
+    - Example::
+
+        getGrams("pub")
+        # {" pu", "pub", "ub "}
+    """
+
+    _padded = " {} ".format(text)
+    return set(_padded[i:i + size] for i in range(len(_padded) - size + 1))
+
+
+class NameIndex(object):
+    """
+    Indexes names by trigram, so searches only look at names sharing part of the keyword.
+    Search is not case-sensitive, results are ranked: exact name, then prefix, then substring.
+    When nothing contains the keyword, names sharing most of its trigrams are returned (typos).
+
+    **parameters**, **types**, **return** and **return types**
+
+    - Example::
+
+        _index = NameIndex()
+        _index.add("4d1c...", "publishMesh")
+        _index.search("publsh")
+        # ["4d1c..."]
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self):
+        self._names = dict()
+        self._grams = dict()
+
+    def __len__(self):
+        return len(self._names)
+
+    def add(self, key, name):
+        """
+        Adds a name, or renames it if key is already indexed.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param key: Unique key, like a node's uuid.
+        :type key: str
+
+        :param name: Name to search.
+        :type name: str
+        """
+
+        if key in self._names:
+            self.remove(key)
+
+        _name = name.lower()
+        self._names[key] = _name
+
+        for _gram in getGrams(_name):
+            self._grams.setdefault(_gram, set()).add(key)
+
+    def remove(self, key):
+        """
+        Removes a key, does nothing if it's not indexed.
+        """
+
+        _name = self._names.pop(key, None)
+        if _name is None:
+            return
+
+        for _gram in getGrams(_name):
+            _keys = self._grams.get(_gram)
+            if _keys is None:
+                continue
+
+            _keys.discard(key)
+            if not _keys:
+                del self._grams[_gram]
+
+    def clear(self):
+        self._names = dict()
+        self._grams = dict()
+
+    def search(self, keyword, fuzzy=True, limit=None):
+        """
+        Returns the keys whose names match the keyword, best first.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param keyword: Text to look for.
+        :type keyword: str
+
+        :param fuzzy: Fall back to names sharing most of the keyword's trigrams if none contain it.
+        :type fuzzy: bool
+
+        :param limit: Maximum number of keys, None for all.
+        :type limit: int
+
+        :return: Ranked keys.
+        :rtype: list
+        """
+
+        _keyword = keyword.lower().strip()
+        if not _keyword:
+            return list()
+
+        # too short for trigrams of its own, check every name
+        if len(_keyword) < 3:
+            _ranked = list()
+            for _key, _name in self._names.items():
+                _rank = self._rank(_keyword, _name, None)
+                if _rank is not None:
+                    _ranked.append((_rank, _key))
+
+            return [k for r, k in sorted(_ranked)][:limit]
+
+        # the keyword's inner trigrams (no padding), any substring match contains them all
+        _grams = set(_keyword[i:i + 3] for i in range(len(_keyword) - 2))
+        _counts = dict()
+
+        for _gram in _grams:
+            for _key in self._grams.get(_gram, ()):
+                _counts[_key] = _counts.get(_key, 0) + 1
+
+        _ranked = list()
+        _fuzzy = list()
+        _total = len(_grams)
+
+        for _key, _count in _counts.items():
+            _ratio = _count / _total
+            if _ratio < FUZZY_RATIO:
+                continue
+
+            _rank = self._rank(_keyword, self._names[_key], _ratio)
+            if _rank is None:
+                continue
+
+            if _rank[0] < 3:
+                _ranked.append((_rank, _key))
+            else:
+                _fuzzy.append((_rank, _key))
+
+        if not _ranked and fuzzy:
+            _ranked = _fuzzy
+
+        return [k for r, k in sorted(_ranked)][:limit]
+
+    @staticmethod
+    def _rank(keyword, name, ratio):
+        """
+        Returns a sort key, lower is better, None if the name doesn't match.
+        """
+
+        if name == keyword:
+            return (0, 0.0, len(name), name)
+
+        if name.startswith(keyword):
+            return (1, 0.0, len(name), name)
+
+        _found = name.find(keyword)
+        if _found != -1:
+            return (2, float(_found), len(name), name)
+
+        if ratio is None or ratio < FUZZY_RATIO:
+            return
+
+        return (3, -ratio, len(name), name)
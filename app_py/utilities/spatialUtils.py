@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Grid bucket spatial index, used by the scene for hit tests and overlaps.
+"""
+
+from __future__ import division
+from __future__ import print_function
+
+import math
+
+
+class SpatialGrid(object):
+    """
+    Buckets rects into square cells, queries only look at the cells they touch.
+    Objects are keyed by identity, rects are (x, y, width, height) tuples.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param cell_size: Width and height of a cell, a bit larger than a node works best.
+    :type cell_size: float
+
+    - Example::
+
+        _grid = SpatialGrid(256)
+        _grid.insert(node_obj, (0, 0, 160, 80))
+        _grid.query((100, 50, 10, 10))
+        # [node_obj]
+    """
+
+    def __str__(self):
+        return __name__
+
+    def __init__(self, cell_size=256):
+        self.cell_size = float(cell_size)
+        self._cells = dict()
+        self._items = dict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, obj):
+        return id(obj) in self._items
+
+    def _cellRange(self, rect):
+        _x, _y, _width, _height = rect
+        _size = self.cell_size
+
+        return (int(math.floor(_x / _size)),
+                int(math.floor(_y / _size)),
+                int(math.floor((_x + _width) / _size)),
+                int(math.floor((_y + _height) / _size)))
+
+    def insert(self, obj, rect):
+        """
+        Adds an object, or moves it if it's already in the grid.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param obj: Any object.
+        :type obj: object
+
+        :param rect: (x, y, width, height) of the object.
+        :type rect: tuple
+        """
+
+        _key = id(obj)
+        _range = self._cellRange(rect)
+        _old = self._items.get(_key)
+
+        # still in the same cells, only the rect changes
+        if _old is not None and _old[2] == _range:
+            self._items[_key] = (obj, tuple(rect), _range)
+            return
+
+        if _old is not None:
+            self.remove(obj)
+
+        _col_a, _row_a, _col_b, _row_b = _range
+        for _col in range(_col_a, _col_b + 1):
+            for _row in range(_row_a, _row_b + 1):
+                self._cells.setdefault((_col, _row), dict())[_key] = obj
+
+        self._items[_key] = (obj, tuple(rect), _range)
+
+    def remove(self, obj):
+        """
+        Removes an object, does nothing if it's not in the grid.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param obj: Any object.
+        :type obj: object
+        """
+
+        _key = id(obj)
+        _old = self._items.pop(_key, None)
+        if _old is None:
+            return
+
+        _col_a, _row_a, _col_b, _row_b = _old[2]
+        for _col in range(_col_a, _col_b + 1):
+            for _row in range(_row_a, _row_b + 1):
+                _cell = self._cells.get((_col, _row))
+                if _cell is None:
+                    continue
+
+                _cell.pop(_key, None)
+                if not _cell:
+                    del self._cells[(_col, _row)]
+
+    def query(self, rect):
+        """
+        Returns the objects whose rects touch rect.
+
+        **parameters**, **types**, **return** and **return types**
+
+        :param rect: (x, y, width, height) to look in.
+        :type rect: tuple
+
+        :return: Objects, each one listed once.
+        :rtype: list
+        """
+
+        _x, _y, _width, _height = rect
+        _col_a, _row_a, _col_b, _row_b = self._cellRange(rect)
+        _found = list()
+        _seen = set()
+
+        for _col in range(_col_a, _col_b + 1):
+            for _row in range(_row_a, _row_b + 1):
+                for _key in self._cells.get((_col, _row), ()):
+                    if _key in _seen:
+                        continue
+
+                    _seen.add(_key)
+                    _obj, (_ox, _oy, _owidth, _oheight), _range = self._items[_key]
+
+                    if _ox <= _x + _width and _x <= _ox + _owidth and \
+                            _oy <= _y + _height and _y <= _oy + _oheight:
+                        _found.append(_obj)
+
+        return _found
+
+    def queryPoint(self, x, y):
+        """
+        Returns the objects whose rects contain the point.
+
+        :return: Objects, each one listed once.
+        :rtype: list
+        """
+
+        return self.query((x, y, 0, 0))
+
+    def getRect(self, obj):
+        """
+        Returns the rect an object was inserted with, None if it's not in the grid.
+
+        :return: (x, y, width, height)
+        :rtype: tuple
+        """
+
+        _item = self._items.get(id(obj))
+        return _item[1] if _item else None
+
+    def clear(self):
+        self._cells = dict()
+        self._items = dict()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Measures save/load time and size of graph and score files, JSON against binary (binUtils).
+No config or Qt needed, the data is generated.
+
+- Example::
+
+    python benchmarks/formatBench.py --nodes 20000 --repeat 5
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import uuid
+import json
+import shutil
+import argparse
+import tempfile
+
+from timeit import default_timer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app_py", "utilities"))
+
+import binUtils
+import graphUtils
+
+
+def makeGraph(node_count, depth):
+    """
+    Returns a v1 graph of node_count nodes, made of branches depth nodes deep.
+    """
+
+    _start = {"name": "Start", "class": "widgets.startNode", "icon": None, "description": "Starter Spawn",
+              "command": None, "x": 0.0, "y": 0.0, "uuid": str(uuid.uuid1()), "out_nodes": list(), "in_node": None}
+
+    _parent = _start
+    for _index in range(node_count):
+        if _index % depth == 0:
+            _parent = _start
+
+        _node = {"name": "node{:06d}".format(_index),
+                 "class": "widgets.itemNode",
+                 "icon": "C:/repo/nagare/modules/py/generic/icons/_default.png",
+                 "description": "Checks the asset for something, returns the datablock.",
+                 "command": "generic.checks.check{:02d}".format(_index % 50),
+                 "x": 180.0 * (_index % depth),
+                 "y": 120.0 * (_index // depth),
+                 "uuid": str(uuid.uuid1()),
+                 "out_nodes": list(),
+                 "in_node": {"name": _parent["name"], "uuid": _parent["uuid"]}}
+
+        _parent["out_nodes"].append(_node)
+        _parent = _node
+
+    return {"nodes": _start, "groups": list()}
+
+
+def makeScore(graph_data):
+    """
+    Returns a score like the one the runners write, one entry per node.
+    """
+
+    _score = list()
+    for _node in graphUtils.toFlat(graph_data)["nodes"][1:]:
+        _score.append({"name": _node["name"],
+                       "uuid": _node["uuid"],
+                       "error": False,
+                       "skip": False,
+                       "dirty": False,
+                       "messages": ["{}'s report:".format(_node["name"]), "Success"],
+                       "errors": list()})
+
+    return _score
+
+
+def timeIt(function, repeat):
+    _times = list()
+    for _ in range(repeat):
+        _start = default_timer()
+        function()
+        _times.append(default_timer() - _start)
+
+    return min(_times)
+
+
+def bench(name, data, file_path, write, read, repeat):
+    _save = timeIt(lambda: write(file_path, data), repeat)
+    _load = timeIt(lambda: read(file_path), repeat)
+    return name, os.path.getsize(file_path), _save, _load
+
+
+def main(argv=None):
+    _parser = argparse.ArgumentParser(description="Graph and score file format benchmark.")
+    _parser.add_argument("--nodes", type=int, default=5000)
+    _parser.add_argument("--depth", type=int, default=50, help="Nodes per branch.")
+    _parser.add_argument("--repeat", type=int, default=3, help="Best of this many runs.")
+    _args = _parser.parse_args(argv)
+
+    _graph = makeGraph(_args.nodes, _args.depth)
+    _flat = graphUtils.toFlat(_graph)
+    _score = makeScore(_graph)
+    _tmp = tempfile.mkdtemp(prefix="nagare_bench_")
+
+    def _writeJson(file_path, data):
+        with open(file_path, "w") as _file:
+            json.dump(data, _file, indent=4)
+
+    def _readJson(file_path):
+        with open(file_path) as _file:
+            return json.load(_file)
+
+    _rows = list()
+    try:
+        _rows.append(bench("graph v1 json", _graph, os.path.join(_tmp, "v1.json"), _writeJson, _readJson, _args.repeat))
+        _rows.append(bench("graph v2 json", _flat, os.path.join(_tmp, "v2.json"), binUtils.writeData, binUtils.readData, _args.repeat))
+        _rows.append(bench("graph v2 ngb", _flat, os.path.join(_tmp, "v2.ngb"), binUtils.writeData, binUtils.readData, _args.repeat))
+        _rows.append(bench("score json", _score, os.path.join(_tmp, "score.json"), _writeJson, _readJson, _args.repeat))
+        _rows.append(bench("score ngb", _score, os.path.join(_tmp, "score.ngb"), binUtils.writeData, binUtils.readData, _args.repeat))
+    finally:
+        shutil.rmtree(_tmp)
+
+    print("{} nodes, {} per branch, best of {}".format(_args.nodes, _args.depth, _args.repeat))
+    print("{:<16}{:>12}{:>12}{:>12}".format("format", "size (KB)", "save (ms)", "load (ms)"))
+    for _name, _size, _save, _load in _rows:
+        print("{:<16}{:>12.1f}{:>12.1f}{:>12.1f}".format(_name, _size / 1024.0, _save * 1000, _load * 1000))
+
+
+if __name__ == "__main__":
+    main()
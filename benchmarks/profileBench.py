@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+
+Measures what the per node profiling of Main costs (profileUtils), for each profile.
+A node is simulated by a small amount of work between snapshot() and measure().
+No config or Qt needed.
+
+- Example::
+
+    python benchmarks/profileBench.py --nodes 20000 --repeat 5
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import argparse
+
+from timeit import default_timer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app_py", "utilities"))
+
+import profileUtils
+
+
+def fakeModule(data_block):
+    """
+    Stands in for a module, allocates and returns the datablock.
+    """
+
+    data_block["seen"] = [str(_i) for _i in range(20)]
+    return data_block
+
+
+def runNodes(profile, node_count):
+    _block = dict()
+    _measured = 0.0
+    for _ in range(node_count):
+        _start = profileUtils.snapshot(profile)
+        fakeModule(_block)
+        _metrics = profileUtils.measure(_start)
+        _measured += _metrics.get("overhead", 0.0)
+
+    return _measured
+
+
+def main(argv=None):
+    _parser = argparse.ArgumentParser(description="Per node profiling overhead benchmark.")
+    _parser.add_argument("--nodes", type=int, default=10000)
+    _parser.add_argument("--repeat", type=int, default=3, help="Best of this many runs.")
+    _args = _parser.parse_args(argv)
+
+    _rows = list()
+    for _profile in profileUtils.PROFILES:
+        _best = None
+        _reported = None
+        for _ in range(_args.repeat):
+            _start = default_timer()
+            _overhead = runNodes(_profile, _args.nodes)
+            _elapsed = default_timer() - _start
+            if _best is None or _elapsed < _best:
+                _best = _elapsed
+                _reported = _overhead
+
+        _rows.append((_profile, _best, _reported))
+
+    _base = _rows[0][1]
+    print("{} nodes, best of {}".format(_args.nodes, _args.repeat))
+    print("{:<10}{:>12}{:>16}{:>18}".format("profile", "total (ms)", "per node (us)", "reported (us)"))
+    for _profile, _elapsed, _overhead in _rows:
+        print("{:<10}{:>12.1f}{:>16.2f}{:>18.2f}".format(_profile,
+                                                         _elapsed * 1000,
+                                                         (_elapsed - _base) * 1e6 / _args.nodes,
+                                                         _overhead * 1e6 / _args.nodes))
+
+
+if __name__ == "__main__":
+    main()
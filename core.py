@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Headless entry point, imports only what is needed to run graphs (no Qt).
+
+- Example::
+
+    from nagare import core
+    _spawn = core.run("C:/graphs/check.json", {"asset": "C:/assets/chr_a.fbx"})
+    print(_spawn.getScore())
+"""
+
+from __future__ import print_function
+
+import os
+
+from app_py.main import Main
+from app_py.nodeDummy import NodeDummy
+from app_py.resultObj import ResultObj
+from app_py.dataBlock import DataBlock
+from app_py.configs import config_obj
+from app_py.configs import getOption
+from app_py.configs import test_block
+
+
+def setLanguage(lang_str=None):
+    """
+    Use this to change the language to operate with beside Python.
+    Also runs ``setup()`` once again to affect changes.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param lang_str: the language to be used. Valid: py, jsx, lua.
+    :type lang_str: str
+
+    # >>> nagare.setLanguage("jsx")
+
+    """
+
+    if lang_str is None:
+        lang_str = "py"
+
+    config_obj.set("DETAILS", "language", lang_str)
+
+    modules_path = os.path.join(config_obj.get("PATHS", "root"),
+                                "modules",
+                                config_obj.get("DETAILS", "language"))
+    config_obj.set("PATHS", "mod_paths", [os.path.abspath(modules_path)])
+
+
+def run(json_path=None, data_block=None, strict=None, propagate=None, executor=None, workers=None, profile=None,
+        subscribers=None, track_writes=None):
+    """
+    Runs a graph without the UI.
+    Settings that are not given are read from the config.
+
+    **parameters**, **types**, **return** and **return types**
+
+    :param json_path: Full file path of JSON file graph, defaults to PATHS "default_json".
+    :type json_path: str
+
+    :param data_block: A dict containing serializable information.
+    :type data_block: dict
+
+    :param strict: Stop on the first error.
+    :type strict: bool
+
+    :param propagate: Share one datablock across the whole graph.
+    :type propagate: bool
+
+    :param executor: "serial", "thread" or "process", see Main.
+    :type executor: str
+
+    :param workers: Number of workers for "thread" or "process".
+    :type workers: int
+
+    :param profile: What is measured per node, "off", "time" or "memory", see Main.
+    :type profile: str
+
+    :param subscribers: Run event subscribers, see Main.subscribe.
+    :type subscribers: list
+
+    :param track_writes: Add the datablock keys each node wrote to its metrics, for traces.
+    :type track_writes: bool
+
+    :return: The Main instance that ran, nodes_all holds the results.
+    :rtype: Main
+    """
+
+    if json_path is None:
+        json_path = config_obj.get("PATHS", "default_json")
+
+    if data_block is None:
+        data_block = test_block
+
+    if strict is None:
+        strict = int(config_obj.get("DETAILS", "strict"))
+
+    if propagate is None:
+        propagate = int(config_obj.get("DETAILS", "propagate"))
+
+    _spawn = Main(executor, workers)
+    _spawn.strict = strict
+    _spawn.propagate = propagate
+    _spawn.incremental = int(getOption("DETAILS", "incremental", "0"))
+
+    if profile is not None:
+        _spawn.profile = profile
+
+    if track_writes is not None:
+        _spawn.track_writes = track_writes
+
+    for _subscriber in subscribers or list():
+        _spawn.subscribe(_subscriber)
+
+    _spawn.runJson(json_path, data_block.copy())
+    return _spawn
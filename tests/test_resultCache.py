@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2021 richardHaw
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Checks that results replayed by the ResultCache give nodes the same datablock as a real run.
+
+- Example::
+
+    python -m unittest discover tests
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_TEMP = tempfile.mkdtemp(prefix="nagare_tests_")
+
+if not os.getenv("NAGARE_CONFIGS"):
+    os.environ["NAGARE_CONFIGS"] = os.path.join(_TEMP, "config.ini")
+    with open(os.environ["NAGARE_CONFIGS"], "w") as _config_file:
+        _config_file.write("[PATHS]\nmod_paths = []\nlog_path = {}\n\n[DETAILS]\n".format(_TEMP))
+
+sys.path.insert(0, os.path.dirname(_ROOT))
+sys.path.insert(0, os.path.join(_ROOT, "app_py"))
+
+from resultCache import ResultCache
+from dataBlock import DataBlock
+
+
+def tearDownModule():
+    shutil.rmtree(_TEMP, ignore_errors=True)
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResultCache(os.path.join(_TEMP, "results.db"), max_entries=100)
+        self.cache.clear()
+        self.params = {"command": "custom.processWhat", "class": "widgets.itemNode"}
+
+    def testReplayedBlockEqualsLive(self):
+        _live = {"what": 1, "who": [1.5, u"two", None], "nested": {"ok": True}}
+        _key = ResultCache.fingerprint(self.params, {"what": 1}, "hash")
+
+        self.assertTrue(self.cache.put(_key, "success", DataBlock(_live)))
+        _replayed = self.cache.get(_key)["block"]
+
+        self.assertEqual(_replayed, _live)
+        self.assertEqual(type(_replayed["who"]), list)
+        self.assertEqual(type(_replayed["nested"]), dict)
+
+    def testChangedBlocksAreNotStored(self):
+        _key = ResultCache.fingerprint(self.params, {"what": 1}, "hash")
+
+        self.assertFalse(self.cache.put(_key, "success", {"pair": (1, 2)}))
+        self.assertFalse(self.cache.put(_key, "success", {"ids": {5: u"x"}}))
+        self.assertFalse(self.cache.put(_key, "success", {"ids": {5: u"x", u"6": u"y"}}))
+        self.assertIsNone(self.cache.get(_key))
+
+    def testFingerprintKeepsTypes(self):
+        _list = ResultCache.fingerprint(self.params, {"pair": [1, 2]}, "hash")
+
+        self.assertIsNotNone(_list)
+        self.assertIsNone(ResultCache.fingerprint(self.params, {"pair": (1, 2)}, "hash"))
+        self.assertIsNone(ResultCache.fingerprint(self.params, {5: u"x"}, "hash"))
+        self.assertIsNone(ResultCache.fingerprint(self.params, {5: u"x", u"6": u"y"}, "hash"))
+
+
+if __name__ == "__main__":
+    unittest.main()